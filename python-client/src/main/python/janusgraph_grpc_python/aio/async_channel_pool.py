@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import grpc
+
+from connection.channel_pool import ChannelPool
+from connection.rpc_metrics import get_rpc_metrics
+from .async_metrics_interceptor import async_metrics_interceptors
+
+
+async def __track__(pool, entry, continuation, client_call_details, request):
+    pool.__call_started__(entry)
+    try:
+        call = await continuation(client_call_details, request)
+    except BaseException:
+        pool.__call_done__(entry)
+        raise
+
+    call.add_done_callback(lambda _: pool.__call_done__(entry))
+    return call
+
+
+class AsyncUnaryUsageInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+
+    def __init__(self, pool, entry):
+        """grpc.aio counterpart of UsageInterceptor for the unary RPCs
+
+        Args:
+            pool (AsyncChannelPool):
+            entry (PooledChannel):
+        """
+        self.pool = pool
+        self.entry = entry
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await __track__(self.pool, self.entry, continuation, client_call_details, request)
+
+
+class AsyncStreamUsageInterceptor(grpc.aio.UnaryStreamClientInterceptor):
+
+    def __init__(self, pool, entry):
+        """grpc.aio counterpart of UsageInterceptor for the streaming RPCs
+
+        Args:
+            pool (AsyncChannelPool):
+            entry (PooledChannel):
+        """
+        self.pool = pool
+        self.entry = entry
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await __track__(self.pool, self.entry, continuation, client_call_details, request)
+
+
+class AsyncChannelPool(ChannelPool):
+
+    def __init__(self, **kwargs):
+        """ChannelPool handing out grpc.aio channels. Channels are bound to the event loop which
+        created them, so a pool must only be used from a single event loop.
+
+        Args:
+            **kwargs: Same arguments as ChannelPool, interceptors being grpc.aio ones. They default to
+                async_metrics_interceptors().
+        """
+        super().__init__(**kwargs)
+
+    def __default_interceptors__(self):
+        return async_metrics_interceptors(get_rpc_metrics())
+
+    def __usage_interceptors__(self, entry):
+        return [AsyncUnaryUsageInterceptor(self, entry), AsyncStreamUsageInterceptor(self, entry)]
+
+    def __create_channel__(self, target, entry):
+        return grpc.aio.insecure_channel(target, options=self.options,
+                                         interceptors=[*self.interceptors, *self.__usage_interceptors__(entry)])
+
+    def __close_channel__(self, channel):
+        # Evictions happen from synchronous code inside get_channel() or a done callback, so the close is scheduled
+        # on the loop
+        self.STUBS.pop(channel, None)
+        asyncio.ensure_future(channel.close())
+
+    def __close_retired__(self, channel):
+        # Done callbacks run on the event loop, where the close can be scheduled right away
+        self.__close_channel__(channel)
+
+    async def close(self):
+        with self.LOCK:
+            entries = list(self.CHANNELS.values())
+            self.CHANNELS.clear()
+            for entry in entries:
+                entry.retired = True
+
+        for entry in entries:
+            self.STUBS.pop(entry.channel, None)
+            await entry.channel.close()
+
+
+ASYNC_CHANNEL_POOL = None
+_ASYNC_CHANNEL_POOL_LOCK = threading.Lock()
+
+
+def get_async_channel_pool():
+    """Returns the process wide AsyncChannelPool, creating it with defaults on first call.
+
+    Returns:
+        AsyncChannelPool
+    """
+    global ASYNC_CHANNEL_POOL
+
+    if ASYNC_CHANNEL_POOL is None:
+        with _ASYNC_CHANNEL_POOL_LOCK:
+            if ASYNC_CHANNEL_POOL is None:
+                ASYNC_CHANNEL_POOL = AsyncChannelPool()
+    return ASYNC_CHANNEL_POOL
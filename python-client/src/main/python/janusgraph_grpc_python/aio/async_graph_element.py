@@ -0,0 +1,75 @@
+from structure.element.vertex import Vertex
+from structure.element.edge import Edge
+from structure.element.context_action import Contexts
+from graph_operation.graph_indexer import GraphIndexer
+from .async_graph_index import AsyncGraphIndexer
+
+
+async def collect(response):
+    """Awaits a unary grpc.aio call or drains a streaming one.
+
+    Args:
+        response (Union[grpc.aio.UnaryUnaryCall, grpc.aio.UnaryStreamCall]):
+
+    Returns:
+        The response message for unary RPCs, a list of messages for streaming RPCs
+    """
+    if hasattr(response, "__aiter__"):
+        return [message async for message in response]
+    return await response
+
+
+class AsyncGraphElement(object):
+    """Mixin for the async processors. The requests are built by the synchronous processor it is mixed
+    into, but the service is a grpc.aio stub so operate() returns an awaitable for unary RPCs (Ensure*,
+    GetContextByGraphName) and an async iterator for the streaming ones."""
+
+    def set_optional_operator(self, addtnl_operator):
+        if isinstance(addtnl_operator, GraphIndexer) and not isinstance(addtnl_operator, AsyncGraphIndexer):
+            addtnl_operator = AsyncGraphIndexer.from_indexer(addtnl_operator)
+
+        super().set_optional_operator(addtnl_operator)
+
+    def __cached_lookup__(self, rpc, request, graph_name, name):
+        """Async iterator counterpart of GraphElement.__cached_lookup__"""
+        if self.cache is None:
+            return rpc(request)
+
+        return self.__async_cached_lookup__(rpc, request, graph_name, name)
+
+    async def __async_cached_lookup__(self, rpc, request, graph_name, name):
+        messages = self.cache.get(graph_name, self.element, name)
+        if messages is None:
+            messages = [message async for message in rpc(request)]
+            self.cache.put(graph_name, self.element, name, messages)
+
+        for message in messages:
+            yield message
+
+    def __write_through__(self, response, graph_name):
+        """Awaitable counterpart of GraphElement.__write_through__, the cache is written once the call completes"""
+        if self.cache is None:
+            return response
+
+        return self.__async_write_through__(response, graph_name)
+
+    async def __async_write_through__(self, response, graph_name):
+        return super().__write_through__(await response, graph_name)
+
+    async def collect(self):
+        return await collect(self.operate())
+
+
+class AsyncVertex(AsyncGraphElement, Vertex):
+    def __init__(self, operation, label, optional_metadata=None):
+        super().__init__(operation, label, optional_metadata)
+
+
+class AsyncEdge(AsyncGraphElement, Edge):
+    def __init__(self, operation, label, optional_metadata=None):
+        super().__init__(operation, label, optional_metadata)
+
+
+class AsyncContexts(AsyncGraphElement, Contexts):
+    def __init__(self, operation, label, optional_metadata=None):
+        super().__init__(operation, label, optional_metadata)
@@ -0,0 +1,47 @@
+from graph_operation.graph_indexer import GraphIndexer
+from structure.index.composite_index import CompositeIndex
+from structure.index.mixed_index import MixedIndex
+
+
+class AsyncGraphIndexer(GraphIndexer):
+    """GraphIndexer whose get_indexer() builds AsyncCompositeIndex/AsyncMixedIndex. Request building is
+    inherited unchanged, only the stub set through set_service() is a grpc.aio one."""
+
+    def __index_classes__(self):
+        return AsyncCompositeIndex, AsyncMixedIndex
+
+    @classmethod
+    def from_indexer(cls, indexer):
+        """Copies the parsed parameters and the element/context/service of a synchronous GraphIndexer
+
+        Args:
+            indexer (GraphIndexer):
+
+        Returns:
+            AsyncGraphIndexer
+        """
+        async_indexer = cls(**{k: getattr(indexer, k) for k in cls.supported_parameters})
+
+        async_indexer.ELEMENT = indexer.ELEMENT
+        async_indexer.element_to_index = indexer.element_to_index
+        async_indexer.CONTEXT = indexer.CONTEXT
+        async_indexer.SERVICE = indexer.SERVICE
+        return async_indexer
+
+
+class AsyncCompositeIndex(CompositeIndex):
+    """put_index() returns an awaitable, get_indices_by_label() and get_all_indices() return async
+    iterators over the streamed CompositeVertexIndex/CompositeEdgeIndex messages."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AsyncMixedIndex(MixedIndex):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    async def __all_indices__(self, labels, get_indices):
+        async for label in labels:
+            async for index in get_indices(self.__indices_by_label_request__(self.__label_message__(label.name))):
+                yield index
@@ -0,0 +1,25 @@
+from graph_operation.command_action.graph_operation import GraphOperation
+from structure.element.vertex import Vertex
+from structure.element.edge import Edge
+from structure.element.context_action import Contexts
+from .async_graph_element import AsyncVertex, AsyncEdge, AsyncContexts
+
+
+class AsyncGraphOperation(GraphOperation):
+    ASYNC_PROCESSORS = {Vertex: AsyncVertex, Edge: AsyncEdge, Contexts: AsyncContexts}
+
+    def __init__(self, graph_operation_on, element_name, command_metadata):
+        """Same as GraphOperation but get_processor() returns AsyncVertex/AsyncEdge/AsyncContexts.
+        set_channel() must be given a grpc.aio channel, e.g. from get_async_channel_pool().
+
+        Args:
+            graph_operation_on(GraphElementType):
+            element_name (str)
+            command_metadata (GraphOperationMetadata):
+        """
+        super().__init__(graph_operation_on, element_name, command_metadata)
+
+        self.graph_element = self.ASYNC_PROCESSORS[self.graph_element]
+
+    def __repr__(self):
+        return 'AsyncCommand(%s, %s)' % (str(self.graph_element), self.element_name)
@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+import grpc
+
+from connection.metrics_interceptor import __method_name__
+
+
+class AsyncUnaryMetricsInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+
+    def __init__(self, metrics):
+        """grpc.aio counterpart of MetricsInterceptor for the unary RPCs. The status code of an aio call is only
+        available by awaiting it, so the call is awaited here.
+
+        Args:
+            metrics (RpcMetrics):
+        """
+        self.metrics = metrics
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = __method_name__(client_call_details)
+        start = time.perf_counter()
+
+        call = await continuation(client_call_details, request)
+        try:
+            response = await call
+        except grpc.aio.AioRpcError as e:
+            self.metrics.record_call(method, e.code(), time.perf_counter() - start, request.ByteSize())
+            raise
+
+        self.metrics.record_call(method, grpc.StatusCode.OK, time.perf_counter() - start, request.ByteSize(),
+                                 response.ByteSize())
+        return response
+
+
+class AsyncStreamMetricsInterceptor(grpc.aio.UnaryStreamClientInterceptor):
+
+    def __init__(self, metrics):
+        """grpc.aio counterpart of MetricsInterceptor for the streaming RPCs, recorded once the stream is drained,
+        failed or closed.
+
+        Args:
+            metrics (RpcMetrics):
+        """
+        self.metrics = metrics
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        method = __method_name__(client_call_details)
+        start = time.perf_counter()
+
+        call = await continuation(client_call_details, request)
+        return self.__metered__(call, method, start, request.ByteSize())
+
+    async def __metered__(self, call, method, start, request_bytes):
+        first_message_seconds = None
+        messages = 0
+        response_bytes = 0
+        code = grpc.StatusCode.OK
+
+        try:
+            async for message in call:
+                if first_message_seconds is None:
+                    first_message_seconds = time.perf_counter() - start
+                messages += 1
+                response_bytes += message.ByteSize()
+                yield message
+        except grpc.aio.AioRpcError as e:
+            code = e.code()
+            raise
+        except (GeneratorExit, asyncio.CancelledError):
+            # Closed before being drained
+            code = grpc.StatusCode.CANCELLED
+            raise
+        finally:
+            self.metrics.record_call(method, code, time.perf_counter() - start, request_bytes)
+            self.metrics.record_stream(method, first_message_seconds, messages, response_bytes)
+
+
+def async_metrics_interceptors(metrics):
+    """grpc.aio channels file an interceptor under the first RPC kind it implements, hence one per kind.
+
+    Args:
+        metrics (RpcMetrics):
+
+    Returns:
+        list: To pass to grpc.aio.insecure_channel(interceptors=...)
+    """
+    return [AsyncUnaryMetricsInterceptor(metrics), AsyncStreamMetricsInterceptor(metrics)]
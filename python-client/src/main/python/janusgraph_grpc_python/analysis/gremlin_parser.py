@@ -0,0 +1,177 @@
+import re
+from collections import namedtuple
+
+Predicate = namedtuple("Predicate", ["property", "op", "values"])
+GremlinLookup = namedtuple("GremlinLookup", ["element", "labels", "predicates"])
+
+TOKEN = re.compile(r"""\s*(?:(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+                          |(?P<number>-?\d+(?:\.\d+)?(?:[eE]-?\d+)?)[lLdDfF]?
+                          |(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+                          |(?P<punct>[.(),\[\]]))""", re.VERBOSE)
+
+KEYWORDS = {"true": True, "false": False, "null": None}
+
+
+class Call(namedtuple("Call", ["name", "args"])):
+    """Nested call in the arguments of a step, e.g. P.gt(30) parsed as Call("gt", (30,))"""
+    __slots__ = ()
+
+
+class GremlinParser:
+
+    def __init__(self, traversal):
+        """Parses the steps of a Gremlin traversal string like g.V().has('person', 'name', 'marko').out(). Only
+        literals, nested predicate calls (P.gt(30), within('a', 'b'), T.label...) and lists are understood as
+        arguments, which is what has() filters are written with.
+
+        Args:
+            traversal (str):
+        """
+        self.traversal = traversal
+        self.tokens = self.__tokenize__(traversal)
+        self.position = 0
+
+    def __tokenize__(self, traversal):
+        tokens = []
+        position = 0
+        traversal = traversal.rstrip()
+
+        while position < len(traversal):
+            match = TOKEN.match(traversal, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"Unexpected {traversal[position:position + 10]!r} at {position} of {traversal!r}")
+
+            kind = match.lastgroup
+            text = match.group(kind)
+            if kind == "string":
+                tokens.append(("value", re.sub(r"\\(.)", r"\1", text[1:-1])))
+            elif kind == "number":
+                tokens.append(("value", float(text) if "." in text or "e" in text.lower() else int(text)))
+            elif kind == "name" and text in KEYWORDS:
+                tokens.append(("value", KEYWORDS[text]))
+            else:
+                tokens.append((kind, text))
+            position = match.end()
+
+        return tokens
+
+    def parse(self):
+        """
+        Returns:
+            list[tuple]: (step name, args) of every step, starting with the traversal source, e.g.
+            [("g", None), ("V", ()), ("has", ("name", "marko"))]
+        """
+        steps = [(self.__expect__("name"), None)]
+
+        while self.position < len(self.tokens):
+            self.__expect__("punct", ".")
+            name = self.__expect__("name")
+            steps.append((name, self.__arguments__() if self.__peek__() == ("punct", "(") else None))
+
+        return steps
+
+    def __peek__(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def __expect__(self, kind, text=None):
+        token_kind, token_text = self.__peek__()
+        if token_kind != kind or (text is not None and token_text != text):
+            raise ValueError(f"Expected {text or kind} but got {token_text!r} in {self.traversal!r}")
+        self.position += 1
+        return token_text
+
+    def __arguments__(self, closing=")"):
+        self.position += 1
+        args = []
+
+        while self.__peek__() != ("punct", closing):
+            if args:
+                self.__expect__("punct", ",")
+            args.append(self.__argument__())
+
+        self.position += 1
+        return tuple(args)
+
+    def __argument__(self):
+        kind, text = self.__peek__()
+
+        if kind == "value":
+            self.position += 1
+            return text
+        if (kind, text) == ("punct", "["):
+            return list(self.__arguments__("]"))
+        if kind == "name":
+            # Qualified names like P.gt, TextP.containing, T.label or org.janusgraph.core.attribute.Text.textContains
+            name = self.__expect__("name")
+            while self.__peek__() == ("punct", "."):
+                self.position += 1
+                name = self.__expect__("name")
+
+            if self.__peek__() == ("punct", "("):
+                return Call(name, self.__arguments__())
+            return Call(name, None)
+
+        raise ValueError(f"Unexpected {'end' if kind is None else repr(text)} in {self.traversal!r}")
+
+
+def parse_lookup(traversal):
+    """Extracts the label and property filters a graph index could serve: the hasLabel()/has()/hasNot() steps right
+    after V() or E(), which JanusGraph folds into its graph step. Filters after the first other step are not
+    index lookups and ignored.
+
+    Args:
+        traversal (str): e.g. g.V().hasLabel('person').has('age', gt(30)).out('knows')
+
+    Returns:
+        GremlinLookup: element is VertexLabel or EdgeLabel, labels a tuple of label names (empty for any label) and
+        predicates a tuple of Predicate(property, op, values)
+    """
+    steps = GremlinParser(traversal).parse()
+
+    start = next((i for i, (name, _) in enumerate(steps) if name in ("V", "E")), None)
+    if start is None:
+        raise ValueError(f"Expected a traversal starting with V() or E(), got {traversal!r}")
+    if steps[start][1]:
+        raise ValueError(f"{steps[start][0]}({', '.join(map(repr, steps[start][1]))}) looks elements up by id, "
+                         f"not through a graph index")
+
+    labels = []
+    predicates = []
+
+    for name, args in steps[start + 1:]:
+        args = args or ()
+
+        if name == "hasLabel":
+            labels.extend(args)
+        elif name == "hasNot" and len(args) == 1:
+            predicates.append(Predicate(args[0], "notExists", ()))
+        elif name == "has" and len(args) == 1:
+            predicates.append(Predicate(args[0], "exists", ()))
+        elif name == "has" and len(args) in (2, 3):
+            if len(args) == 3:
+                labels.append(args[0])
+                args = args[1:]
+
+            key, value = args
+            if isinstance(key, Call) and key.name == "label":
+                if isinstance(value, Call) and value.name in ("eq", "within"):
+                    labels.extend(value.args)
+                else:
+                    labels.append(value)
+            else:
+                predicates.append(__predicate__(key, value))
+        else:
+            break
+
+    return GremlinLookup("VertexLabel" if steps[start][0] == "V" else "EdgeLabel", tuple(labels), tuple(predicates))
+
+
+def __predicate__(key, value):
+    if not isinstance(value, Call):
+        return Predicate(key, "eq", (value,))
+
+    values = value.args or ()
+    if len(values) == 1 and isinstance(values[0], list):
+        values = values[0]
+
+    return Predicate(key, value.name, tuple(values))
@@ -0,0 +1,202 @@
+import heapq
+import itertools
+import re
+from collections import namedtuple
+
+from analysis.gremlin_parser import Predicate, parse_lookup
+from analysis.index_coverage import IndexCoverage, EQUALITY_OPS, UNINDEXABLE_OPS
+
+DEFAULT_CAPACITY = 1000
+TRAVERSAL_START = re.compile(r"\bg\.[VE]\(")
+
+Recommendation = namedtuple("Recommendation", ["weight", "element", "label", "index_type", "properties",
+                                               "index_name", "patterns"])
+
+
+class SpaceSaving:
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """Space-Saving heavy hitters: approximate counts of the most frequent keys of a stream in O(capacity)
+        memory. A key more frequent than 1/capacity of the stream is guaranteed to be kept, and its count is
+        overestimated by at most the count of the key it replaced.
+
+        Args:
+            capacity (int): Number of keys counted
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at-least 1. Got {capacity}")
+
+        self.capacity = capacity
+        self.total = 0
+        # key -> [count, error]
+        self.COUNTERS = {}
+        # (count, sequence, key) with stale entries skipped when popped
+        self.HEAP = []
+        # Orders equal counts, keys themselves may not be comparable
+        self.SEQUENCE = itertools.count()
+
+    def __len__(self):
+        return len(self.COUNTERS)
+
+    def add(self, key, weight=1):
+        self.total += weight
+        counter = self.COUNTERS.get(key)
+
+        if counter is None:
+            if len(self.COUNTERS) < self.capacity:
+                counter = self.COUNTERS[key] = [0, 0]
+            else:
+                minimum, evicted = self.__pop_minimum__()
+                del self.COUNTERS[evicted]
+                counter = self.COUNTERS[key] = [minimum, minimum]
+
+        counter[0] += weight
+        heapq.heappush(self.HEAP, (counter[0], next(self.SEQUENCE), key))
+
+        # Every increment leaves a stale entry behind, drop them before they outgrow the counters
+        if len(self.HEAP) > 4 * self.capacity:
+            self.HEAP = [(count, next(self.SEQUENCE), key) for key, (count, _) in self.COUNTERS.items()]
+            heapq.heapify(self.HEAP)
+
+    def get_top(self, n=None):
+        """
+        Returns:
+            list[tuple]: (key, count, error) of the n most frequent keys, count - error being a lower bound
+        """
+        top = sorted(self.COUNTERS.items(), key=lambda item: -item[1][0])[:n]
+        return [(key, count, error) for key, (count, error) in top]
+
+    def __pop_minimum__(self):
+        while True:
+            count, _, key = heapq.heappop(self.HEAP)
+            counter = self.COUNTERS.get(key)
+            if counter is not None and counter[0] == count:
+                return count, key
+
+
+class IndexAdvisor:
+
+    def __init__(self, lookup=None, capacity=DEFAULT_CAPACITY, index_labels=None):
+        """Recommends composite and mixed indices for the most frequent lookup patterns of a Gremlin query log.
+        A pattern is the element, label and (property, predicate kind) set of the has() filters of a traversal,
+        without their values. Patterns are counted with SpaceSaving, so memory stays bounded however long the log.
+
+        Args:
+            lookup (SchemaLookup): Current schema, patterns an existing index already serves are not recommended
+                for. None to recommend for every pattern.
+            capacity (int): Number of distinct patterns tracked
+            index_labels (dict): Label constraints of the composite indices, see IndexCoverage. A composite index
+                only serves the patterns of its label.
+        """
+        self.coverage = None if lookup is None else IndexCoverage(lookup, index_labels)
+        self.patterns = SpaceSaving(capacity)
+        self.lines = 0
+        self.skipped = 0
+
+    def add(self, line):
+        """Counts the lookup pattern of a log line. Lines without a g.V()/g.E() traversal, with one the parser
+        doesn't understand or without has() filter are skipped.
+
+        Args:
+            line (str): Log line, the traversal may be preceded by a timestamp or other log fields
+        """
+        self.lines += 1
+
+        start = TRAVERSAL_START.search(line)
+        try:
+            if start is None:
+                raise ValueError("No traversal")
+            lookup = parse_lookup(line[start.start():].strip())
+        except ValueError:
+            self.skipped += 1
+            return
+
+        if not lookup.predicates:
+            self.skipped += 1
+            return
+
+        predicates = tuple(sorted({(predicate.property, predicate.op) for predicate in lookup.predicates}))
+        for label in lookup.labels or (None,):
+            self.patterns.add((lookup.element, label, predicates))
+
+    def process(self, lines):
+        """
+        Args:
+            lines (Iterable[str]): e.g. an open log file, read lazily
+
+        Returns:
+            IndexAdvisor
+        """
+        for line in lines:
+            self.add(line)
+        return self
+
+    def recommend(self, top=10):
+        """
+        Args:
+            top (int): Maximum number of recommendations
+
+        Returns:
+            list[Recommendation]: By decreasing weight, the number of logged lookups the index would at least serve.
+            The lower bound of the SpaceSaving counts is used so that rare patterns which inherited the count of an
+            evicted one aren't recommended.
+        """
+        recommendations = {}
+
+        for (element, label, predicates), count, error in self.patterns.get_top():
+            count -= error
+            if count <= 0 or self.__is_covered__(element, label, predicates):
+                continue
+
+            definition = self.__definition__(element, label, predicates)
+            if definition is None:
+                continue
+
+            recommendation = recommendations.get(definition)
+            if recommendation is None:
+                index_type, properties = definition[2:]
+                recommendations[definition] = Recommendation(count, element, label, index_type, properties,
+                                                             self.__index_name__(label, index_type, properties),
+                                                             [predicates])
+            else:
+                recommendation.patterns.append(predicates)
+                recommendations[definition] = recommendation._replace(weight=recommendation.weight + count)
+
+        return sorted(recommendations.values(), key=lambda recommendation: -recommendation.weight)[:top]
+
+    def __is_covered__(self, element, label, predicates):
+        if self.coverage is None:
+            return False
+
+        result = self.coverage.check(label, [Predicate(prop, op, ()) for prop, op in predicates], element)
+        return not result.is_full_scan()
+
+    def __definition__(self, element, label, predicates):
+        equality = sorted({prop for prop, op in predicates if op in EQUALITY_OPS})
+        indexable = sorted({prop for prop, op in predicates if op not in UNINDEXABLE_OPS})
+
+        if label is not None and len(indexable) > len(equality):
+            # Ranges, text or geo predicates: only a mixed index answers them. This client ensures mixed
+            # indices per label, unlabelled lookups fall back to a composite index on their equalities
+            return element, label, "MixedIndex", tuple(indexable)
+        if equality:
+            return element, label, "CompositeIndex", tuple(equality)
+        return None
+
+    def __index_name__(self, label, index_type, properties):
+        name = "by" + "".join(part[:1].upper() + part[1:] for part in ((label,) if label else ()) + properties)
+        return name + "Mixed" if index_type == "MixedIndex" else name
+
+
+def to_command(recommendation):
+    """
+    Args:
+        recommendation (Recommendation):
+
+    Returns:
+        str: Batch file line ensuring the index, e.g.
+        PUT VertexLabel person INDEX index_type=CompositeIndex index_on=name index_name=byPersonName
+    """
+    return (f"PUT {recommendation.element} {recommendation.label or 'ALL'} INDEX "
+            f"index_type={recommendation.index_type} index_on={','.join(recommendation.properties)} "
+            f"index_name={recommendation.index_name}")
@@ -0,0 +1,163 @@
+from collections import namedtuple
+
+from analysis.gremlin_parser import parse_lookup
+from schema.schema_info import CompositeIndexInfo
+
+# Composite indices are key-value lookups: every one of their properties must be compared for equality
+EQUALITY_OPS = {"eq", "within"}
+# Mixed indices can't answer these at all, text and geo predicates only on String/GeoShape properties
+UNINDEXABLE_OPS = {"without", "exists", "notExists"}
+TEXT_OPS = {"textContains", "textContainsPrefix", "textContainsRegex", "textContainsFuzzy", "textContainsPhrase",
+            "textPrefix", "textRegex", "textFuzzy", "containing", "notContaining", "startingWith",
+            "notStartingWith", "endingWith", "notEndingWith", "regex", "notRegex"}
+GEO_OPS = {"geoWithin", "geoIntersect", "geoDisjoint", "geoContains"}
+
+
+class CoverageResult(namedtuple("CoverageResult", ["label", "index", "served", "residual", "reason"])):
+    """Index which would serve the lookup on a label (None for a full scan), the predicates it answers and the ones
+    left to filter in memory"""
+    __slots__ = ()
+
+    def is_full_scan(self):
+        return self.index is None
+
+    def __str__(self):
+        label = self.label or "<any label>"
+        if self.index is None:
+            return f"{label}: FULL SCAN, {self.reason}"
+
+        residual = f", filtering {', '.join(p.property for p in self.residual)} in memory" if self.residual else ""
+        return (f"{label}: {type(self.index).__name__[:-len('Info')]} {self.index.name} serves "
+                f"{', '.join(p.property for p in self.served)}{residual}")
+
+
+class IndexCoverage:
+
+    def __init__(self, lookup, index_labels=None):
+        """Tells which graph index JanusGraph could use for a label and property lookup, from the inverted
+        property -> index map of a SchemaLookup, without asking the server.
+
+        The server builds every index with indexOnly(label): JanusGraph only uses it for lookups restricted to that
+        label. Mixed indices are listed per label, composite indices need index_labels to tell their label.
+
+        Args:
+            lookup (SchemaLookup):
+            index_labels (dict): (element, index name) -> label a composite index is constrained to, as returned by
+                fetch_composite_index_labels. Composite indices missing from it aren't constrained. None when
+                unknown, composite indices are then taken as usable for every label.
+        """
+        self.lookup = lookup
+        self.index_labels = index_labels
+
+    def check(self, label, predicates, element="VertexLabel"):
+        """
+        Args:
+            label (str): Label the lookup is restricted to, None for any label
+            predicates (Iterable[Predicate]):
+            element (str): VertexLabel or EdgeLabel
+
+        Returns:
+            CoverageResult
+        """
+        predicates = tuple(predicates)
+        by_property = {}
+        for predicate in predicates:
+            by_property.setdefault(predicate.property, []).append(predicate)
+
+        if not predicates:
+            return CoverageResult(label, None, (), (), "no property is filtered on")
+
+        candidates = {}
+        constrained = {}
+        for property_name in by_property:
+            # A lookup without label can't use the label constrained mixed indices, "" matches none of them
+            for index in self.lookup.get_indices_with_property(property_name, element, label_name=label or ""):
+                constraint = self.__constraint__(element, index)
+                if constraint is None or constraint == label:
+                    candidates[(type(index), index.name)] = index
+                else:
+                    constrained[index.name] = constraint
+
+        composite = []
+        mixed = []
+        for index in candidates.values():
+            if isinstance(index, CompositeIndexInfo):
+                keys = [prop.name for prop in index.properties]
+                if all(any(p.op in EQUALITY_OPS for p in by_property.get(key, ())) for key in keys):
+                    served = tuple(p for p in predicates if p.property in keys and p.op in EQUALITY_OPS)
+                    composite.append((index, served))
+            else:
+                data_types = {prop.name: prop.data_type for prop in index.properties}
+                served = tuple(p for p in predicates
+                               if p.property in data_types and self.__is_mixed_indexable__(p, data_types[p.property]))
+                if served:
+                    mixed.append((index, served))
+
+        if composite:
+            # The index with the most keys is the most selective, unique ones return at most one element
+            index, served = max(composite, key=lambda entry: (len(entry[0].properties), entry[0].unique,
+                                                             len(entry[1])))
+        elif mixed:
+            index, served = max(mixed, key=lambda entry: len(entry[1]))
+        else:
+            return CoverageResult(label, None, (), predicates, self.__reason__(by_property, candidates, constrained))
+
+        return CoverageResult(label, index, served, tuple(p for p in predicates if p not in served), None)
+
+    def check_gremlin(self, traversal):
+        """
+        Args:
+            traversal (str): Gremlin traversal, see analysis.gremlin_parser.parse_lookup for what is understood
+
+        Returns:
+            list[CoverageResult]: One per label of hasLabel()/has(label, ...), a single one when there is none
+        """
+        lookup = parse_lookup(traversal)
+
+        return [self.check(label, lookup.predicates, lookup.element) for label in (lookup.labels or (None,))]
+
+    def __constraint__(self, element, index):
+        if self.index_labels is None or not isinstance(index, CompositeIndexInfo):
+            return None
+        return self.index_labels.get((element, index.name))
+
+    def __is_mixed_indexable__(self, predicate, data_type):
+        if predicate.op in UNINDEXABLE_OPS:
+            return False
+        if predicate.op in TEXT_OPS:
+            return data_type == "String"
+        if predicate.op in GEO_OPS:
+            return data_type == "GeoShape"
+        return True
+
+    def __reason__(self, by_property, candidates, constrained):
+        # Composite indices of the properties built with indexOnly() for another label
+        reasons = [f"composite {name} only serves {constraint}" for name, constraint in sorted(constrained.items())]
+        if not candidates:
+            return "; ".join([f"no {'usable ' if reasons else ''}index covers {', '.join(sorted(by_property))}"]
+                             + reasons)
+
+        for index in candidates.values():
+            if isinstance(index, CompositeIndexInfo):
+                missing = [prop.name for prop in index.properties
+                           if not any(p.op in EQUALITY_OPS for p in by_property.get(prop.name, ()))]
+                reasons.append(f"composite {index.name} needs equality on {', '.join(missing)}")
+            else:
+                unanswered = [f"{p.property} {p.op}" for prop in index.properties for p in by_property.get(prop.name, ())]
+                reasons.append(f"mixed {index.name} can't answer {', '.join(unanswered)}")
+
+        return "; ".join(reasons)
+
+
+def check_coverage(lookup, traversal, index_labels=None):
+    """
+    Args:
+        lookup (SchemaLookup):
+        traversal (str):
+        index_labels (dict): See IndexCoverage
+
+    Returns:
+        list[CoverageResult]
+    """
+    return IndexCoverage(lookup, index_labels).check_gremlin(traversal)
+
@@ -0,0 +1,117 @@
+from collections import namedtuple, defaultdict
+
+Finding = namedtuple("Finding", ["kind", "element", "label", "index", "keep"])
+
+DUPLICATE = "duplicate"
+REORDERED = "reordered"
+COVERED_BY_MIXED = "covered_by_mixed"
+
+
+class IndexRedundancy:
+
+    def __init__(self, lookup, index_labels=None):
+        """Finds composite indices which can be dropped: exact duplicates of another one, ones with the same
+        properties in another order (composite lookups need equality on every key, the order doesn't matter) and
+        ones whose properties are all in a mixed index of the label they are constrained to. Unique indices are
+        kept over non unique ones and never reported as covered by a mixed index, which can't enforce uniqueness.
+
+        Every composite index written on a mutation is an extra storage write, write_savings tells per label how
+        many of them the findings would save.
+
+        Args:
+            lookup (SchemaLookup):
+            index_labels (dict): (element, index name) -> label a composite index is constrained to, as returned by
+                fetch_composite_index_labels. None when unknown, indices are then compared as if they had the same
+                constraint and mixed index coverage isn't checked.
+        """
+        self.lookup = lookup
+        self.index_labels = index_labels
+
+        self.findings = []
+        # (element, label name) -> (composite indices written on a mutation, how many of them are findings)
+        self.write_savings = {}
+
+        for element in ("VertexLabel", "EdgeLabel"):
+            self.__analyze__(element)
+
+    def __constraint__(self, element, name):
+        return None if self.index_labels is None else self.index_labels.get((element, name))
+
+    def __analyze__(self, element):
+        composites = sorted(((key[2], index) for key, index in self.lookup.indices.items()
+                             if key[0] == "CompositeIndex" and key[1] == element),
+                            key=lambda entry: (not entry[1].unique, entry[0]))
+
+        redundant = {}
+        kept = defaultdict(list)
+        for name, index in composites:
+            label = self.__constraint__(element, name)
+            keys = tuple(prop.name for prop in index.properties)
+            group = kept[(label, frozenset(keys))]
+
+            if not group:
+                group.append(index)
+                continue
+
+            keep = group[0]
+            same_order = keys == tuple(prop.name for prop in keep.properties)
+            redundant[name] = Finding(DUPLICATE if same_order else REORDERED, element, label, index, keep)
+
+        if self.index_labels is not None:
+            for name, index in composites:
+                label = self.__constraint__(element, name)
+                if name in redundant or index.unique or label is None:
+                    continue
+
+                keys = {prop.name for prop in index.properties}
+                for mixed in self.__mixed_indices__(element, label):
+                    if keys <= {prop.name for prop in mixed.properties}:
+                        redundant[name] = Finding(COVERED_BY_MIXED, element, label, index, mixed)
+                        break
+
+        self.findings.extend(redundant[name] for name, _ in composites if name in redundant)
+
+        for (label_element, label_name), label in self.lookup.labels.items():
+            if label_element != element:
+                continue
+
+            properties = {prop.name for prop in label.properties}
+            written = [name for name, index in composites
+                       if self.__constraint__(element, name) in (None, label_name)
+                       and {prop.name for prop in index.properties} <= properties]
+            if written:
+                self.write_savings[(element, label_name)] = (len(written),
+                                                             sum(1 for name in written if name in redundant))
+
+    def __mixed_indices__(self, element, label):
+        return [index for key, index in self.lookup.indices.items()
+                if key[0] == "MixedIndex" and key[1] == element and key[2] == label]
+
+    def report(self):
+        """
+        Returns:
+            list[str]: One line per finding and per label whose mutations would write fewer indices
+        """
+        lines = []
+        for finding in self.findings:
+            index_keys = ", ".join(prop.name for prop in finding.index.properties)
+            on = f" on {finding.label}" if finding.label else ""
+
+            if finding.kind == COVERED_BY_MIXED:
+                lines.append(f"COVERED {finding.element} composite {finding.index.name}({index_keys}){on} by mixed "
+                             f"index {finding.keep.name}")
+            else:
+                keep_keys = ", ".join(prop.name for prop in finding.keep.properties)
+                lines.append(f"{finding.kind.upper()} {finding.element} composite {finding.index.name}"
+                             f"({index_keys}){on} of {finding.keep.name}({keep_keys})")
+
+        for (element, label), (written, saved) in sorted(self.write_savings.items()):
+            if saved:
+                lines.append(f"{element} {label}: {saved} of {written} composite index writes per mutation saved")
+
+        if self.index_labels is None:
+            lines.append("Label constraints of the composite indices unknown, indices were compared as if they had "
+                         "the same and mixed index coverage wasn't checked")
+        lines.append(f"{len(self.findings)} redundant composite indices")
+
+        return lines
@@ -0,0 +1,138 @@
+from collections import namedtuple
+
+from management import management_pb2
+
+LintIssue = namedtuple("LintIssue", ["rule", "element", "name", "message"])
+
+MULTI = management_pb2.EdgeLabel.Multiplicity.Name(management_pb2.EdgeLabel.Multi)
+MULTI_VALUED = {management_pb2.VertexProperty.Cardinality.Name(management_pb2.VertexProperty.List),
+                management_pb2.VertexProperty.Cardinality.Name(management_pb2.VertexProperty.Set)}
+JAVA_OBJECT = management_pb2.PropertyDataType.Name(management_pb2.JavaObject)
+
+DEFAULT_MAX_PROPERTIES = 50
+
+
+class SchemaLinter:
+    RULES = ["unindexed-multi-edge", "too-many-properties", "multi-valued-composite-key", "unpartitioned-high-degree",
+             "java-object-index-key"]
+
+    def __init__(self, lookup, index_labels=None, max_properties=DEFAULT_MAX_PROPERTIES, high_degree_labels=(),
+                 disabled_rules=()):
+        """Flags schema performance anti-patterns:
+
+            unindexed-multi-edge: Multi edge label without any composite or mixed index on its properties, its
+                edges can only be filtered by scanning every adjacent edge
+            too-many-properties: label declaring more than max_properties properties
+            multi-valued-composite-key: List/Set cardinality property used as a composite index key, each value
+                adds an index entry
+            unpartitioned-high-degree: vertex label listed in high_degree_labels which isn't partitioned
+            java-object-index-key: JavaObject property used in an index, serialized and compared as opaque bytes
+
+        Args:
+            lookup (SchemaLookup):
+            index_labels (dict): (element, index name) -> label a composite index is constrained to, see
+                fetch_composite_index_labels. None when unknown, an edge label then counts as indexed by any
+                composite edge index on its properties.
+            max_properties (int):
+            high_degree_labels (Iterable[str]): Vertex labels known to have very many edges
+            disabled_rules (Iterable[str]):
+
+        Raises:
+            LookupError: For an unknown rule, or a high degree label which isn't a vertex label of the lookup
+        """
+        unknown_rules = set(disabled_rules) - set(self.RULES)
+        if unknown_rules:
+            raise LookupError(f"Unknown lint rules {sorted(unknown_rules)}, expecting some of {self.RULES}")
+
+        unknown_labels = {name for name in high_degree_labels if lookup.get_label("VertexLabel", name) is None}
+        if unknown_labels:
+            raise LookupError(f"Unknown high degree vertex labels {sorted(unknown_labels)}")
+
+        self.lookup = lookup
+        self.index_labels = index_labels
+        self.max_properties = max_properties
+        self.high_degree_labels = set(high_degree_labels)
+        self.disabled_rules = set(disabled_rules)
+
+    def lint(self):
+        """
+        Returns:
+            list[LintIssue]: By rule, then element and name
+        """
+        checks = {
+            "unindexed-multi-edge": self.__unindexed_multi_edges__,
+            "too-many-properties": self.__too_many_properties__,
+            "multi-valued-composite-key": self.__multi_valued_composite_keys__,
+            "unpartitioned-high-degree": self.__unpartitioned_high_degree__,
+            "java-object-index-key": self.__java_object_index_keys__,
+        }
+
+        issues = []
+        for rule in self.RULES:
+            if rule not in self.disabled_rules:
+                issues.extend(sorted(checks[rule](), key=lambda issue: (issue.element, issue.name)))
+        return issues
+
+    def __unindexed_multi_edges__(self):
+        for (element, name), label in self.lookup.labels.items():
+            if element != "EdgeLabel" or label.multiplicity != MULTI:
+                continue
+
+            properties = {prop.name for prop in label.properties}
+            indexed = False
+            for key, index in self.lookup.indices.items():
+                if key[1] != "EdgeLabel":
+                    continue
+                if key[0] == "MixedIndex":
+                    indexed = key[2] == name
+                elif self.index_labels is not None and ("EdgeLabel", index.name) in self.index_labels:
+                    indexed = self.index_labels[("EdgeLabel", index.name)] == name
+                else:
+                    indexed = bool(index.properties) and {prop.name for prop in index.properties} <= properties
+                if indexed:
+                    break
+
+            if not indexed:
+                yield LintIssue("unindexed-multi-edge", element, name,
+                                f"Multi edge label {name} has no index on its "
+                                f"{len(properties)} properties" if properties else
+                                f"Multi edge label {name} has no property an index could filter its edges on")
+
+    def __too_many_properties__(self):
+        for (element, name), label in self.lookup.labels.items():
+            if len(label.properties) > self.max_properties:
+                yield LintIssue("too-many-properties", element, name,
+                                f"{name} declares {len(label.properties)} properties, more than {self.max_properties}")
+
+    def __multi_valued_composite_keys__(self):
+        cardinalities = {prop.name: prop.cardinality
+                         for (element, _), label in self.lookup.labels.items() if element == "VertexLabel"
+                         for prop in label.properties}
+
+        for key, index in self.lookup.indices.items():
+            if key[0] != "CompositeIndex":
+                continue
+
+            for prop in index.properties:
+                cardinality = prop.cardinality if prop.cardinality in MULTI_VALUED else cardinalities.get(prop.name)
+                if cardinality in MULTI_VALUED:
+                    yield LintIssue("multi-valued-composite-key", key[1], index.name,
+                                    f"Composite index {index.name} has {cardinality} cardinality key {prop.name}, every "
+                                    f"value of it is a separate index entry")
+
+    def __unpartitioned_high_degree__(self):
+        for name in self.high_degree_labels:
+            label = self.lookup.get_label("VertexLabel", name)
+            if not label.partitioned:
+                yield LintIssue("unpartitioned-high-degree", "VertexLabel", name,
+                                f"High degree vertex label {name} isn't partitioned, its edges are all stored on one "
+                                f"storage partition")
+
+    def __java_object_index_keys__(self):
+        for key, index in self.lookup.indices.items():
+            for prop in index.properties:
+                if prop.data_type == JAVA_OBJECT:
+                    kind = "Composite" if key[0] == "CompositeIndex" else "Mixed"
+                    yield LintIssue("java-object-index-key", key[1], index.name,
+                                    f"{kind} index {index.name} has JavaObject key {prop.name}, indexed as serialized "
+                                    f"bytes")
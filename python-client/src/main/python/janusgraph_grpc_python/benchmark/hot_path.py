@@ -0,0 +1,212 @@
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import timeit
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from client.command_runner import build_parser
+from connection.channel_pool import get_channel_pool
+from graph_operation.command_action.graph_operation_action import GraphOperationAction
+from graph_operation.command_action.graph_operation_metadata import GraphOperationMetadata
+from graph_operation.graph_indexer import GraphIndexer
+from type_class.graph_element_type import GraphElementType
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1
+# Stubs are created lazily by the channel, nothing is ever sent to it
+TARGET = "localhost:10182"
+
+# name -> (op, --arg values)
+COMMANDS = {
+    "get-label": ("GET", ["VertexLabel", "person"]),
+    "get-all": ("GET", ["EdgeLabel", "ALL"]),
+    "put-label": ("PUT", ["VertexLabel", "person", "properties=name,age", "partitioned=true"]),
+    "put-index": ("PUT", ["VertexLabel", "person", "INDEX", "index_type=CompositeIndex", "index_on=name,age",
+                          "index_name=byNameAge"]),
+}
+
+
+def __operation__(op, values):
+    operation = GraphOperationAction.build_operation(values)
+    operation.set_operation(op)
+    operation.set_channel(get_channel_pool().get_channel(TARGET))
+    return operation
+
+
+def __request__(op, values):
+    # What processor.operate() builds before calling the stub
+    processor = __operation__(op, values).get_processor()
+    processor.__generate_context__()
+    operator = processor.OPTIONAL_OPERATOR
+
+    if isinstance(operator, GraphIndexer):
+        operator.set_context(processor.CONTEXT)
+        return lambda: operator.get_indexer().create_put_index_request().REQUEST
+    if operator is not None:
+        element = operator.ELEMENT
+
+        def build():
+            # get_element() extends the element it was given, every call starts from the same one
+            fresh = type(element)()
+            fresh.CopyFrom(element)
+            operator.set_element(fresh)
+            processor.ELEMENT = operator.get_element()
+            return processor.__generate_request__().REQUEST
+        return build
+    return lambda: processor.__generate_request__().REQUEST
+
+
+def __get_indexer__(op, values):
+    processor = __operation__(op, values).get_processor()
+    operator = processor.OPTIONAL_OPERATOR
+    if not isinstance(operator, GraphIndexer):
+        return None
+
+    operator.set_context(processor.__generate_context__().CONTEXT)
+    return operator.get_indexer
+
+
+def __parse_args__(op, values):
+    parser = build_parser()
+    return lambda: parser.parse_args(["--op", op, "--arg"] + values)
+
+
+def __action_call__(op, values):
+    action = GraphOperationAction(option_strings=["--arg"], dest="arg")
+    return lambda: action(None, argparse.Namespace(), values)
+
+
+def __metadata_set__(op, values):
+    metadata = values[2:] or None
+    return lambda: GraphOperationMetadata().set(metadata)
+
+
+def __element_type_set__(op, values):
+    return lambda: GraphElementType().set(values[0])
+
+
+def __get_processor__(op, values):
+    return __operation__(op, values).get_processor
+
+
+def __serialize__(op, values):
+    request = __request__(op, values)()
+    return request.SerializeToString
+
+
+# Stage -> factory(op, values) returning the callable to time, None when the stage doesn't apply to the command.
+# In the order a CLI operation goes through them. They nest: parse_args runs GraphOperationAction.__call__, which
+# runs GraphOperationMetadata.set and GraphElementType.set
+STAGES = {
+    "parse_args": __parse_args__,
+    "GraphOperationAction.__call__": __action_call__,
+    "GraphOperationMetadata.set": __metadata_set__,
+    "GraphElementType.set": __element_type_set__,
+    "GraphOperation.get_processor": __get_processor__,
+    "GraphIndexer.get_indexer": __get_indexer__,
+    "request construction": __request__,
+    "request serialization": __serialize__,
+}
+
+
+def time_call(fn, repeat=DEFAULT_REPEAT):
+    """timeit autorange: the number of calls is grown until a run lasts at-least 0.2s, then repeated.
+
+    Returns:
+        dict: per_call_us of the fastest run, the least disturbed one, median_us over the runs and the calls per run
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = [elapsed / number * 1e6 for elapsed in timer.repeat(repeat, number)]
+    return {"per_call_us": min(runs), "median_us": statistics.median(runs), "number": number}
+
+
+def run(commands=None, stages=None, repeat=DEFAULT_REPEAT):
+    """Times every stage of every command. The prints of the client code are part of its cost, they are written to
+    os.devnull while timing.
+
+    Args:
+        commands (Iterable[str]): Names of COMMANDS, all of them when None
+        stages (Iterable[str]): Names of STAGES, all of them when None
+        repeat (int):
+
+    Returns:
+        list[dict]
+    """
+    results = []
+
+    with open(os.devnull, "w") as devnull:
+        for command in commands or COMMANDS:
+            op, values = COMMANDS[command]
+            for stage in stages or STAGES:
+                with contextlib.redirect_stdout(devnull):
+                    fn = STAGES[stage](op, values)
+                    if fn is None:
+                        continue
+                    result = time_call(fn, repeat)
+
+                result.update(command=command, stage=stage)
+                results.append(result)
+
+    return results
+
+
+def compare(base, results, threshold=DEFAULT_THRESHOLD):
+    """
+    Args:
+        base (list[dict]): Results of an earlier run
+        results (list[dict]):
+        threshold (float): Relative slowdown tolerated
+
+    Returns:
+        list[str]: One line per stage slower than the base beyond the threshold
+    """
+    base = {(result["command"], result["stage"]): result["per_call_us"] for result in base}
+
+    regressions = []
+    for result in results:
+        before = base.get((result["command"], result["stage"]))
+        if before and (result["per_call_us"] - before) / before > threshold:
+            regressions.append(f"REGRESSION {result['command']} {result['stage']}: {before:.2f}us -> "
+                               f"{result['per_call_us']:.2f}us ({(result['per_call_us'] - before) / before:+.1%})")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--command', type=str, action='append', default=None, choices=list(COMMANDS),
+                        help="Command to time, may be repeated. Defaults to all of them")
+    parser.add_argument('--stage', type=str, action='append', default=None, choices=list(STAGES),
+                        help="Stage to time, may be repeated. Defaults to all of them")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--output', type=str, default=None, help="Write the results as JSON")
+    parser.add_argument('--compare', type=str, default=None,
+                        help="JSON results of an earlier run, exits with 1 when a stage got slower")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    hot_path_results = run(args.command, args.stage, args.repeat)
+
+    for command in args.command or COMMANDS:
+        command_results = [result for result in hot_path_results if result["command"] == command]
+        print(f"{command}: {' '.join(COMMANDS[command][1])}")
+        for result in command_results:
+            print(f"  {result['stage']:<32} {result['per_call_us']:>10.2f}us  (median {result['median_us']:.2f}us)")
+
+    if args.output is not None:
+        with open(args.output, "w") as output:
+            json.dump({"results": hot_path_results}, output, indent=2)
+
+    status = 0
+    if args.compare is not None:
+        with open(args.compare) as base_file:
+            lines = compare(json.load(base_file)["results"], hot_path_results, args.threshold)
+        for line in lines:
+            print(line)
+        status = 1 if lines else 0
+
+    get_channel_pool().close()
+    sys.exit(status)
@@ -0,0 +1,418 @@
+import argparse
+import json
+import platform
+import queue
+import random
+import threading
+import time
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+import grpc
+
+from benchmark.rpc_benchmark import RPCS, STUBS, Workload, ReferenceServerProcess
+from connection.rpc_metrics import Histogram
+
+DEFAULT_MIX = "GetVertexLabelsByName=70,GetCompositeIndicesByVertexLabel=20,EnsureVertexLabel=10"
+DEFAULT_DURATION = 30.0
+DEFAULT_INTERVAL = 1.0
+DEFAULT_MAX_IN_FLIGHT = 256
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_DRAIN = 10.0
+DEFAULT_LABELS = 1000
+ARRIVALS = ["poisson", "uniform"]
+QUANTILES = [("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99), ("p999_ms", 0.999)]
+
+
+def parse_mix(spec):
+    """
+    Args:
+        spec (str): Comma separated RPC=weight, e.g. "GetVertexLabelsByName=70,EnsureVertexLabel=30". Weights are
+            relative, they don't have to add up to 100
+
+    Returns:
+        list[tuple]: (rpc, weight)
+    """
+    mix = []
+    for item in spec.split(","):
+        rpc, separator, weight = item.strip().partition("=")
+        if not separator:
+            raise ValueError(f"Expecting RPC=weight in the mix, got {item!r}")
+        if rpc not in RPCS:
+            raise LookupError(f"Unknown RPC {rpc} in the mix, expecting some of {list(RPCS)}")
+
+        weight = float(weight)
+        if weight < 0:
+            raise ValueError(f"Weight of {rpc} must not be negative. Got {weight}")
+        if weight > 0:
+            mix.append((rpc, weight))
+
+    if not mix:
+        raise ValueError(f"The mix {spec!r} has no RPC with a positive weight")
+    return mix
+
+
+class IntervalStats:
+
+    def __init__(self):
+        # Calls are counted as sent in the interval of their scheduled send time, as completed in the one they
+        # completed in
+        self.sent = 0
+        # Microseconds, of the successful calls
+        self.latency = Histogram()
+        # StatusCode name -> count
+        self.errors = {}
+
+    def record(self, latency, code=None):
+        if code is None:
+            self.latency.record(round(latency * 1e6))
+        else:
+            self.errors[code] = self.errors.get(code, 0) + 1
+
+    def to_dict(self, seconds=None):
+        """
+        Args:
+            seconds (float): Length of the interval, to compute the throughput
+
+        Returns:
+            dict: Counts, error rate and latency quantiles in milliseconds, None when no call succeeded
+        """
+        errors = sum(self.errors.values())
+        completed = self.latency.count + errors
+        result = {
+            "sent": self.sent,
+            "completed": completed,
+            "ok": self.latency.count,
+            "errors": dict(self.errors),
+            "error_rate": errors / completed if completed else 0.0,
+        }
+        result["ops_per_s"] = completed / seconds if seconds else 0.0
+        for name, q in QUANTILES:
+            result[name] = self.latency.percentile(q) / 1000 if self.latency.count else None
+        result["max_ms"] = self.latency.max / 1000 if self.latency.count else None
+        return result
+
+
+class LoadGenerator:
+
+    def __init__(self, channel, workload, mix, interval=DEFAULT_INTERVAL, timeout=DEFAULT_TIMEOUT, seed=None):
+        """Drives a management server with a weighted mix of RPCs and keeps latency distributions and errors per
+        reporting interval, per RPC and overall.
+
+        Args:
+            channel (grpc.Channel):
+            workload (Workload): Builds the requests, against a schema generated by SchemaStore.populate
+            mix (list[tuple]): (rpc, weight), see parse_mix
+            interval (float): Seconds per reporting interval. A call counts in the interval it completes in
+            timeout (float): Deadline of every call, so that a stuck server can't hang the run
+            seed (int): Of the arrivals and of the picked RPCs
+        """
+        self.channel = channel
+        self.workload = workload
+        self.mix = mix
+        self.interval = interval
+        self.timeout = timeout
+        self.random = random.Random(seed)
+
+        self.rpcs = [rpc for rpc, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        # rpc -> (multi-callable, unary). Unary-unary multi-callables have future(), streams have to be drained
+        self.methods = {}
+        for rpc in self.rpcs:
+            method = getattr(STUBS[RPCS[rpc][0]](channel), rpc)
+            self.methods[rpc] = (method, hasattr(method, "future"))
+
+        self.start = None
+        self.last_done = None
+        self.reported = 0
+        self.unsent = 0
+        # interval index -> IntervalStats
+        self.INTERVALS = {}
+        # rpc -> IntervalStats over the whole run
+        self.TOTALS = {rpc: IntervalStats() for rpc in self.rpcs}
+        self.TOTAL = IntervalStats()
+        self.LOCK = threading.Lock()
+
+    def __interval__(self, at):
+        index = int((at - self.start) / self.interval)
+        stats = self.INTERVALS.get(index)
+        if stats is None:
+            stats = IntervalStats()
+            self.INTERVALS[index] = stats
+        return stats
+
+    def __pick__(self):
+        return self.random.choices(self.rpcs, weights=self.weights)[0]
+
+    def __sent__(self, rpc, at):
+        with self.LOCK:
+            for stats in (self.__interval__(at), self.TOTALS[rpc], self.TOTAL):
+                stats.sent += 1
+
+    def __call_rpc__(self, rpc, scheduled):
+        """Sends rpc and drains its response, recording its latency from the scheduled send time"""
+        method, unary = self.methods[rpc]
+        code = None
+        try:
+            response = method(RPCS[rpc][1](self.workload), timeout=self.timeout)
+            if not unary:
+                for _ in response:
+                    pass
+        except grpc.RpcError as e:
+            code = e.code().name
+
+        done = time.perf_counter()
+        with self.LOCK:
+            self.last_done = max(self.last_done or done, done)
+            for stats in (self.__interval__(done), self.TOTALS[rpc], self.TOTAL):
+                stats.record(done - scheduled, code)
+
+    def run_open(self, rate, duration, max_in_flight=DEFAULT_MAX_IN_FLIGHT, arrival="poisson", drain=DEFAULT_DRAIN,
+                 on_interval=None):
+        """Open loop: calls are scheduled at the arrival rate whatever the server does, and their latency runs from
+        the scheduled send time. When the server falls behind, calls wait for one of the max_in_flight senders and
+        the wait is part of their latency, instead of the load silently dropping (coordinated omission).
+
+        Args:
+            rate (float): Calls per second
+            duration (float): Seconds during which calls are scheduled
+            max_in_flight (int): Sender threads, i.e. calls outstanding at once
+            arrival (str): poisson for exponential gaps between calls, uniform for evenly spaced calls
+            drain (float): Seconds given after the duration to calls still queued, the ones left are counted as unsent
+            on_interval (Callable): Called with (index, IntervalStats, backlog) once an interval is over
+
+        Returns:
+            dict: See report()
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive. Got {rate}")
+        if arrival not in ARRIVALS:
+            raise ValueError(f"arrival must be one of {ARRIVALS}. Got {arrival}")
+
+        calls = queue.Queue()
+        abandon = threading.Event()
+
+        def send():
+            while True:
+                item = calls.get()
+                if item is None:
+                    return
+                if abandon.is_set():
+                    with self.LOCK:
+                        self.unsent += 1
+                    continue
+                self.__call_rpc__(*item)
+
+        def schedule():
+            scheduled = self.start
+            end = self.start + duration
+            while True:
+                scheduled += self.random.expovariate(rate) if arrival == "poisson" else 1.0 / rate
+                if scheduled >= end:
+                    break
+
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                rpc = self.__pick__()
+                self.__sent__(rpc, scheduled)
+                calls.put((rpc, scheduled))
+
+            for _ in senders:
+                calls.put(None)
+
+        senders = [threading.Thread(target=send, daemon=True) for _ in range(max_in_flight)]
+        self.start = time.perf_counter()
+        for sender in senders:
+            sender.start()
+        scheduler = threading.Thread(target=schedule, daemon=True)
+        scheduler.start()
+
+        self.__report_until__(lambda: not scheduler.is_alive(), on_interval, calls.qsize)
+        deadline = time.perf_counter() + drain
+        self.__report_until__(lambda: calls.empty() or time.perf_counter() >= deadline, on_interval, calls.qsize)
+        abandon.set()
+        for sender in senders:
+            sender.join()
+        self.__report_until__(lambda: True, on_interval, calls.qsize, flush=True)
+
+        return self.report()
+
+    def run_closed(self, concurrency, duration, on_interval=None):
+        """Closed loop: concurrency callers each send their next call once the previous one returned. Latency runs
+        from the actual send, so a slow server lowers the load instead of showing in the latencies.
+
+        Args:
+            concurrency (int): Callers
+            duration (float): Seconds during which calls are sent
+            on_interval (Callable): Called with (index, IntervalStats, backlog) once an interval is over
+
+        Returns:
+            dict: See report()
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at-least 1. Got {concurrency}")
+
+        def call():
+            while True:
+                sent = time.perf_counter()
+                if sent >= end:
+                    return
+                rpc = self.__pick__()
+                self.__sent__(rpc, sent)
+                self.__call_rpc__(rpc, sent)
+
+        callers = [threading.Thread(target=call, daemon=True) for _ in range(concurrency)]
+        self.start = time.perf_counter()
+        end = self.start + duration
+        for caller in callers:
+            caller.start()
+
+        self.__report_until__(lambda: not any(caller.is_alive() for caller in callers), on_interval, lambda: 0)
+        self.__report_until__(lambda: True, on_interval, lambda: 0, flush=True)
+
+        return self.report()
+
+    def __report_until__(self, done, on_interval, backlog, flush=False):
+        # Hands over every interval which is over, an interval being over once the clock passed its end
+        reported = self.reported
+        while True:
+            current = int((time.perf_counter() - self.start) / self.interval)
+            last = max(self.INTERVALS, default=-1) if flush else current - 1
+
+            while reported <= last:
+                with self.LOCK:
+                    stats = self.INTERVALS.get(reported) or IntervalStats()
+                if on_interval is not None:
+                    on_interval(reported, stats, backlog())
+                reported += 1
+            self.reported = reported
+
+            if done():
+                return
+            time.sleep(min(0.05, self.interval / 10))
+
+    def report(self):
+        """
+        Returns:
+            dict: intervals, list of IntervalStats.to_dict() with their start in seconds, rpcs, the same over the
+            run per RPC, total over every RPC and unsent, calls still queued when the run was stopped
+        """
+        with self.LOCK:
+            intervals = []
+            for index in range(max(self.INTERVALS, default=-1) + 1):
+                stats = self.INTERVALS.get(index) or IntervalStats()
+                intervals.append(dict(stats.to_dict(self.interval), start_s=index * self.interval))
+
+            # Throughput over the whole run is up to the last completion
+            seconds = self.last_done - self.start if self.last_done is not None else None
+            return {
+                "intervals": intervals,
+                "rpcs": {rpc: stats.to_dict(seconds) for rpc, stats in self.TOTALS.items()},
+                "total": self.TOTAL.to_dict(seconds),
+                "unsent": self.unsent,
+            }
+
+
+def print_interval(index, stats, backlog, interval=DEFAULT_INTERVAL):
+    result = stats.to_dict(interval)
+    print(f"[{index * interval:>6.1f}s] sent {result['sent']:>6} done {result['completed']:>6} "
+          f"errors {sum(result['errors'].values()):>5} ({result['error_rate']:.1%}) "
+          f"p50 {__ms__(result['p50_ms'])} p90 {__ms__(result['p90_ms'])} p99 {__ms__(result['p99_ms'])} "
+          f"max {__ms__(result['max_ms'])} backlog {backlog}", flush=True)
+
+
+def __ms__(value):
+    return "-" if value is None else f"{value:.2f}ms"
+
+
+def __generate__(args, address, mix):
+    channel = grpc.insecure_channel(address)
+    generator = LoadGenerator(channel, Workload(args.labels), mix, args.interval, args.timeout, args.seed)
+
+    def on_interval(index, stats, backlog):
+        print_interval(index, stats, backlog, args.interval)
+
+    try:
+        if args.rate is not None:
+            return generator.run_open(args.rate, args.duration, args.max_in_flight, args.arrival, args.drain,
+                                      on_interval)
+        return generator.run_closed(args.concurrency, args.duration, on_interval)
+    finally:
+        channel.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--mix', type=str, default=DEFAULT_MIX,
+                        help="Comma separated RPC=weight, weights being relative. Defaults to " + DEFAULT_MIX)
+    load = parser.add_mutually_exclusive_group(required=True)
+    load.add_argument('--rate', type=float, default=None,
+                      help="Open loop: calls per second, whatever the latency. Latency runs from the scheduled send "
+                           "time, queuing included")
+    load.add_argument('--concurrency', type=int, default=None,
+                      help="Closed loop: callers sending back to back. A slow server lowers the load instead of "
+                           "showing in the latencies")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION)
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="Seconds per reported interval")
+    parser.add_argument('--arrival', type=str, default="poisson", choices=ARRIVALS,
+                        help="Open loop only. Exponential or constant gaps between calls")
+    parser.add_argument('--max-in-flight', type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="Open loop only. Calls outstanding at once, the others wait in the backlog")
+    parser.add_argument('--drain', type=float, default=DEFAULT_DRAIN,
+                        help="Open loop only. Seconds given to the backlog after the duration")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Deadline of every call in seconds")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--target', type=str, default=None, metavar="HOST:PORT",
+                        help="Drive this server instead of starting a reference server, its schema must have been "
+                             "generated by SchemaStore.populate")
+    parser.add_argument('--labels', type=int, default=DEFAULT_LABELS,
+                        help="Vertex and edge labels of the started reference server, or generated on --target")
+    parser.add_argument('--output', type=str, default=None, help="Write the report as JSON")
+
+    return parser
+
+
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+    mix = parse_mix(args.mix)
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    print(f"{'open' if args.rate is not None else 'closed'} loop, "
+          f"{f'{args.rate:g} calls/s' if args.rate is not None else f'{args.concurrency} callers'} for "
+          f"{args.duration:g}s: {', '.join(f'{rpc}={weight:g}' for rpc, weight in mix)}")
+
+    if args.target is not None:
+        load_report = __generate__(args, args.target, mix)
+    else:
+        with ReferenceServerProcess(args.labels, max(args.max_in_flight, args.concurrency or 0)) as server:
+            load_report = __generate__(args, server.address, mix)
+
+    print(50*"-")
+    for rpc, result in list(load_report["rpcs"].items()) + [("total", load_report["total"])]:
+        print(f"{rpc}: {result['completed']} calls, {result['ops_per_s']:.1f}/s, "
+              f"{sum(result['errors'].values())} errors ({result['error_rate']:.2%}) {result['errors'] or ''} "
+              f"p50 {__ms__(result['p50_ms'])} p90 {__ms__(result['p90_ms'])} p99 {__ms__(result['p99_ms'])} "
+              f"p99.9 {__ms__(result['p999_ms'])} max {__ms__(result['max_ms'])}")
+    if load_report["unsent"]:
+        print(f"{load_report['unsent']} calls were still in the backlog after --drain {args.drain:g}s")
+
+    if args.output is not None:
+        load_report["meta"] = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "grpc": grpc.__version__,
+            "target": args.target,
+            "mix": dict(mix),
+            "rate": args.rate,
+            "concurrency": args.concurrency,
+            "arrival": args.arrival,
+            "duration": args.duration,
+            "interval": args.interval,
+        }
+        with open(args.output, "w") as output:
+            json.dump(load_report, output, indent=2)
+        print(f"Wrote the report to {args.output}")
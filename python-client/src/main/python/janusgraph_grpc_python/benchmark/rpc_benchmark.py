@@ -0,0 +1,372 @@
+import argparse
+import itertools
+import json
+import math
+import platform
+import random
+import subprocess
+import threading
+import time
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+import grpc
+
+from management import management_pb2, management_pb2_grpc
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+DEFAULT_CONCURRENCY = [1, 4, 16, 64, 256]
+DEFAULT_DURATION = 2.0
+DEFAULT_WARMUP = 0.5
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_METRICS = ["p50_ms", "p95_ms", "p99_ms", "ops_per_s"]
+GRAPH_NAME = "graph_berkleydb"
+
+REFERENCE_SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server",
+                                "reference_server.py")
+
+STUBS = {
+    "AccessContext": management_pb2_grpc.AccessContextStub,
+    "ManagementForVertexLabels": management_pb2_grpc.ManagementForVertexLabelsStub,
+    "ManagementForEdgeLabels": management_pb2_grpc.ManagementForEdgeLabelsStub,
+}
+
+
+class Workload:
+
+    def __init__(self, labels):
+        """Builds the requests of the benchmarked RPCs against a schema generated by SchemaStore.populate: labels
+        vertex0..vertex<labels - 1> and edge0..edge<labels - 1> sharing the vertexProperty*/edgeProperty* keys.
+
+        Args:
+            labels (int): Vertex labels, and edge labels, in the context
+        """
+        self.labels = labels
+        self.context = management_pb2.JanusGraphContext(graphName=GRAPH_NAME)
+        # Index names must be new on every Ensure*Index call
+        self.sequence = itertools.count()
+
+    def vertex_label(self):
+        return management_pb2.VertexLabel(name=f"vertex{random.randrange(self.labels)}")
+
+    def edge_label(self):
+        return management_pb2.EdgeLabel(name=f"edge{random.randrange(self.labels)}")
+
+    def index_name(self):
+        return f"benchmark{os.getpid()}_{next(self.sequence)}"
+
+
+# RPC -> (service, request factory). Ensure*Index calls create a new index on every call, growing the schema
+RPCS = {
+    "GetContexts": ("AccessContext", lambda w: management_pb2.GetContextsRequest()),
+    "GetContextByGraphName": ("AccessContext", lambda w: management_pb2.GetContextByGraphNameRequest(name=GRAPH_NAME)),
+    "GetVertexLabels": ("ManagementForVertexLabels", lambda w: management_pb2.GetVertexLabelsRequest(
+        context=w.context)),
+    "GetVertexLabelsByName": ("ManagementForVertexLabels", lambda w: management_pb2.GetVertexLabelsByNameRequest(
+        context=w.context, name=w.vertex_label().name)),
+    "EnsureVertexLabel": ("ManagementForVertexLabels", lambda w: management_pb2.EnsureVertexLabelRequest(
+        context=w.context, label=w.vertex_label())),
+    "GetCompositeIndicesByVertexLabel": ("ManagementForVertexLabels",
+                                         lambda w: management_pb2.GetCompositeIndicesByVertexLabelRequest(
+                                             context=w.context, vertexLabel=w.vertex_label())),
+    "EnsureCompositeIndexByVertexLabel": ("ManagementForVertexLabels",
+                                          lambda w: management_pb2.EnsureCompositeIndexByVertexLabelRequest(
+                                              context=w.context, vertexLabel=w.vertex_label(),
+                                              index=management_pb2.CompositeVertexIndex(
+                                                  name=w.index_name(),
+                                                  properties=[management_pb2.VertexProperty(name="vertexProperty0")]))),
+    "GetCompositeIndicesForVertex": ("ManagementForVertexLabels",
+                                     lambda w: management_pb2.GetCompositeIndicesForVertexRequest(context=w.context)),
+    "GetMixedIndicesByVertexLabel": ("ManagementForVertexLabels",
+                                     lambda w: management_pb2.GetMixedIndicesByVertexLabelRequest(
+                                         context=w.context, vertexLabel=w.vertex_label())),
+    "EnsureMixedIndexByVertexLabel": ("ManagementForVertexLabels",
+                                      lambda w: management_pb2.EnsureMixedIndexByVertexLabelRequest(
+                                          context=w.context, vertexLabel=w.vertex_label(),
+                                          index=management_pb2.MixedVertexIndex(
+                                              name=w.index_name(), backend="search",
+                                              properties=[management_pb2.VertexProperty(name="vertexProperty0")]))),
+    "GetEdgeLabels": ("ManagementForEdgeLabels", lambda w: management_pb2.GetEdgeLabelsRequest(context=w.context)),
+    "GetEdgeLabelsByName": ("ManagementForEdgeLabels", lambda w: management_pb2.GetEdgeLabelsByNameRequest(
+        context=w.context, name=w.edge_label().name)),
+    "EnsureEdgeLabel": ("ManagementForEdgeLabels", lambda w: management_pb2.EnsureEdgeLabelRequest(
+        context=w.context, label=w.edge_label())),
+    "GetCompositeIndicesByEdgeLabel": ("ManagementForEdgeLabels",
+                                       lambda w: management_pb2.GetCompositeIndicesByEdgeLabelRequest(
+                                           context=w.context, edgeLabel=w.edge_label())),
+    "EnsureCompositeIndexByEdgeLabel": ("ManagementForEdgeLabels",
+                                        lambda w: management_pb2.EnsureCompositeIndexByEdgeLabelRequest(
+                                            context=w.context, edgeLabel=w.edge_label(),
+                                            index=management_pb2.CompositeEdgeIndex(
+                                                name=w.index_name(),
+                                                properties=[management_pb2.EdgeProperty(name="edgeProperty0")]))),
+    "GetCompositeIndicesForEdge": ("ManagementForEdgeLabels",
+                                   lambda w: management_pb2.GetCompositeIndicesForEdgeRequest(context=w.context)),
+    "GetMixedIndicesByEdgeLabel": ("ManagementForEdgeLabels",
+                                   lambda w: management_pb2.GetMixedIndicesByEdgeLabelRequest(
+                                       context=w.context, edgeLabel=w.edge_label())),
+    "EnsureMixedIndexByEdgeLabel": ("ManagementForEdgeLabels",
+                                    lambda w: management_pb2.EnsureMixedIndexByEdgeLabelRequest(
+                                        context=w.context, edgeLabel=w.edge_label(),
+                                        index=management_pb2.MixedEdgeIndex(
+                                            name=w.index_name(), backend="search",
+                                            properties=[management_pb2.EdgeProperty(name="edgeProperty0")]))),
+}
+
+
+def percentile(sorted_values, q):
+    """
+    Args:
+        sorted_values (list): Ascending
+        q (float): 0 to 100
+
+    Returns:
+        Nearest-rank percentile, None when there are no values
+    """
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(len(sorted_values) * q / 100.0) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def measure(channel, rpc, workload, concurrency, duration=DEFAULT_DURATION, warmup=DEFAULT_WARMUP):
+    """Closed-loop measurement: concurrency threads send the RPC back to back for warmup + duration seconds, only
+    the calls started after the warmup are recorded. Every thread records at-least one call, so a run of slow
+    listings on a large schema lasts longer rather than measuring nothing.
+
+    Returns:
+        dict: Latency percentiles in milliseconds, throughput and errors by status code
+    """
+    service, request_factory = RPCS[rpc]
+    method = getattr(STUBS[service](channel), rpc)
+    # Unary-unary multi-callables have future(), the response of the streaming ones is an iterator to drain
+    unary = hasattr(method, "future")
+
+    start = time.perf_counter()
+    measured_from = start + warmup
+    end = measured_from + duration
+    latencies = []
+    errors = {}
+    messages = [0]
+    lock = threading.Lock()
+
+    def run():
+        thread_latencies = []
+        thread_errors = {}
+        thread_messages = 0
+        while True:
+            request = request_factory(workload)
+            sent = time.perf_counter()
+            if sent >= end and (thread_latencies or thread_errors):
+                break
+            try:
+                response = method(request)
+                count = 1 if unary else sum(1 for _ in response)
+            except grpc.RpcError as e:
+                if sent >= measured_from:
+                    thread_errors[e.code().name] = thread_errors.get(e.code().name, 0) + 1
+                continue
+            if sent >= measured_from:
+                thread_latencies.append(time.perf_counter() - sent)
+                thread_messages += count
+
+        with lock:
+            latencies.extend(thread_latencies)
+            messages[0] += thread_messages
+            for code, count in thread_errors.items():
+                errors[code] = errors.get(code, 0) + count
+
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Calls started before the end may finish well after it, throughput is over the time they took
+    elapsed = max(time.perf_counter(), end) - measured_from
+
+    latencies.sort()
+    milliseconds = [latency * 1000 for latency in latencies]
+    return {
+        "operations": len(latencies),
+        "errors": errors,
+        "messages": messages[0],
+        "ops_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": sum(milliseconds) / len(milliseconds) if milliseconds else None,
+        "p50_ms": percentile(milliseconds, 50),
+        "p95_ms": percentile(milliseconds, 95),
+        "p99_ms": percentile(milliseconds, 99),
+        "max_ms": milliseconds[-1] if milliseconds else None,
+    }
+
+
+class ReferenceServerProcess:
+
+    def __init__(self, labels, max_workers):
+        """Reference server in a child process, so that it doesn't share the GIL with the measured client.
+
+        Args:
+            labels (int): Vertex labels and edge labels generated, each with a composite and a mixed index
+            max_workers (int): Server threads, at-least the highest concurrency so that calls aren't queued
+        """
+        self.labels = labels
+        self.max_workers = max_workers
+        self.process = None
+        self.address = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen([sys.executable, "-u", REFERENCE_SERVER, "--address", "localhost:0",
+                                         "--graph", GRAPH_NAME, "--vertex-labels", str(self.labels),
+                                         "--edge-labels", str(self.labels), "--max-workers", str(self.max_workers)],
+                                        stdout=subprocess.PIPE, universal_newlines=True)
+        line = self.process.stdout.readline()
+        if " on " not in line:
+            self.process.kill()
+            raise ValueError(f"Reference server didn't start: {line!r}")
+        self.address = line.rsplit(" on ", 1)[1].strip()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.process.terminate()
+        self.process.wait()
+
+
+def run(args):
+    rpcs = args.rpc or list(RPCS)
+    unknown = set(rpcs) - set(RPCS)
+    if unknown:
+        raise LookupError(f"Unknown RPCs {sorted(unknown)}, expecting some of {list(RPCS)}")
+
+    results = []
+    for size in ([args.labels] if args.target else args.sizes):
+        if args.target:
+            results.extend(__measure_all__(args, args.target, size, rpcs))
+        else:
+            with ReferenceServerProcess(size, max(args.concurrency)) as server:
+                results.extend(__measure_all__(args, server.address, size, rpcs))
+
+    report = {"meta": __meta__(args), "results": results}
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    return 0
+
+
+def compare(args):
+    with open(args.base) as base_file, open(args.new) as new_file:
+        base = {__result_key__(result): result for result in json.load(base_file)["results"]}
+        new = {__result_key__(result): result for result in json.load(new_file)["results"]}
+
+    regressions = 0
+    for key in sorted(base.keys() & new.keys(), key=str):
+        for metric in args.metric:
+            before, after = base[key].get(metric), new[key].get(metric)
+            if not before or after is None:
+                continue
+
+            change = (after - before) / before
+            # Throughput regresses when it drops, latencies when they grow
+            regressed = change < -args.threshold if metric == "ops_per_s" else change > args.threshold
+            if regressed:
+                regressions += 1
+                rpc, labels, concurrency = key
+                print(f"REGRESSION {rpc} labels={labels} concurrency={concurrency} {metric}: {before:.3f} -> "
+                      f"{after:.3f} ({change:+.1%})")
+
+    missing = base.keys() - new.keys()
+    if missing:
+        print(f"{len(missing)} results of {args.base} not in {args.new}")
+    print(f"{regressions} regressions beyond {args.threshold:.0%} over {len(base.keys() & new.keys())} results")
+
+    return 1 if regressions else 0
+
+
+def __measure_all__(args, address, size, rpcs):
+    channel = grpc.insecure_channel(address)
+    workload = Workload(size)
+    results = []
+
+    try:
+        for rpc in rpcs:
+            for concurrency in args.concurrency:
+                result = measure(channel, rpc, workload, concurrency, args.duration, args.warmup)
+                result.update(rpc=rpc, labels=size, concurrency=concurrency)
+                results.append(result)
+                print(f"{rpc} labels={size} concurrency={concurrency}: {result['ops_per_s']:.0f} ops/s, "
+                      f"p50 {__ms__(result['p50_ms'])} p95 {__ms__(result['p95_ms'])} "
+                      f"p99 {__ms__(result['p99_ms'])}, {sum(result['errors'].values())} errors", flush=True)
+    finally:
+        channel.close()
+
+    return results
+
+
+def __ms__(value):
+    return "-" if value is None else f"{value:.2f}ms"
+
+
+def __result_key__(result):
+    return result["rpc"], result["labels"], result["concurrency"]
+
+
+def __meta__(args):
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                         stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "grpc": grpc.__version__,
+        "machine": platform.machine(),
+        "target": args.target,
+        "duration": args.duration,
+        "warmup": args.warmup,
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run_parser = commands.add_parser("run", help="Measure latency and throughput of every RPC per schema size and "
+                                                 "concurrency")
+    run_parser.add_argument('--output', type=str, default="benchmark.json")
+    run_parser.add_argument('--rpc', type=str, action='append', default=None, choices=list(RPCS),
+                            help="RPC to measure, may be repeated. Defaults to all of them")
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                            help="Vertex and edge labels of the reference server schema, one server per size")
+    run_parser.add_argument('--concurrency', type=int, nargs='+', default=DEFAULT_CONCURRENCY)
+    run_parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help="Seconds measured per result")
+    run_parser.add_argument('--warmup', type=float, default=DEFAULT_WARMUP, help="Seconds not measured first")
+    run_parser.add_argument('--target', type=str, default=None, metavar="HOST:PORT",
+                            help="Measure this server instead of starting reference servers, its schema must have "
+                                 "been generated by SchemaStore.populate")
+    run_parser.add_argument('--labels', type=int, default=DEFAULT_SIZES[0],
+                            help="Labels generated on the --target server")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Flag results of a run worse than a base run, exits with 1 "
+                                                         "when any is")
+    compare_parser.add_argument('base', type=str)
+    compare_parser.add_argument('new', type=str)
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative change tolerated, 0.1 for 10%%")
+    compare_parser.add_argument('--metric', type=str, action='append', default=None,
+                                choices=["mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "ops_per_s"])
+    compare_parser.set_defaults(func=compare)
+
+    return parser
+
+
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+    if args.command == "compare" and args.metric is None:
+        args.metric = DEFAULT_METRICS
+
+    sys.exit(args.func(args))
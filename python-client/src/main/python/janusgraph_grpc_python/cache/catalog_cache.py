@@ -0,0 +1,96 @@
+import threading
+import time
+
+from schema.schema_catalog import SchemaCatalog
+from .schema_cache import SchemaCache
+
+DEFAULT_RELOAD_INTERVAL = 60
+
+
+class CatalogCache:
+
+    def __init__(self, catalog, cache=None, reload_interval=DEFAULT_RELOAD_INTERVAL):
+        """SchemaCache interface in front of a read-only SchemaCatalog. Lookups are served from the cache, then
+        from the catalog. Written through and invalidated lookups shadow the catalog until it is rebuilt, so a
+        label ensured by this process is never answered from an older catalog.
+
+        Args:
+            catalog (SchemaCatalog):
+            cache (SchemaCache): Cache for the written through lookups. Defaults to SchemaCache()
+            reload_interval (float): Seconds between checks for a rebuilt catalog file, see reload(). None never
+                reloads it
+        """
+        self.catalog = catalog
+        self.cache = SchemaCache() if cache is None else cache
+        self.reload_interval = reload_interval
+
+        # (graph_name, element, name) keys as passed to put() and invalidate(), element and name may be None
+        self.SHADOWED = set()
+        self.LOCK = threading.Lock()
+        self.reload_at = None if reload_interval is None else time.monotonic() + reload_interval
+
+    def __len__(self):
+        return len(self.catalog) + len(self.cache)
+
+    def get(self, graph_name, element, name):
+        """
+        Returns:
+            list: Cached or catalog messages, None when neither has the lookup
+        """
+        if self.reload_at is not None and self.reload_at <= time.monotonic():
+            self.reload()
+
+        messages = self.cache.get(graph_name, element, name)
+        if messages is not None or self.__is_shadowed__(graph_name, element, name):
+            return messages
+
+        # Replaced by reload(), the previous catalog stays mapped until this lookup is done with it
+        catalog = self.catalog
+        if name == "ALL":
+            messages = list(catalog.get_labels(graph_name, element))
+            # An empty listing more likely means the context isn't part of the catalog
+            return messages or None
+
+        label = catalog.get_label(graph_name, element, name)
+        return None if label is None else [label]
+
+    def put(self, graph_name, element, name, messages):
+        with self.LOCK:
+            self.SHADOWED.add((graph_name, element, name))
+        self.cache.put(graph_name, element, name, messages)
+
+    def invalidate(self, graph_name, element=None, name=None):
+        with self.LOCK:
+            self.SHADOWED.add((graph_name, element, name))
+        self.cache.invalidate(graph_name, element, name)
+
+    def clear(self):
+        self.cache.clear()
+
+    def reload(self):
+        """Opens the catalog file again when it was rebuilt, e.g. by a periodic schema_client catalog. The rebuilt
+        catalog holds the labels ensured before it was written, it stops being shadowed.
+
+        Returns:
+            bool: Whether the catalog was reloaded
+        """
+        with self.LOCK:
+            if self.reload_interval is not None:
+                self.reload_at = time.monotonic() + self.reload_interval
+            if not self.catalog.is_replaced():
+                return False
+
+            try:
+                catalog = SchemaCatalog(self.catalog.path)
+            except (OSError, ValueError) as e:
+                print(f"Not reloading schema catalog: {e}")
+                return False
+
+            self.catalog = catalog
+            self.SHADOWED.clear()
+            return True
+
+    def __is_shadowed__(self, graph_name, element, name):
+        shadowed = self.SHADOWED
+        return ((graph_name, element, name) in shadowed or (graph_name, element, None) in shadowed
+                or (graph_name, None, None) in shadowed)
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class SchemaCache:
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None):
+        """In-memory cache of VertexLabel/EdgeLabel lookups keyed by (graphName, element kind, label name).
+        Entries expire after ttl seconds and the least recently used ones are evicted once either
+        max_entries or max_bytes (serialized size of the cached messages) is exceeded.
+
+        Args:
+            ttl (float): Seconds an entry stays valid. None keeps entries until evicted.
+            max_entries (int): Maximum number of cached lookups. None for unbounded.
+            max_bytes (int): Maximum serialized size of all cached messages. None for unbounded.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # key -> (expires_at, messages, size). Ordered from least to most recently used
+        self.ENTRIES = OrderedDict()
+        self.LOCK = threading.Lock()
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.ENTRIES)
+
+    def get(self, graph_name, element, name):
+        """
+        Args:
+            graph_name (str):
+            element (str): VertexLabel or EdgeLabel
+            name (str): Label name or ALL for the full listing
+
+        Returns:
+            list: Cached messages or None when missing/expired
+        """
+        key = (graph_name, element, name)
+
+        with self.LOCK:
+            entry = self.ENTRIES.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, messages, _ = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                self.__remove__(key)
+                self.misses += 1
+                return None
+
+            self.ENTRIES.move_to_end(key)
+            self.hits += 1
+            return messages
+
+    def put(self, graph_name, element, name, messages):
+        """
+        Args:
+            graph_name (str):
+            element (str): VertexLabel or EdgeLabel
+            name (str): Label name or ALL for the full listing
+            messages (list): Messages as streamed by the server
+        """
+        key = (graph_name, element, name)
+        messages = list(messages)
+        size = sum(message.ByteSize() for message in messages)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self.LOCK:
+            if key in self.ENTRIES:
+                self.__remove__(key)
+
+            self.ENTRIES[key] = (expires_at, messages, size)
+            self.size += size
+            self.__evict__()
+
+    def invalidate(self, graph_name, element=None, name=None):
+        """Drops every entry matching the given graph_name and, when passed, element and name"""
+        with self.LOCK:
+            keys = [key for key in self.ENTRIES
+                    if key[0] == graph_name
+                    and (element is None or key[1] == element)
+                    and (name is None or key[2] == name)]
+
+            for key in keys:
+                self.__remove__(key)
+
+    def clear(self):
+        with self.LOCK:
+            self.ENTRIES.clear()
+            self.size = 0
+
+    def __remove__(self, key):
+        _, _, size = self.ENTRIES.pop(key)
+        self.size -= size
+
+    def __evict__(self):
+        while self.ENTRIES and ((self.max_entries is not None and len(self.ENTRIES) > self.max_entries)
+                                or (self.max_bytes is not None and self.size > self.max_bytes)):
+            _, (_, _, size) = self.ENTRIES.popitem(last=False)
+            self.size -= size
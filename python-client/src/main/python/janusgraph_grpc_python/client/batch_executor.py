@@ -0,0 +1,98 @@
+import shlex
+from collections import deque, namedtuple
+from collections.abc import Iterable
+
+from graph_operation.command_action.graph_operation_action import GraphOperationAction
+from connection.future_stub import FutureStub, UnaryFuture
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+BatchResult = namedtuple("BatchResult", ["index", "op", "command", "responses", "error"])
+
+
+def parse_batch_line(line, default_op="GET"):
+    """Parses a batch file line, i.e. the values of one --arg optionally prefixed by GET or PUT.
+
+    Args:
+        line (str): e.g. "PUT VertexLabel newVertex properties=prop1,prop2"
+        default_op (str): Operation used when the line has no GET/PUT prefix
+
+    Returns:
+        tuple: (op, GraphOperation) or None for blank lines and # comments
+    """
+    values = shlex.split(line, comments=True)
+    if len(values) == 0:
+        return None
+
+    op = default_op
+    if values[0] in ["GET", "PUT"]:
+        op, *values = values
+
+    return op, GraphOperationAction.build_operation(values)
+
+
+class BatchExecutor:
+
+    def __init__(self, channel, max_in_flight=DEFAULT_MAX_IN_FLIGHT, cache=None):
+        """Executes many commands over one channel, keeping up to max_in_flight RPCs outstanding.
+
+        Args:
+            channel (grpc.Channel):
+            max_in_flight (int): Number of RPCs issued before waiting for the oldest one
+            cache (SchemaCache):
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at-least 1. Got {max_in_flight}")
+
+        self.channel = channel
+        self.max_in_flight = max_in_flight
+        self.cache = cache
+
+    def __submit__(self, op, action):
+        action.set_operation(op)
+        action.set_channel(self.channel)
+        action.set_stub_wrapper(FutureStub)
+
+        if self.cache is not None:
+            action.set_cache(self.cache)
+
+        return action.get_processor().operate()
+
+    @staticmethod
+    def __resolve__(index, op, action, response, error):
+        if error is None:
+            try:
+                if isinstance(response, UnaryFuture):
+                    responses = [response.result()]
+                elif isinstance(response, Iterable):
+                    responses = list(response)
+                else:
+                    responses = [response]
+            except Exception as e:
+                return BatchResult(index, op, action, None, e)
+
+            return BatchResult(index, op, action, responses, None)
+
+        return BatchResult(index, op, action, None, error)
+
+    def execute(self, commands):
+        """
+        Args:
+            commands (Iterable[tuple]): (op, GraphOperation) pairs
+
+        Returns:
+            Generator[BatchResult]: One result per command, in input order
+        """
+        in_flight = deque()
+
+        for index, (op, action) in enumerate(commands):
+            try:
+                in_flight.append((index, op, action, self.__submit__(op, action), None))
+            except Exception as e:
+                in_flight.append((index, op, action, None, e))
+
+            if len(in_flight) >= self.max_in_flight:
+                yield self.__resolve__(*in_flight.popleft())
+
+        while in_flight:
+            yield self.__resolve__(*in_flight.popleft())
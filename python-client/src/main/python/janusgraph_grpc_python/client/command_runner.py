@@ -0,0 +1,96 @@
+import argparse
+from collections.abc import Iterable
+
+from graph_operation.command_action.graph_operation_action import GraphOperationAction
+from client.management_shim import DEFAULT_DAEMON_SOCKET
+from client.batch_executor import DEFAULT_MAX_IN_FLIGHT
+from schema.snapshot_store import DEFAULT_REFRESH_INTERVAL
+
+
+def build_parser(parser_class=argparse.ArgumentParser):
+    """Argument parser shared by management_client and the daemon executing forwarded commands
+
+    Args:
+        parser_class (type): argparse.ArgumentParser or a subclass of it
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    parser = parser_class()
+
+    parser.add_argument('--host', type=str)
+    parser.add_argument('--port', default=10182, type=int)
+    parser.add_argument('--op', type=str, default="GET")
+    parser.add_argument('--arg', action=GraphOperationAction)
+
+    parser.add_argument('--batch', action='store_true',
+                        help="Execute every --arg (and --batch-file command) instead of only the first one")
+    parser.add_argument('--batch-file', type=str, default=None,
+                        help="File with one command per line, optionally prefixed by GET/PUT. - reads stdin")
+    parser.add_argument('--max-in-flight', type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="Batch only. Number of RPCs kept in flight on the channel")
+
+    parser.add_argument('--graphs', type=str, default=None,
+                        help="Run every --arg against all graph contexts whose graphName matches this glob, e.g. '*'")
+
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running and execute commands forwarded by management_shim.py over --socket")
+    parser.add_argument('--socket', type=str, default=DEFAULT_DAEMON_SOCKET)
+    parser.add_argument('--cache-ttl', type=float, default=None,
+                        help="Daemon only. Cache label lookups for this many seconds")
+    parser.add_argument('--snapshot', type=str, default=None,
+                        help="Serve label lookups from this schema snapshot file, written by schema_client.py snapshot. "
+                             "It is fetched when missing and, by the daemon, refreshed in the background")
+    parser.add_argument('--snapshot-interval', type=float, default=DEFAULT_REFRESH_INTERVAL,
+                        help="Daemon only. Seconds between snapshot refreshes")
+    parser.add_argument('--catalog', type=str, default=None,
+                        help="Serve label lookups from this memory-mapped schema catalog, written by "
+                             "schema_client.py catalog")
+    parser.add_argument('--lazy-decoding', action='store_true',
+                        help="Daemon only. Keep responses, and the cached ones, serialized until a field is read")
+    parser.add_argument('--no-single-flight', action='store_true',
+                        help="Daemon only. Don't coalesce identical concurrent GET requests into one RPC")
+
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Serve the client RPC metrics in the Prometheus text format on this port, e.g. for "
+                             "the daemon")
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help="Write the client RPC metrics in the Prometheus text format to this file on exit, for "
+                             "the node_exporter textfile collector")
+
+    return parser
+
+
+def operate(action, op, channel, cache=None, stub_wrapper=None, lazy_decoding=False):
+    """Runs a single parsed --arg command.
+
+    Args:
+        action (GraphOperation):
+        op (str): GET or PUT
+        channel (grpc.Channel):
+        cache (SchemaCache):
+        stub_wrapper (Callable): See GraphOperation.set_stub_wrapper
+        lazy_decoding (bool): See GraphOperation.set_lazy_decoding
+
+    Returns:
+        The response, or an iterator of responses for streaming RPCs
+    """
+    action.set_operation(op)
+    action.set_channel(channel)
+
+    if cache is not None:
+        action.set_cache(cache)
+    if stub_wrapper is not None:
+        action.set_stub_wrapper(stub_wrapper)
+    action.set_lazy_decoding(lazy_decoding)
+
+    processor = action.get_processor()
+
+    return processor.operate()
+
+
+def render(response_it):
+    if isinstance(response_it, Iterable):
+        return [str(resp) for resp in response_it]
+    else:
+        return [str(response_it)]
@@ -0,0 +1,62 @@
+import fnmatch
+from collections import namedtuple
+
+from management import management_pb2, management_pb2_grpc
+from connection.channel_pool import get_channel_pool
+from client.batch_executor import BatchExecutor, DEFAULT_MAX_IN_FLIGHT
+
+FanOutResult = namedtuple("FanOutResult", ["graph_name", "op", "command", "responses", "error"])
+
+
+class ContextFanOut:
+
+    def __init__(self, channel, graph_filter="*", max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """Runs an operation against every graph context served by DefaultJanusGraphManager.
+
+        Args:
+            channel (grpc.Channel):
+            graph_filter (str): fnmatch glob the graphName of a context must match
+            max_in_flight (int): Number of contexts operated on concurrently
+        """
+        self.channel = channel
+        self.graph_filter = graph_filter
+        self.max_in_flight = max_in_flight
+
+    def get_graph_names(self):
+        """Streams AccessContext.GetContexts
+
+        Returns:
+            list[str]: graphName of every context matching graph_filter
+        """
+        service = get_channel_pool().get_stub(self.channel, management_pb2_grpc.AccessContextStub)
+
+        return [context.graphName for context in service.GetContexts(management_pb2.GetContextsRequest())
+                if fnmatch.fnmatchcase(context.graphName, self.graph_filter)]
+
+    def operate(self, commands):
+        """
+        Args:
+            commands (Iterable[tuple]): (op, GraphOperation) pairs to run on every context
+
+        Returns:
+            Generator[FanOutResult]: Results grouped by command, then by context in GetContexts order
+
+        Raises:
+            LookupError: When no context matches graph_filter, raised by the first next()
+        """
+        graph_names = self.get_graph_names()
+        if not graph_names:
+            raise LookupError(f"No context matches {self.graph_filter}")
+        executor = BatchExecutor(self.channel, self.max_in_flight)
+
+        def per_context_commands():
+            # Requests are built when BatchExecutor submits a command, which happens right after it is yielded,
+            # so the same GraphOperation can be pointed at the next context for the next command
+            for op, action in commands:
+                for graph_name in graph_names:
+                    action.set_graph_name(graph_name)
+                    yield op, action
+
+        for result in executor.execute(per_context_commands()):
+            yield FanOutResult(graph_names[result.index % len(graph_names)], result.op, result.command,
+                               result.responses, result.error)
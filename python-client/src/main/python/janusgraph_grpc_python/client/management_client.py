@@ -1,11 +1,13 @@
-import argparse
+import atexit
 from collections.abc import Iterable
 import grpc
 import sys, os
 sys.path.append(os.path.abspath(os.getcwd() + "../../"))
 print(sys.path[-2:])
 
-from graph_operation.command_action.graph_operation_action import GraphOperationAction
+from client.command_runner import build_parser
+from connection.channel_pool import get_channel_pool
+from connection.rpc_metrics import get_rpc_metrics
 
 
 def switcher(element, data):
@@ -21,15 +23,111 @@ def switcher(element, data):
 
 
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser()
-
-    parser.add_argument('--host', type=str)
-    parser.add_argument('--port', default=10182, type=int)
-    parser.add_argument('--op', type=str, default="GET")
-    parser.add_argument('--arg', action=GraphOperationAction)
+    parser = build_parser()
 
     args = parser.parse_args()
 
+    if args.metrics_port is not None:
+        get_rpc_metrics().serve(args.metrics_port)
+    if args.metrics_file is not None:
+        # Every mode leaves through sys.exit() or the end of the script
+        atexit.register(get_rpc_metrics().write_textfile, args.metrics_file)
+
+    if args.daemon:
+        from client.management_daemon import ManagementDaemon
+        from cache.schema_cache import SchemaCache
+
+        cache = None if args.cache_ttl is None else SchemaCache(ttl=args.cache_ttl)
+        store = None
+
+        if args.snapshot is not None:
+            from schema.snapshot_store import SnapshotStore
+
+            if args.host is None:
+                parser.error("--snapshot needs the --host to refresh it from")
+            if cache is None:
+                cache = SchemaCache(ttl=None, max_entries=None)
+
+            store = SnapshotStore(args.snapshot, f'{args.host}:{args.port}', refresh_interval=args.snapshot_interval)
+            store.load()
+            store.warm(cache)
+            store.start()
+
+        if args.catalog is not None:
+            from cache.catalog_cache import CatalogCache
+            from schema.schema_catalog import SchemaCatalog
+
+            cache = CatalogCache(SchemaCatalog(args.catalog), cache)
+
+        daemon = ManagementDaemon(args.socket, cache=cache, single_flight=not args.no_single_flight,
+                                  lazy_decoding=args.lazy_decoding)
+        print(f"Serving management commands on {args.socket}")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if store is not None:
+                store.stop()
+            daemon.server_close()
+        sys.exit(0)
+
+    if args.graphs is not None:
+        from client.context_fan_out import ContextFanOut
+
+        channel_pool = get_channel_pool()
+        fan_out = ContextFanOut(channel_pool.get_channel(f'{args.host}:{args.port}'), args.graphs, args.max_in_flight)
+
+        failures = 0
+        print(50*"-")
+        try:
+            for result in fan_out.operate([(args.op, action) for action in args.arg]):
+                if result.error is None:
+                    for resp in result.responses:
+                        print(f"graphName={result.graph_name}: {resp}")
+                else:
+                    failures += 1
+                    print(f"graphName={result.graph_name}: {result.op} {result.command} FAILED "
+                          f"{type(result.error).__name__}: {result.error}")
+        except LookupError as e:
+            # A mistyped --graphs glob must not look like a run without failures
+            failures += 1
+            print(e)
+        print(50*"-")
+
+        channel_pool.close()
+        sys.exit(1 if failures else 0)
+
+    if args.batch or args.batch_file is not None:
+        from client.batch_executor import BatchExecutor, parse_batch_line
+
+        commands = [(args.op, action) for action in args.arg or []]
+
+        if args.batch_file is not None:
+            batch_file = sys.stdin if args.batch_file == "-" else open(args.batch_file)
+            with batch_file:
+                commands.extend(command for command in (parse_batch_line(line, args.op) for line in batch_file)
+                                if command is not None)
+
+        channel_pool = get_channel_pool()
+        executor = BatchExecutor(channel_pool.get_channel(f'{args.host}:{args.port}'), args.max_in_flight)
+
+        failures = 0
+        print(50*"-")
+        for result in executor.execute(commands):
+            if result.error is None:
+                print(f"[{result.index}] {result.op} {result.command}: OK")
+                for resp in result.responses:
+                    print(resp)
+            else:
+                failures += 1
+                print(f"[{result.index}] {result.op} {result.command}: FAILED {type(result.error).__name__}: {result.error}")
+        print(50*"-")
+        print(f"Executed {len(commands)} commands, {failures} failed")
+
+        channel_pool.close()
+        sys.exit(1 if failures else 0)
+
     host = args.host
     port = args.port
     op = args.op
@@ -43,11 +141,29 @@ if __name__ == '__main__':
 
     print("=======================")
 
-    channel = grpc.insecure_channel(f'{host}:{port}')
+    channel_pool = get_channel_pool()
+    channel = channel_pool.get_channel(f'{host}:{port}')
 
     action.set_operation(op)
     action.set_channel(channel)
 
+    if args.snapshot is not None:
+        from cache.schema_cache import SchemaCache
+        from schema.snapshot_store import SnapshotStore
+
+        cache = SchemaCache(ttl=None, max_entries=None)
+        store = SnapshotStore(args.snapshot, f'{host}:{port}')
+        if not store.load():
+            store.refresh()
+        store.warm(cache)
+        action.set_cache(cache)
+
+    if args.catalog is not None:
+        from cache.catalog_cache import CatalogCache
+        from schema.schema_catalog import SchemaCatalog
+
+        action.set_cache(CatalogCache(SchemaCatalog(args.catalog), action.CACHE))
+
     processor = action.get_processor()
 
     print("================")
@@ -64,5 +180,5 @@ if __name__ == '__main__':
         print(response_it)
     print(50*"-")
 
-    channel.close()
+    channel_pool.close()
     pass
@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import socketserver
+import stat
+
+from client.command_runner import build_parser, operate, render
+from connection.channel_pool import get_channel_pool
+from connection.single_flight import SingleFlightStub
+
+# management_client options the daemon doesn't run per forwarded command. They are rejected instead of ignored, the
+# daemon-wide ones (cache, snapshot, catalog, decoding) are given when starting it
+UNSUPPORTED_OPTIONS = ["batch", "batch_file", "max_in_flight", "graphs", "daemon", "socket", "cache_ttl", "snapshot",
+                       "snapshot_interval", "catalog", "lazy_decoding", "no_single_flight", "metrics_port",
+                       "metrics_file"]
+
+
+class DaemonArgumentParser(argparse.ArgumentParser):
+    """Raises instead of exiting so that a malformed forwarded command doesn't stop the daemon"""
+
+    def error(self, message):
+        raise ValueError(f"{self.format_usage()}error: {message}")
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        # A malformed request is answered too, the shim waits for a reply line
+        try:
+            argv = json.loads(self.rfile.readline().decode("utf-8"))["argv"]
+
+            if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+                raise TypeError(f"argv must be a list of strings. Got {argv!r}")
+        except (ValueError, KeyError, TypeError) as e:
+            status, output = 2, [f"Malformed request {type(e).__name__}: {e}"]
+        else:
+            status, output = self.server.execute(argv)
+
+        self.wfile.write(json.dumps({"status": status, "output": output}).encode("utf-8") + b"\n")
+
+
+class ManagementDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, channel_pool=None, cache=None, single_flight=True, lazy_decoding=False):
+        """Keeps the interpreter, the imported grpc/management_pb2 modules and pooled channels alive and runs
+        management_client commands forwarded by management_shim.py on a Unix socket.
+
+        Args:
+            socket_path (str): Path of the Unix socket to listen on, owner-only. A stale socket file is replaced.
+            channel_pool (ChannelPool): Defaults to the process wide pool
+            cache (SchemaCache): Optional cache shared by all forwarded commands
+            single_flight (bool): Let identical GET commands executing concurrently share one RPC
+            lazy_decoding (bool): Keep responses serialized until read, see GraphOperation.set_lazy_decoding
+        """
+        self.socket_path = socket_path
+        self.channel_pool = get_channel_pool() if channel_pool is None else channel_pool
+        self.cache = cache
+        self.stub_wrapper = SingleFlightStub if single_flight else None
+        self.lazy_decoding = lazy_decoding
+
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                raise FileExistsError(f"{socket_path} exists and is not a socket")
+            os.remove(socket_path)
+
+        super().__init__(socket_path, DaemonRequestHandler)
+
+    def server_bind(self):
+        super().server_bind()
+        # Forwarded commands can PUT schema changes: only the user running the daemon may connect. The socket isn't
+        # listening yet, so nobody can connect before this
+        os.chmod(self.socket_path, 0o600)
+
+    def execute(self, argv):
+        """
+        Args:
+            argv (list): management_client arguments
+
+        Returns:
+            tuple: (status, output lines). Status is 0 on success, 2 for an invalid command or one using
+            UNSUPPORTED_OPTIONS and 1 when the operation failed.
+        """
+        try:
+            parser = build_parser(DaemonArgumentParser)
+            args = parser.parse_args(argv)
+
+            if args.arg is None:
+                raise ValueError("Expecting an --arg to execute")
+            if len(args.arg) > 1:
+                raise ValueError(f"The daemon executes a single --arg, got {len(args.arg)}. "
+                                 f"Run batches with management_client.py --batch")
+
+            unsupported = [f"--{dest.replace('_', '-')}" for dest in UNSUPPORTED_OPTIONS
+                           if getattr(args, dest) != parser.get_default(dest)]
+            if unsupported:
+                raise ValueError(f"{', '.join(unsupported)} not supported by the daemon. Run the command with "
+                                 f"management_client.py")
+        except (Exception, SystemExit) as e:
+            return 2, [str(e)]
+
+        try:
+            channel = self.channel_pool.get_channel(f'{args.host}:{args.port}')
+
+            return 0, render(operate(args.arg[0], args.op, channel, self.cache, self.stub_wrapper,
+                                 self.lazy_decoding))
+        except Exception as e:
+            return 1, [f"{type(e).__name__}: {e}"]
+
+    def server_close(self):
+        super().server_close()
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        self.channel_pool.close()
@@ -0,0 +1,52 @@
+"""Thin client forwarding a management_client command to a running `management_client.py --daemon`.
+
+Only the standard library is imported so that a call costs an interpreter start and a Unix socket round
+trip instead of importing grpc/management_pb2 and opening a new channel.
+
+    python management_shim.py --host localhost --op GET --arg VertexLabel god
+"""
+import argparse
+import json
+import socket
+import sys
+
+DEFAULT_DAEMON_SOCKET = "/tmp/janusgraph_grpc_management.sock"
+
+
+def forward(argv, socket_path=DEFAULT_DAEMON_SOCKET):
+    """Sends argv to the daemon listening on socket_path.
+
+    Args:
+        argv (list): management_client arguments, e.g. ["--op", "GET", "--arg", "VertexLabel", "ALL"]
+        socket_path (str):
+
+    Returns:
+        dict: {"status": int, "output": [str]}
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps({"argv": argv}).encode("utf-8") + b"\n")
+            stream.flush()
+
+            return json.loads(stream.readline().decode("utf-8"))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--socket', type=str, default=DEFAULT_DAEMON_SOCKET)
+
+    args, forwarded = parser.parse_known_args()
+
+    try:
+        response = forward(forwarded, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No daemon listening on {args.socket}. Start one with `python management_client.py --daemon`",
+              file=sys.stderr)
+        sys.exit(3)
+
+    for line in response["output"]:
+        print(line)
+
+    sys.exit(response["status"])
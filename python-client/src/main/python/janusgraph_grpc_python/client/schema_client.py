@@ -0,0 +1,336 @@
+import argparse
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from connection.channel_pool import get_channel_pool
+from connection.rpc_metrics import get_rpc_metrics
+from schema.schema_manifest import load_manifest
+from schema.schema_applier import SchemaApplier, DEFAULT_MAX_IN_FLIGHT
+from schema.schema_diff import diff_manifest
+from schema.snapshot_store import SnapshotStore, fetch_snapshots
+from schema.schema_catalog import SchemaCatalog, write_catalog
+from schema.schema_lookup import SchemaLookup
+from analysis.index_coverage import IndexCoverage
+from analysis.index_advisor import IndexAdvisor, DEFAULT_CAPACITY, to_command
+from analysis.redundant_indices import IndexRedundancy
+from analysis.schema_linter import SchemaLinter, DEFAULT_MAX_PROPERTIES
+from schema.schema_snapshot import fetch_composite_index_labels
+from schema.schema_fingerprint import fingerprint_snapshot
+
+
+def apply(args, channel):
+    manifest = load_manifest(args.manifest)
+
+    if args.diff:
+        schema_diff = diff_manifest(channel, manifest)
+        operations = schema_diff.get_operations()
+        print(f"Skipping {len(schema_diff.unchanged)} unchanged and {len(schema_diff.conflicts)} conflicting operations")
+    else:
+        operations = manifest.get_operations()
+
+    print(f"Applying {manifest}: {len(operations)} operations")
+
+    summary = SchemaApplier(channel, args.max_in_flight).apply(operations)
+    for line in summary.report():
+        print(line)
+
+    return 1 if summary.failures or summary.skipped else 0
+
+
+def diff(args, channel):
+    schema_diff = diff_manifest(channel, load_manifest(args.manifest))
+
+    for line in schema_diff.report():
+        print(line)
+
+    return 0
+
+
+def snapshot(args, channel):
+    store = SnapshotStore(args.file, f'{args.host}:{args.port}', args.graph, mixed_indices=not args.no_mixed_indices)
+    store.refresh()
+
+    for graph_name, schema_snapshot in store.snapshots.items():
+        print(f"{schema_snapshot}: {len(schema_snapshot.composite_vertex_indices)} composite vertex indices, "
+              f"{len(schema_snapshot.composite_edge_indices)} composite edge indices")
+    print(f"Wrote {os.path.getsize(args.file)} bytes to {args.file}")
+
+    return 0
+
+
+def catalog(args, channel):
+    write_catalog(args.file, fetch_snapshots(channel, args.graph, not args.no_mixed_indices).values())
+
+    with SchemaCatalog(args.file) as schema_catalog:
+        print(f"Wrote {schema_catalog}: {os.path.getsize(args.file)} bytes")
+
+    return 0
+
+
+def load_store(args, channel):
+    """SnapshotStore loaded from --snapshot, holding --graph"""
+    store = SnapshotStore(args.snapshot, f'{args.host}:{args.port}', [args.graph])
+    if not store.load():
+        raise ValueError(f"Could not load {args.snapshot}")
+    if store.get_snapshot(args.graph) is None:
+        raise LookupError(f"{args.snapshot} has no context {args.graph}")
+
+    return store
+
+
+def load_lookup(args, channel):
+    """SchemaLookup of --graph, read from --snapshot when given, fetched from the server otherwise"""
+    if args.snapshot is None:
+        return SchemaLookup.from_snapshot(fetch_snapshots(channel, [args.graph])[args.graph])
+
+    return load_store(args, channel).get_lookup(args.graph)
+
+
+def load_constrained_lookup(args, channel):
+    """load_lookup() and the label constraints of the composite indices, None when read from --snapshot: snapshots
+    don't hold them"""
+    if args.snapshot is None:
+        schema_snapshot = fetch_snapshots(channel, [args.graph])[args.graph]
+        return SchemaLookup.from_snapshot(schema_snapshot), fetch_composite_index_labels(channel, schema_snapshot)
+
+    return load_store(args, channel).get_lookup(args.graph), None
+
+
+def lookup(args, channel):
+    schema_lookup = load_lookup(args, channel)
+
+    print(schema_lookup)
+    for property_name in args.property:
+        print(f"{property_name}:")
+        for label in schema_lookup.get_labels_with_property(property_name):
+            print(f"  label {label.name}")
+        for index in schema_lookup.get_indices_with_property(property_name):
+            print(f"  {type(index).__name__} {index.name} on {', '.join(prop.name for prop in index.properties)}")
+
+    for data_type in args.data_type or []:
+        print(f"{data_type}: {', '.join(schema_lookup.get_properties_of_type(data_type))}")
+
+    return 0
+
+
+def coverage(args, channel):
+    schema_lookup, index_labels = load_constrained_lookup(args, channel)
+    if index_labels is None:
+        print("# Composite index label constraints unknown from a snapshot, taken as usable for every label")
+    index_coverage = IndexCoverage(schema_lookup, index_labels)
+
+    full_scans = 0
+    for traversal in args.traversal:
+        print(traversal)
+        try:
+            results = index_coverage.check_gremlin(traversal)
+        except ValueError as e:
+            full_scans += 1
+            print(f"  not analysed: {e}")
+            continue
+
+        for result in results:
+            full_scans += result.is_full_scan()
+            print(f"  {result}")
+
+    return 1 if full_scans else 0
+
+
+def advise(args, channel):
+    schema_lookup, index_labels = (None, None) if args.no_schema else load_constrained_lookup(args, channel)
+    if schema_lookup is not None and index_labels is None:
+        print("# Composite index label constraints unknown from a snapshot, taken as usable for every label")
+    advisor = IndexAdvisor(schema_lookup, args.capacity, index_labels)
+
+    log = sys.stdin if args.log == "-" else open(args.log)
+    with log:
+        advisor.process(log)
+
+    print(f"# {advisor.lines} log lines, {advisor.skipped} without a lookup, {len(advisor.patterns)} patterns tracked")
+    for recommendation in advisor.recommend(args.top):
+        if recommendation.weight < args.min_count:
+            break
+        patterns = " | ".join(", ".join(f"{prop} {op}" for prop, op in pattern) for pattern in recommendation.patterns)
+        print(f"# serves at least {recommendation.weight} lookups: {patterns}")
+        if recommendation.label is None:
+            # Ensure*Index RPCs exist per label only, PUT ... ALL INDEX isn't implemented
+            print(f"# {to_command(recommendation)} (restrict these lookups with hasLabel() to index them)")
+        else:
+            print(to_command(recommendation))
+
+    return 0
+
+
+def redundant(args, channel):
+    if args.snapshot is None:
+        schema_snapshot = fetch_snapshots(channel, [args.graph])[args.graph]
+        redundancy = IndexRedundancy(SchemaLookup.from_snapshot(schema_snapshot),
+                                     fetch_composite_index_labels(channel, schema_snapshot))
+    else:
+        # Snapshots don't hold the label constraints of the composite indices
+        redundancy = IndexRedundancy(load_lookup(args, channel))
+
+    for line in redundancy.report():
+        print(line)
+
+    return 0
+
+
+def lint(args, channel):
+    if args.snapshot is None:
+        schema_snapshot = fetch_snapshots(channel, [args.graph])[args.graph]
+        schema_lookup = SchemaLookup.from_snapshot(schema_snapshot)
+        index_labels = fetch_composite_index_labels(channel, schema_snapshot)
+    else:
+        schema_lookup, index_labels = load_lookup(args, channel), None
+
+    issues = SchemaLinter(schema_lookup, index_labels, args.max_properties, args.high_degree or (),
+                          args.disable or ()).lint()
+    for issue in issues:
+        print(f"{issue.rule}: {issue.element} {issue.name}: {issue.message}")
+    print(f"{len(issues)} issues")
+
+    return 1 if issues else 0
+
+
+def fingerprint(args, channel):
+    if args.snapshot is None:
+        schema_snapshot = fetch_snapshots(channel, [args.graph])[args.graph]
+        schema_fingerprint = fingerprint_snapshot(schema_snapshot,
+                                                  fetch_composite_index_labels(channel, schema_snapshot))
+    else:
+        # Snapshots don't hold the label constraints of the composite indices, the other side is hashed without too
+        schema_snapshot = load_store(args, channel).get_snapshot(args.graph)
+        schema_fingerprint = fingerprint_snapshot(schema_snapshot)
+
+    if args.compare is None:
+        for path, digest in sorted(schema_fingerprint.get_hashes(args.depth).items()):
+            print(f"{digest} {'/'.join((args.graph,) + path)}")
+        return 0
+
+    # Contexts may be named differently on the other cluster, the digests don't cover the root name
+    other_channel = get_channel_pool().get_channel(args.compare)
+    other_graph = args.compare_graph or args.graph
+    other_snapshot = fetch_snapshots(other_channel, [other_graph])[other_graph]
+    other_fingerprint = fingerprint_snapshot(other_snapshot, None if args.snapshot is not None else
+                                             fetch_composite_index_labels(other_channel, other_snapshot))
+
+    differences = schema_fingerprint.diff(other_fingerprint)
+    for path, status in differences:
+        print(f"{status.upper()} {'/'.join(path) or args.graph}")
+    print(f"{schema_fingerprint.hexdigest()} {args.graph}")
+    print(f"{other_fingerprint.hexdigest()} {other_graph} on {args.compare}: {len(differences)} differences")
+
+    return 1 if differences else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--host', type=str)
+    parser.add_argument('--port', default=10182, type=int)
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help="Write the client RPC metrics in the Prometheus text format to this file on exit, for "
+                             "the node_exporter textfile collector")
+
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    apply_parser = commands.add_parser("apply", help="Ensure every label and index of a JSON/YAML schema manifest")
+    apply_parser.add_argument('manifest', type=str)
+    apply_parser.add_argument('--max-in-flight', type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    apply_parser.add_argument('--diff', action='store_true',
+                              help="Fetch the live schema first and only send the operations which change it")
+    apply_parser.set_defaults(func=apply)
+
+    diff_parser = commands.add_parser("diff", help="Dry-run report of what apply --diff would send")
+    diff_parser.add_argument('manifest', type=str)
+    diff_parser.set_defaults(func=diff)
+
+    snapshot_parser = commands.add_parser("snapshot", help="Write the schema of the contexts to a snapshot file")
+    snapshot_parser.add_argument('file', type=str)
+    snapshot_parser.add_argument('--graph', type=str, action='append', default=None,
+                                 help="Context to snapshot, may be repeated. Defaults to every context")
+    snapshot_parser.add_argument('--no-mixed-indices', action='store_true',
+                                 help="Skip the mixed indices, which are listed with one RPC per label")
+    snapshot_parser.set_defaults(func=snapshot)
+
+    catalog_parser = commands.add_parser("catalog", help="Write the schema of the contexts to a memory-mappable "
+                                                         "catalog file")
+    catalog_parser.add_argument('file', type=str)
+    catalog_parser.add_argument('--graph', type=str, action='append', default=None,
+                                help="Context to write, may be repeated. Defaults to every context")
+    catalog_parser.add_argument('--no-mixed-indices', action='store_true',
+                                help="Skip the mixed indices, which are listed with one RPC per label")
+    catalog_parser.set_defaults(func=catalog)
+
+    lookup_parser = commands.add_parser("lookup", help="Labels and indices carrying properties, properties of a "
+                                                       "data type")
+    lookup_parser.add_argument('property', type=str, nargs='*')
+    lookup_parser.add_argument('--data-type', type=str, action='append', default=None,
+                               help="List the properties declared with this PropertyDataType, may be repeated")
+    lookup_parser.set_defaults(func=lookup)
+
+    coverage_parser = commands.add_parser("coverage", help="Index serving the has() filters of Gremlin traversals, "
+                                                           "exits with 1 when one needs a full scan")
+    coverage_parser.add_argument('traversal', type=str, nargs='+', help="e.g. \"g.V().has('person', 'name', 'x')\"")
+    coverage_parser.set_defaults(func=coverage)
+
+    advise_parser = commands.add_parser("advise", help="Recommend indices for the most frequent uncovered lookups of "
+                                                       "a Gremlin query log, as a management_client batch file")
+    advise_parser.add_argument('log', type=str, help="One traversal per line, - reads stdin")
+    advise_parser.add_argument('--top', type=int, default=10)
+    advise_parser.add_argument('--min-count', type=int, default=1,
+                               help="Don't recommend indices serving fewer logged lookups")
+    advise_parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY,
+                               help="Number of distinct lookup patterns tracked")
+    advise_parser.add_argument('--no-schema', action='store_true',
+                               help="Don't fetch the schema, recommend even for patterns an index already serves")
+    advise_parser.set_defaults(func=advise)
+
+    redundant_parser = commands.add_parser("redundant", help="Duplicate composite indices and ones covered by a "
+                                                             "mixed index")
+    redundant_parser.set_defaults(func=redundant)
+
+    lint_parser = commands.add_parser("lint", help="Flag schema performance anti-patterns, exits with 1 when any is "
+                                                   "found")
+    lint_parser.add_argument('--max-properties', type=int, default=DEFAULT_MAX_PROPERTIES)
+    lint_parser.add_argument('--high-degree', type=str, action='append', default=None,
+                             help="Vertex label known to have very many edges, may be repeated")
+    lint_parser.add_argument('--disable', type=str, action='append', default=None, choices=SchemaLinter.RULES)
+    lint_parser.set_defaults(func=lint)
+
+    fingerprint_parser = commands.add_parser("fingerprint", help="Hash tree of the schema of a context, or the labels "
+                                                                 "and indices which differ on another cluster")
+    fingerprint_parser.add_argument('--depth', type=int, default=0,
+                                    help="0 prints the context hash only, 1 the label/index groups, 2 every label and "
+                                         "composite index, 3 the mixed indices")
+    fingerprint_parser.add_argument('--compare', type=str, default=None, metavar="HOST:PORT",
+                                    help="Compare with the same context on this server, exits with 1 when they differ")
+    fingerprint_parser.add_argument('--compare-graph', type=str, default=None,
+                                    help="Context to compare with on the other server. Defaults to --graph")
+    fingerprint_parser.set_defaults(func=fingerprint)
+
+    for schema_parser in (lookup_parser, coverage_parser, advise_parser, redundant_parser, lint_parser,
+                          fingerprint_parser):
+        schema_parser.add_argument('--graph', type=str, default="graph_berkleydb")
+        schema_parser.add_argument('--snapshot', type=str, default=None,
+                                   help="Read the schema from this snapshot file instead of the server")
+
+    return parser
+
+
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+
+    channel_pool = get_channel_pool()
+    channel = channel_pool.get_channel(f'{args.host}:{args.port}')
+
+    try:
+        status = args.func(args, channel)
+    finally:
+        channel_pool.close()
+        if args.metrics_file is not None:
+            get_rpc_metrics().write_textfile(args.metrics_file)
+
+    sys.exit(status)
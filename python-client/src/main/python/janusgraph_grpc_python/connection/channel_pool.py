@@ -0,0 +1,253 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+import grpc
+
+from connection.metrics_interceptor import MetricsInterceptor
+from connection.rpc_metrics import get_rpc_metrics
+
+# Keepalive pings keep idle HTTP/2 connections warm through NATs/load-balancers so a pooled
+# channel doesn't have to re-handshake after a quiet period.
+DEFAULT_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+DEFAULT_MAX_CHANNELS = 8
+DEFAULT_IDLE_TIMEOUT = 300
+
+
+class PooledChannel:
+
+    def __init__(self):
+        """State of one channel of a ChannelPool. The channel is set once it is opened with the usage interceptors
+        of this entry."""
+        self.channel = None
+        self.last_used = time.monotonic()
+        # Calls issued and not completed yet, streams until they are drained, failed or cancelled
+        self.in_flight = 0
+        # Removed from the pool while calls were in flight, closed once the last one completes
+        self.retired = False
+
+
+class UsageInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+
+    def __init__(self, pool, entry):
+        """Counts the calls in flight on a pooled channel from being issued to their status being received, through
+        the done callback, so that the pool doesn't close the channel under them.
+
+        Args:
+            pool (ChannelPool):
+            entry (PooledChannel):
+        """
+        self.pool = pool
+        self.entry = entry
+
+    def __intercept__(self, continuation, client_call_details, request):
+        self.pool.__call_started__(self.entry)
+        try:
+            call = continuation(client_call_details, request)
+        except BaseException:
+            self.pool.__call_done__(self.entry)
+            raise
+
+        # Blocking calls get an already completed outcome, which runs the callback right away
+        call.add_done_callback(lambda _: self.pool.__call_done__(self.entry))
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self.__intercept__(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self.__intercept__(continuation, client_call_details, request)
+
+
+class ChannelPool:
+
+    def __init__(self, max_size=DEFAULT_MAX_CHANNELS, idle_timeout=DEFAULT_IDLE_TIMEOUT, options=None,
+                 interceptors=None):
+        """Pool of long-lived gRPC channels keyed by target, with a stub cache per channel.
+
+        Args:
+            max_size (int): Maximum number of pooled channels. The least recently used one without calls in flight
+                is closed beyond this. When every channel has calls in flight, the least recently used one leaves
+                the pool and is closed once they complete.
+            idle_timeout (float): Seconds without calls in flight after which a channel is closed. None disables
+                eviction.
+            options (list): gRPC channel arguments. Defaults to DEFAULT_CHANNEL_OPTIONS.
+            interceptors (list): Client interceptors installed on every channel. Defaults to a MetricsInterceptor
+                recording into get_rpc_metrics(), [] installs none.
+        """
+        if max_size < 1:
+            raise ValueError(f"ChannelPool max_size must be at-least 1. Got {max_size}")
+
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.options = DEFAULT_CHANNEL_OPTIONS if options is None else options
+        self.interceptors = self.__default_interceptors__() if interceptors is None else interceptors
+
+        # target -> PooledChannel. Ordered from least to most recently used
+        self.CHANNELS = OrderedDict()
+        # channel -> {stub_class: stub}. Weak so that channels not owned by the pool are never kept alive
+        self.STUBS = weakref.WeakKeyDictionary()
+        self.LOCK = threading.RLock()
+
+    def __len__(self):
+        return len(self.CHANNELS)
+
+    def __default_interceptors__(self):
+        return [MetricsInterceptor(get_rpc_metrics())]
+
+    def __usage_interceptors__(self, entry):
+        return [UsageInterceptor(self, entry)]
+
+    def __create_channel__(self, target, entry):
+        # Usage is counted innermost, on the call objects grpc returns
+        channel = grpc.insecure_channel(target, options=self.options)
+        return grpc.intercept_channel(channel, *self.interceptors, *self.__usage_interceptors__(entry))
+
+    def get_channel(self, target):
+        """Returns a warm channel for target, opening one only if none is pooled yet.
+
+        Args:
+            target (str): host:port or unix:/path of the gRPC server
+
+        Returns:
+            grpc.Channel
+        """
+        with self.LOCK:
+            closing = self.__evict_idle__()
+
+            entry = self.CHANNELS.get(target)
+            if entry is None:
+                entry = PooledChannel()
+                entry.channel = self.__create_channel__(target, entry)
+                self.CHANNELS[target] = entry
+
+                while len(self.CHANNELS) > self.max_size:
+                    closing.extend(self.__retire__(self.__least_recently_used__(target)))
+            else:
+                self.CHANNELS.move_to_end(target)
+
+            entry.last_used = time.monotonic()
+
+        self.__close_channels__(closing)
+        return entry.channel
+
+    def get_stub(self, channel, stub_class):
+        """Returns a cached stub of stub_class bound to channel, building it on first use.
+
+        Args:
+            channel (grpc.Channel):
+            stub_class (type): One of the *Stub classes from management_pb2_grpc
+
+        Returns:
+            Instance of stub_class
+        """
+        with self.LOCK:
+            stubs = self.STUBS.get(channel)
+            if stubs is None:
+                stubs = {}
+                self.STUBS[channel] = stubs
+
+            stub = stubs.get(stub_class)
+            if stub is None:
+                stub = stub_class(channel)
+                stubs[stub_class] = stub
+
+            return stub
+
+    def evict_idle(self):
+        """Closes every channel without calls in flight which was not handed out or used for more than
+        idle_timeout seconds."""
+        with self.LOCK:
+            closing = self.__evict_idle__()
+
+        self.__close_channels__(closing)
+
+    def __evict_idle__(self):
+        if self.idle_timeout is None:
+            return []
+
+        deadline = time.monotonic() - self.idle_timeout
+        expired = [target for target, entry in self.CHANNELS.items()
+                   if entry.in_flight == 0 and entry.last_used < deadline]
+
+        closing = []
+        for target in expired:
+            closing.extend(self.__retire__(target))
+        return closing
+
+    def __least_recently_used__(self, opened):
+        # The least recently used channel without calls in flight, other than the one just opened
+        candidates = [target for target in self.CHANNELS if target != opened]
+        for target in candidates:
+            if self.CHANNELS[target].in_flight == 0:
+                return target
+        return candidates[0]
+
+    def __retire__(self, target):
+        # Returns the channels to close once the lock is released, none while calls are in flight on it
+        entry = self.CHANNELS.pop(target)
+        entry.retired = True
+        return [entry.channel] if entry.in_flight == 0 else []
+
+    def __call_started__(self, entry):
+        with self.LOCK:
+            entry.in_flight += 1
+            entry.last_used = time.monotonic()
+
+    def __call_done__(self, entry):
+        with self.LOCK:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+            retired = entry.retired and entry.in_flight == 0
+
+        if retired:
+            self.__close_retired__(entry.channel)
+
+    def __close_retired__(self, channel):
+        # Called from the done callback of the last call, possibly on the channel's own polling thread which
+        # close() waits for
+        threading.Thread(target=self.__close_channel__, args=(channel,), name="channel-pool-close",
+                         daemon=True).start()
+
+    def __close_channels__(self, channels):
+        for channel in channels:
+            self.__close_channel__(channel)
+
+    def __close_channel__(self, channel):
+        self.STUBS.pop(channel, None)
+        channel.close()
+
+    def close(self):
+        """Closes every pooled channel, cancelling the calls still in flight on them"""
+        with self.LOCK:
+            entries = list(self.CHANNELS.values())
+            self.CHANNELS.clear()
+            for entry in entries:
+                entry.retired = True
+
+        self.__close_channels__([entry.channel for entry in entries])
+
+CHANNEL_POOL = None
+_CHANNEL_POOL_LOCK = threading.Lock()
+
+
+def get_channel_pool():
+    """Returns the process wide ChannelPool, creating it with defaults on first call.
+
+    Returns:
+        ChannelPool
+    """
+    global CHANNEL_POOL
+
+    if CHANNEL_POOL is None:
+        with _CHANNEL_POOL_LOCK:
+            if CHANNEL_POOL is None:
+                CHANNEL_POOL = ChannelPool()
+    return CHANNEL_POOL
@@ -0,0 +1,55 @@
+import grpc
+
+
+class UnaryFuture(grpc.Future):
+    """grpc.Future of a unary RPC. The call object returned by .future() is also an iterator (of a
+    streaming RPC); hiding it lets callers tell unary futures from response streams."""
+
+    def __init__(self, future):
+        self.future = future
+
+    def cancel(self):
+        return self.future.cancel()
+
+    def cancelled(self):
+        return self.future.cancelled()
+
+    def running(self):
+        return self.future.running()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def exception(self, timeout=None):
+        return self.future.exception(timeout)
+
+    def traceback(self, timeout=None):
+        return self.future.traceback(timeout)
+
+    def add_done_callback(self, fn):
+        self.future.add_done_callback(lambda _: fn(self))
+
+
+class FutureStub:
+
+    def __init__(self, stub):
+        """Wraps a management_pb2_grpc stub so that unary RPCs are issued through .future() and return an
+        UnaryFuture immediately instead of blocking. Streaming RPCs are returned untouched, their call object
+        already is a grpc.Future as well as the iterator of responses.
+
+        Args:
+            stub: Any of the *Stub classes of management_pb2_grpc
+        """
+        self.stub = stub
+
+    def __getattr__(self, name):
+        multi_callable = getattr(self.stub, name)
+
+        if hasattr(multi_callable, "future"):
+            def issue(request, **kwargs):
+                return UnaryFuture(multi_callable.future(request, **kwargs))
+            return issue
+        return multi_callable
@@ -0,0 +1,121 @@
+from google.protobuf import descriptor_pb2
+
+from management import management_pb2
+
+
+class LazyMessage:
+    __slots__ = ("message_class", "raw", "message")
+
+    def __init__(self, message_class, raw):
+        """Serialized response decoded into a message_class instance on first attribute access. ByteSize() and
+        SerializeToString() answer from the raw bytes without decoding.
+
+        Args:
+            message_class (type): management_pb2 message class of the response
+            raw (bytes): Serialized response as received
+        """
+        self.message_class = message_class
+        self.raw = raw
+        self.message = None
+
+    def decode(self):
+        """
+        Returns:
+            The decoded message_class instance, decoded once
+        """
+        if self.message is None:
+            self.message = self.message_class.FromString(self.raw)
+        return self.message
+
+    def is_decoded(self):
+        return self.message is not None
+
+    @property
+    def __class__(self):
+        # isinstance(lazy, message_class) holds, decoded messages only compare equal to instances of Message
+        return self.message_class
+
+    def ByteSize(self):
+        return len(self.raw)
+
+    def SerializeToString(self, **kwargs):
+        return self.raw
+
+    def __getattr__(self, name):
+        return getattr(self.decode(), name)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyMessage):
+            other = other.decode()
+        return self.decode() == other
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.decode())
+
+    def __repr__(self):
+        if self.message is None:
+            return f"LazyMessage({self.message_class.__name__}, {len(self.raw)} bytes)"
+        return repr(self.message)
+
+
+def __service_methods__():
+    # The 3.20 MethodDescriptor doesn't tell unary from streaming responses, its FileDescriptorProto does
+    file_proto = descriptor_pb2.FileDescriptorProto.FromString(management_pb2.DESCRIPTOR.serialized_pb)
+
+    services = {}
+    for service in file_proto.service:
+        services[service.name] = [(method.name, getattr(management_pb2, method.input_type.split(".")[-1]),
+                                   getattr(management_pb2, method.output_type.split(".")[-1]), method.server_streaming)
+                                  for method in service.method]
+    return services
+
+
+SERVICE_METHODS = __service_methods__()
+
+
+class LazyStub:
+
+    def __init__(self, channel, service_name):
+        """Counterpart of a management_pb2_grpc stub whose responses are LazyMessages: the response deserializer
+        only wraps the received bytes, so responses which are never read are never decoded.
+
+        Args:
+            channel (grpc.Channel):
+            service_name (str): AccessContext, ManagementForVertexLabels or ManagementForEdgeLabels
+        """
+        if service_name not in SERVICE_METHODS:
+            raise LookupError(f"No service {service_name} in management.proto, expected one of {list(SERVICE_METHODS)}")
+
+        for method_name, request_class, response_class, server_streaming in SERVICE_METHODS[service_name]:
+            multi_callable = channel.unary_stream if server_streaming else channel.unary_unary
+
+            setattr(self, method_name, multi_callable(
+                f"/{management_pb2.DESCRIPTOR.package}.{service_name}/{method_name}",
+                request_serializer=request_class.SerializeToString,
+                response_deserializer=lambda raw, response_class=response_class: LazyMessage(response_class, raw)))
+
+
+LAZY_STUB_CLASSES = {}
+
+
+def get_lazy_stub_class(stub_class):
+    """
+    Args:
+        stub_class (type): e.g. management_pb2_grpc.ManagementForVertexLabelsStub
+
+    Returns:
+        type: Class taking a channel, like stub_class, whose instances are LazyStubs of the same service. Cached so
+        ChannelPool.get_stub caches its instances like those of stub_class.
+    """
+    lazy_stub_class = LAZY_STUB_CLASSES.get(stub_class)
+
+    if lazy_stub_class is None:
+        service_name = stub_class.__name__[:-len("Stub")]
+
+        lazy_stub_class = type(f"Lazy{stub_class.__name__}", (LazyStub,), {
+            "__init__": lambda self, channel: LazyStub.__init__(self, channel, service_name)})
+        LAZY_STUB_CLASSES[stub_class] = lazy_stub_class
+
+    return lazy_stub_class
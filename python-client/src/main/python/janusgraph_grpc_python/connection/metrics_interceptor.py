@@ -0,0 +1,100 @@
+import time
+
+import grpc
+
+
+def __method_name__(client_call_details):
+    method = client_call_details.method
+    return method.decode() if isinstance(method, bytes) else method
+
+
+class MeteredStream:
+
+    def __init__(self, call, metrics, method, start):
+        """Response iterator of a streaming RPC recording its time to first message, number of messages and their
+        size once drained, or once it fails. Any other attribute is the one of the wrapped call, e.g. cancel().
+
+        Args:
+            call: Returned by the intercepted unary_stream continuation, an iterator and grpc.Call
+            metrics (RpcMetrics):
+            method (str):
+            start (float): time.perf_counter() when the call was issued
+        """
+        self.call = call
+        self.metrics = metrics
+        self.method = method
+        self.start = start
+
+        self.first_message_seconds = None
+        self.messages = 0
+        self.response_bytes = 0
+        self.recorded = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            message = next(self.call)
+        except (StopIteration, grpc.RpcError):
+            self.__record__()
+            raise
+
+        if self.first_message_seconds is None:
+            self.first_message_seconds = time.perf_counter() - self.start
+        self.messages += 1
+        self.response_bytes += message.ByteSize()
+        return message
+
+    def __getattr__(self, name):
+        return getattr(self.call, name)
+
+    def __record__(self):
+        if not self.recorded:
+            self.recorded = True
+            self.metrics.record_stream(self.method, self.first_message_seconds, self.messages, self.response_bytes)
+
+
+class MetricsInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+
+    def __init__(self, metrics):
+        """Records the latency, status code and request/response size of every RPC of a channel, installed with
+        grpc.intercept_channel(). The management services only have unary requests, so only the unary-unary and
+        unary-stream RPCs are intercepted.
+
+        Latency spans from the call being issued to its status being received, through the done callback, so it
+        is also recorded for futures and for streams that are not drained.
+
+        Args:
+            metrics (RpcMetrics):
+        """
+        self.metrics = metrics
+
+    def __on_done__(self, method, start, request_bytes, streaming):
+        def on_done(call):
+            seconds = time.perf_counter() - start
+            code = call.code()
+
+            response_bytes = 0
+            if not streaming and code == grpc.StatusCode.OK:
+                response_bytes = call.result().ByteSize()
+
+            self.metrics.record_call(method, code, seconds, request_bytes, response_bytes)
+        return on_done
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = __method_name__(client_call_details)
+        start = time.perf_counter()
+
+        outcome = continuation(client_call_details, request)
+        # Blocking calls get an already completed outcome, which runs the callback right away
+        outcome.add_done_callback(self.__on_done__(method, start, request.ByteSize(), False))
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        method = __method_name__(client_call_details)
+        start = time.perf_counter()
+
+        call = continuation(client_call_details, request)
+        call.add_done_callback(self.__on_done__(method, start, request.ByteSize(), True))
+        return MeteredStream(call, self.metrics, method, start)
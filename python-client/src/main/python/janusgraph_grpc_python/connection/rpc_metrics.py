@@ -0,0 +1,323 @@
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PROMETHEUS_PREFIX = "janusgraph_grpc_client"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 64 linear buckets per power of two, i.e. a recorded value is known within 1/64
+DEFAULT_SUB_BUCKET_BITS = 7
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+# Bounds of the exported Prometheus histograms, the recorded ones are much finer
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+MESSAGE_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000)
+
+
+class Histogram:
+
+    def __init__(self, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        """HDR-style histogram of non-negative integers: values below 2^sub_bucket_bits are counted exactly, above
+        it every power of two is split into 2^(sub_bucket_bits - 1) linear buckets. The relative error is bounded
+        whatever the magnitude, and only the buckets which were hit are stored. Not thread-safe.
+
+        Args:
+            sub_bucket_bits (int):
+        """
+        if sub_bucket_bits < 1:
+            raise ValueError(f"sub_bucket_bits must be at-least 1. Got {sub_bucket_bits}")
+
+        self.sub_bucket_bits = sub_bucket_bits
+        self.half = 1 << (sub_bucket_bits - 1)
+
+        # bucket index -> count
+        self.COUNTS = {}
+        self.count = 0
+        self.sum = 0
+        self.max = 0
+
+    def __len__(self):
+        return self.count
+
+    def __bucket__(self, value):
+        shift = max(value.bit_length() - self.sub_bucket_bits, 0)
+        return shift * self.half + (value >> shift)
+
+    def __bounds__(self, bucket):
+        if bucket < 2 * self.half:
+            return bucket, bucket
+        shift = bucket // self.half - 1
+        mantissa = bucket - shift * self.half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value, count=1):
+        """
+        Args:
+            value (int): Negative values are recorded as 0
+            count (int):
+        """
+        value = max(int(value), 0)
+        bucket = self.__bucket__(value)
+        self.COUNTS[bucket] = self.COUNTS.get(bucket, 0) + count
+        self.count += count
+        self.sum += value * count
+        self.max = max(self.max, value)
+
+    def percentile(self, q):
+        """
+        Args:
+            q (float): Between 0 and 1
+
+        Returns:
+            int: Highest value equivalent to the nearest-rank q-th recorded value, 0 when empty
+        """
+        if self.count == 0:
+            return 0
+
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for bucket in sorted(self.COUNTS):
+            seen += self.COUNTS[bucket]
+            if seen >= rank:
+                return min(self.__bounds__(bucket)[1], self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds):
+        """
+        Args:
+            bounds (Iterable[int]): Ascending upper bounds
+
+        Returns:
+            list[int]: Number of values whose bucket lies at or below each bound
+        """
+        uppers = sorted((self.__bounds__(bucket)[1], count) for bucket, count in self.COUNTS.items())
+
+        counts = []
+        seen = 0
+        i = 0
+        for bound in bounds:
+            while i < len(uppers) and uppers[i][0] <= bound:
+                seen += uppers[i][1]
+                i += 1
+            counts.append(seen)
+        return counts
+
+
+class MethodMetrics:
+
+    def __init__(self, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        # Microseconds
+        self.latency = Histogram(sub_bucket_bits)
+        # StatusCode name -> count
+        self.codes = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+        # Streaming RPCs only, microseconds until the first response and responses per drained stream
+        self.first_message = Histogram(sub_bucket_bits)
+        self.messages = Histogram(sub_bucket_bits)
+
+
+class RpcMetrics:
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        """Thread-safe per-method RPC statistics, fed by MetricsInterceptor and exported in the Prometheus text
+        format.
+
+        Args:
+            quantiles (Iterable[float]): Latency quantiles exported from the histograms
+            sub_bucket_bits (int): Precision of the histograms, see Histogram
+        """
+        self.quantiles = tuple(quantiles)
+        self.sub_bucket_bits = sub_bucket_bits
+
+        # /service/method -> MethodMetrics
+        self.METHODS = {}
+        self.LOCK = threading.Lock()
+
+    def __len__(self):
+        return len(self.METHODS)
+
+    def __method_metrics__(self, method):
+        metrics = self.METHODS.get(method)
+        if metrics is None:
+            metrics = MethodMetrics(self.sub_bucket_bits)
+            self.METHODS[method] = metrics
+        return metrics
+
+    def record_call(self, method, code, seconds, request_bytes=0, response_bytes=0):
+        """
+        Args:
+            method (str): e.g. /grpc.ManagementForVertexLabels/GetVertexLabels
+            code (grpc.StatusCode):
+            seconds (float): From the call being issued to its status being received
+            request_bytes (int): Serialized size of the request
+            response_bytes (int): Serialized size of the response, 0 for streams whose messages are recorded
+                with record_stream()
+        """
+        with self.LOCK:
+            metrics = self.__method_metrics__(method)
+            metrics.latency.record(round(seconds * 1e6))
+            metrics.codes[code.name] = metrics.codes.get(code.name, 0) + 1
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+
+    def record_stream(self, method, first_message_seconds, messages, response_bytes):
+        """
+        Args:
+            method (str):
+            first_message_seconds (float): From the call being issued to its first response, None when there was
+                none
+            messages (int): Responses read from the stream
+            response_bytes (int): Their total serialized size
+        """
+        with self.LOCK:
+            metrics = self.__method_metrics__(method)
+            if first_message_seconds is not None:
+                metrics.first_message.record(round(first_message_seconds * 1e6))
+            metrics.messages.record(messages)
+            metrics.response_bytes += response_bytes
+
+    def get_method(self, method):
+        """
+        Returns:
+            MethodMetrics: None when no call of method was recorded. Read it under LOCK while calls are recorded.
+        """
+        return self.METHODS.get(method)
+
+    def reset(self):
+        with self.LOCK:
+            self.METHODS.clear()
+
+    def to_prometheus(self):
+        """
+        Returns:
+            str: Every metric in the Prometheus text exposition format
+        """
+        families = {
+            "rpc_duration_seconds": ("histogram", "Latency of the RPCs, from the call to its status", []),
+            "rpc_duration_quantile_seconds": ("gauge", "Latency quantiles of the RPCs since the process started",
+                                              []),
+            "rpcs_total": ("counter", "Completed RPCs by status code", []),
+            "request_bytes_total": ("counter", "Serialized size of the requests", []),
+            "response_bytes_total": ("counter", "Serialized size of the responses", []),
+            "stream_first_message_seconds": ("histogram", "Time from a streaming call to its first response", []),
+            "stream_messages": ("histogram", "Responses per drained stream", []),
+        }
+
+        with self.LOCK:
+            for method in sorted(self.METHODS):
+                metrics = self.METHODS[method]
+                service, _, name = method.lstrip("/").rpartition("/")
+                labels = {"service": service, "method": name}
+
+                families["rpc_duration_seconds"][2].extend(
+                    __histogram_samples__("rpc_duration_seconds", labels, metrics.latency, LATENCY_BUCKETS, 1e6))
+                for q in self.quantiles:
+                    families["rpc_duration_quantile_seconds"][2].append(__sample__(
+                        "rpc_duration_quantile_seconds", dict(labels, quantile=str(q)),
+                        metrics.latency.percentile(q) / 1e6))
+                for code in sorted(metrics.codes):
+                    families["rpcs_total"][2].append(__sample__("rpcs_total", dict(labels, code=code),
+                                                                metrics.codes[code]))
+                families["request_bytes_total"][2].append(__sample__("request_bytes_total", labels,
+                                                                     metrics.request_bytes))
+                families["response_bytes_total"][2].append(__sample__("response_bytes_total", labels,
+                                                                      metrics.response_bytes))
+
+                if metrics.messages.count:
+                    families["stream_first_message_seconds"][2].extend(__histogram_samples__(
+                        "stream_first_message_seconds", labels, metrics.first_message, LATENCY_BUCKETS, 1e6))
+                    families["stream_messages"][2].extend(__histogram_samples__(
+                        "stream_messages", labels, metrics.messages, MESSAGE_BUCKETS, 1))
+
+        lines = []
+        for family, (metric_type, help_text, samples) in families.items():
+            if samples:
+                lines.append(f"# HELP {PROMETHEUS_PREFIX}_{family} {help_text}")
+                lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{family} {metric_type}")
+                lines.extend(samples)
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_textfile(self, path):
+        """Writes the metrics for the node_exporter textfile collector. The file is replaced atomically so the
+        collector never reads a partial one.
+
+        Args:
+            path (str): Should end with .prom
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as tmp_file:
+            tmp_file.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def serve(self, port, address=""):
+        """Serves the metrics over HTTP from a daemon thread, on every path.
+
+        Args:
+            port (int): 0 picks a free one, see server.server_address
+            address (str): Interface to listen on, all of them by default
+
+        Returns:
+            ThreadingHTTPServer: shutdown() stops it
+        """
+        server = ThreadingHTTPServer((address, port), MetricsRequestHandler)
+        server.daemon_threads = True
+        server.metrics = self
+
+        threading.Thread(target=server.serve_forever, name="rpc-metrics", daemon=True).start()
+        return server
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = self.server.metrics.to_prometheus().encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def __sample__(name, labels, value, suffix=""):
+    label_text = ",".join(f'{key}="{__escape__(str(label))}"' for key, label in labels.items())
+    return f"{PROMETHEUS_PREFIX}_{name}{suffix}{{{label_text}}} {value}"
+
+
+def __histogram_samples__(name, labels, histogram, bounds, unit):
+    # unit: recorded values per exported unit, e.g. 1e6 microseconds per second
+    samples = []
+    for bound, count in zip(bounds, histogram.cumulative_counts([round(bound * unit) for bound in bounds])):
+        samples.append(__sample__(name, dict(labels, le=f"{bound:g}"), count, "_bucket"))
+    samples.append(__sample__(name, dict(labels, le="+Inf"), histogram.count, "_bucket"))
+    samples.append(__sample__(name, labels, histogram.sum if unit == 1 else histogram.sum / unit, "_sum"))
+    samples.append(__sample__(name, labels, histogram.count, "_count"))
+    return samples
+
+
+def __escape__(label):
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+RPC_METRICS = None
+_RPC_METRICS_LOCK = threading.Lock()
+
+
+def get_rpc_metrics():
+    """Returns the process wide RpcMetrics, which the channels of the pools record into.
+
+    Returns:
+        RpcMetrics
+    """
+    global RPC_METRICS
+
+    if RPC_METRICS is None:
+        with _RPC_METRICS_LOCK:
+            if RPC_METRICS is None:
+                RPC_METRICS = RpcMetrics()
+    return RPC_METRICS
@@ -0,0 +1,91 @@
+import threading
+
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+
+    def __init__(self):
+        """Lets concurrent callers of the same key share a single execution of the call"""
+        self.FLIGHTS = {}
+        self.LOCK = threading.Lock()
+
+    def __len__(self):
+        return len(self.FLIGHTS)
+
+    def call(self, key, fn):
+        """Runs fn() unless a call with the same key is already in flight, in which case its outcome is
+        waited for and shared.
+
+        Args:
+            key (Hashable):
+            fn (Callable):
+
+        Returns:
+            The return value of fn(). Its exception is raised to every caller sharing the flight.
+        """
+        with self.LOCK:
+            flight = self.FLIGHTS.get(key)
+            leader = flight is None
+            if leader:
+                flight = Flight()
+                self.FLIGHTS[key] = flight
+
+        if leader:
+            try:
+                flight.result = fn()
+            except Exception as e:
+                flight.error = e
+            finally:
+                with self.LOCK:
+                    del self.FLIGHTS[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+
+SINGLE_FLIGHT = SingleFlight()
+
+
+class SingleFlightStub:
+
+    def __init__(self, stub, single_flight=None):
+        """Wraps a management_pb2_grpc stub so that concurrent identical Get* calls (same stub, same RPC and same
+        serialized request) share one RPC. Streamed responses are collected once and every caller gets its own
+        iterator over them. Ensure* RPCs and calls with extra arguments (timeout, metadata...) go straight through.
+
+        Args:
+            stub: Any of the *Stub classes of management_pb2_grpc, usually cached per channel by ChannelPool
+            single_flight (SingleFlight): Defaults to the process wide SINGLE_FLIGHT
+        """
+        self.stub = stub
+        self.single_flight = SINGLE_FLIGHT if single_flight is None else single_flight
+
+    def __getattr__(self, name):
+        multi_callable = getattr(self.stub, name)
+
+        if not name.startswith("Get"):
+            return multi_callable
+
+        unary = hasattr(multi_callable, "future")
+
+        def coalesced(request, **kwargs):
+            if kwargs:
+                return multi_callable(request, **kwargs)
+
+            key = (id(self.stub), name, request.SerializeToString(deterministic=True))
+
+            if unary:
+                return self.single_flight.call(key, lambda: multi_callable(request))
+            return iter(self.single_flight.call(key, lambda: list(multi_callable(request))))
+
+        return coalesced
@@ -1,4 +1,6 @@
 from management import management_pb2_grpc
+from connection.channel_pool import get_channel_pool
+from connection.lazy_stub import get_lazy_stub_class
 from structure.element.graph_element import GraphElement
 from graph_operation.graph_indexer import GraphIndexer
 
@@ -20,6 +22,10 @@ class GraphOperation:
         self.OPERATION = None
         self.CHANNEL = None
         self.SERVICE = None
+        self.CACHE = None
+        self.STUB_WRAPPER = None
+        self.LAZY_DECODING = False
+        self.GRAPH_NAME = None
 
         self.processor = GraphElement
 
@@ -35,6 +41,47 @@ class GraphOperation:
     def set_channel(self, channel):
         self.CHANNEL = channel
 
+    def set_graph_name(self, graph_name):
+        """
+        Args:
+            graph_name (str): Graph context to operate on instead of the processor's default GRAPH_NAME
+
+        Returns:
+
+        """
+        self.GRAPH_NAME = graph_name
+
+    def set_cache(self, cache):
+        """
+        Args:
+            cache (SchemaCache): Cache put in front of the VertexLabel/EdgeLabel lookups of the processor
+
+        Returns:
+
+        """
+        self.CACHE = cache
+
+    def set_stub_wrapper(self, wrapper):
+        """
+        Args:
+            wrapper (Callable): Called with the cached stub, its return value is used as the service of the
+                processor. e.g. FutureStub to issue unary RPCs through .future()
+
+        Returns:
+
+        """
+        self.STUB_WRAPPER = wrapper
+
+    def set_lazy_decoding(self, lazy_decoding):
+        """
+        Args:
+            lazy_decoding (bool): Return responses as LazyMessages, kept serialized until a field is read
+
+        Returns:
+
+        """
+        self.LAZY_DECODING = lazy_decoding
+
     def get_processor(self):
         """This method gets the processor. A Processor is a Class which
         specifies weather its processing Vertex, Edge, Context etc
@@ -54,6 +101,12 @@ class GraphOperation:
         self.__generate_service__()
         self.processor.set_service(self.SERVICE)
 
+        if self.GRAPH_NAME is not None:
+            self.processor.set_context_name(self.GRAPH_NAME)
+
+        if self.CACHE is not None:
+            self.processor.set_cache(self.CACHE)
+
         if self.metadata.get_metadata() is not None:
             operator = self.metadata.get_operator()
 
@@ -72,13 +125,22 @@ class GraphOperation:
             raise ValueError("Call set_channel(channel) before calling get_processor")
 
         if str(self.processor) == "VertexLabel":
-            self.SERVICE = management_pb2_grpc.ManagementForVertexLabelsStub(self.CHANNEL)
+            stub_class = management_pb2_grpc.ManagementForVertexLabelsStub
 
         elif str(self.processor) == "EdgeLabel":
-            self.SERVICE = management_pb2_grpc.ManagementForEdgeLabelsStub(self.CHANNEL)
+            stub_class = management_pb2_grpc.ManagementForEdgeLabelsStub
 
         elif str(self.processor) == "ContextAction":
-            self.SERVICE = management_pb2_grpc.AccessContextStub(self.CHANNEL)
+            stub_class = management_pb2_grpc.AccessContextStub
 
         else:
             raise NotImplementedError(f"Implemented only Service for VertexLabel/EdgeLabel/ContextAction got {self.processor}")
+
+        if self.LAZY_DECODING:
+            stub_class = get_lazy_stub_class(stub_class)
+
+        # Stubs are cached per channel so repeated get_processor() calls on a pooled channel reuse them
+        self.SERVICE = get_channel_pool().get_stub(self.CHANNEL, stub_class)
+
+        if self.STUB_WRAPPER is not None:
+            self.SERVICE = self.STUB_WRAPPER(self.SERVICE)
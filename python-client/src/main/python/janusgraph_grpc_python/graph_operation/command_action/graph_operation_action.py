@@ -22,6 +22,21 @@ class GraphOperationAction(argparse.Action):
 
         """
         lst = getattr(namespace, self.dest, []) or []
+
+        lst.append(self.build_operation(values))
+        setattr(namespace, self.dest, lst)
+
+    @staticmethod
+    def build_operation(values):
+        """Builds the GraphOperation for the values of a single --arg
+
+        Args:
+            values (Sequence[str]): Element type, element name and optional metadata.
+                e.g. ["VertexLabel", "god", "properties=p1,p2"]
+
+        Returns:
+            GraphOperation
+        """
         print("--------------")
         print(values)
 
@@ -38,6 +53,5 @@ class GraphOperationAction(argparse.Action):
         print(element_metadata)
         print("--------------")
 
-        lst.append(GraphOperation(GraphElementType().set(element_type), str(element_name),
-                                  GraphOperationMetadata().set(element_metadata)))
-        setattr(namespace, self.dest, lst)
+        return GraphOperation(GraphElementType().set(element_type), str(element_name),
+                              GraphOperationMetadata().set(element_metadata))
@@ -5,7 +5,7 @@ from management import management_pb2
 
 
 class GraphIndexer:
-    supported_parameters = ["index_type", "index_name", "index_on", "index_only", "unique_index"]
+    supported_parameters = ["index_type", "index_name", "index_on", "index_only", "unique_index", "index_backend"]
 
     CONTEXT = None
     SERVICE = None
@@ -21,12 +21,17 @@ class GraphIndexer:
         self.element_to_index = None
         self.index_only = False
         self.unique_index = False
+        # Only used by MixedIndex. "search" is the index backend name of the default JanusGraph configuration
+        self.index_backend = "search"
 
         self.__are_valid_parameters_passed__(**kwargs)
 
         for property_name, property_value in kwargs.items():
             setattr(self, property_name, property_value)
 
+        if isinstance(self.unique_index, str):
+            self.unique_index = True if self.unique_index.lower() == "true" else False
+
     def set_element(self, element):
         """
 
@@ -68,16 +73,15 @@ class GraphIndexer:
         # print({k: self.__dict__.get(k) for k in self.supported_parameters})
         # print("========= I'm inside get_indexer() ==========")
 
-        from structure.index.composite_index import CompositeIndex
-        from structure.index.mixed_index import MixedIndex
+        composite_index_class, mixed_index_class = self.__index_classes__()
 
         if self.element_to_index is None:
             raise ValueError("Please call set_element() to identify the element to be Indexed before calling get_indexer()")
 
         if self.index_type == "CompositeIndex":
-            idx = CompositeIndex(**{k: self.__dict__.get(k) for k in self.supported_parameters})
+            idx = composite_index_class(**{k: self.__dict__.get(k) for k in self.supported_parameters})
         elif self.index_type == "MixedIndex":
-            idx = MixedIndex(**{k: self.__dict__.get(k) for k in self.supported_parameters})
+            idx = mixed_index_class(**{k: self.__dict__.get(k) for k in self.supported_parameters})
         else:
             raise AttributeError(f"Invalid index type defined | {self.index_type} |. "
                                  f"Expecting either CompositeIndex or MixedIndex")
@@ -101,6 +105,35 @@ class GraphIndexer:
         # idx.set_channel(self.CHANNEL)
         return idx
 
+    def __index_classes__(self):
+        """Classes instantiated by get_indexer() for CompositeIndex and MixedIndex respectively
+
+        Returns:
+            tuple
+        """
+        from structure.index.composite_index import CompositeIndex
+        from structure.index.mixed_index import MixedIndex
+
+        return CompositeIndex, MixedIndex
+
+    def __generate_vertex_properties__(self):
+        vertex_properties = []
+        if isinstance(self.index_on, str):
+            vertex_properties.append(management_pb2.VertexProperty(name=self.index_on))
+        else:
+            for elem in self.index_on:
+                vertex_properties.append(management_pb2.VertexProperty(name=elem))
+        return vertex_properties
+
+    def __generate_edge_properties__(self):
+        edge_properties = []
+        if isinstance(self.index_on, str):
+            edge_properties.append(management_pb2.EdgeProperty(name=self.index_on))
+        else:
+            for elem in self.index_on:
+                edge_properties.append(management_pb2.EdgeProperty(name=elem))
+        return edge_properties
+
     def put_index(self):
         raise NotImplementedError(f"{str(self)} is not subclassed by any other class yet so no put_index() implemented")
 
@@ -125,9 +158,6 @@ class GraphIndexer:
             raise NotImplementedError("Implemented index_on with String attribute only. "
                                       f"TODO for dict with key as propertyKey and value as Mapping parameter. Got {type(self.index_on)}")
 
-        if "unique_index" in kwargs and kwargs["unique_index"] == True:
-            raise NotImplementedError("Not implemented adding property of index_uniqueness to Index yet. TODO")
-
     def __are_required_parameters_set__(self, parameters=None):
         # The compulsory parameters are the ones which are initialized as either None or as empty object
         # Optional parameters are already defaulted to a value other than None or Empty object
@@ -0,0 +1,111 @@
+import queue
+import time
+from collections import Counter, deque
+
+from connection.channel_pool import get_channel_pool
+from .schema_scheduler import SchemaDag
+
+DEFAULT_MAX_IN_FLIGHT = 32
+
+
+class ApplySummary:
+
+    def __init__(self):
+        self.applied = Counter()
+        self.failures = []
+        self.skipped = []
+        self.elapsed = 0.0
+        self.depth = 0
+
+    def get_throughput(self):
+        completed = sum(self.applied.values()) + len(self.failures)
+        return completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def report(self):
+        """
+        Returns:
+            list[str]: Human readable summary lines
+        """
+        lines = [f"Applied {sum(self.applied.values())} operations "
+                 f"({', '.join(f'{count} {kind}' for kind, count in sorted(self.applied.items())) or 'none'}) "
+                 f"in {self.elapsed:.3f}s, {self.get_throughput():.1f} ops/s, dependency depth {self.depth}"]
+
+        for operation, error in self.failures:
+            lines.append(f"FAILED {operation}: {type(error).__name__}: {error}")
+        for operation, reason in self.skipped:
+            lines.append(f"SKIPPED {operation}: {reason}")
+
+        lines.append(f"{len(self.failures)} failed, {len(self.skipped)} skipped")
+        return lines
+
+
+class SchemaApplier:
+
+    def __init__(self, channel, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """Sends SchemaOperations over a (pooled) channel in dependency order with at most max_in_flight RPCs
+        outstanding.
+
+        Args:
+            channel (grpc.Channel):
+            max_in_flight (int):
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at-least 1. Got {max_in_flight}")
+
+        self.channel = channel
+        self.max_in_flight = max_in_flight
+
+    def apply(self, operations):
+        """Runs the operations as a SchemaDag: every operation is sent as soon as the operations it depends on
+        succeeded, with at most max_in_flight RPCs outstanding. Operations depending on a failed one are
+        skipped.
+
+        Args:
+            operations (Iterable[SchemaOperation]):
+
+        Returns:
+            ApplySummary
+        """
+        summary = ApplySummary()
+        started = time.monotonic()
+
+        dag = SchemaDag(operations)
+        summary.depth = len(dag.get_layers())
+
+        channel_pool = get_channel_pool()
+        completions = queue.Queue()
+        remaining = {i: len(dag.dependencies[i]) for i in range(len(dag))}
+        ready = deque(i for i, count in remaining.items() if count == 0)
+        skipped = set()
+        in_flight = 0
+
+        while ready or in_flight:
+            while ready and in_flight < self.max_in_flight:
+                i = ready.popleft()
+                operation = dag.operations[i]
+                stub = channel_pool.get_stub(self.channel, operation.get_stub_class())
+
+                future = getattr(stub, operation.rpc).future(operation.request)
+                future.add_done_callback(lambda f, i=i: completions.put((i, f.exception())))
+                in_flight += 1
+
+            i, error = completions.get()
+            in_flight -= 1
+            operation = dag.operations[i]
+
+            if error is None:
+                summary.applied[operation.kind] += 1
+
+                for dependent in dag.dependents[i]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0 and dependent not in skipped:
+                        ready.append(dependent)
+            else:
+                summary.failures.append((operation, error))
+
+                for dependent in sorted(dag.get_descendants(i) - skipped):
+                    skipped.add(dependent)
+                    summary.skipped.append((dag.operations[dependent], f"depends on failed {operation}"))
+
+        summary.elapsed = time.monotonic() - started
+        return summary
@@ -0,0 +1,220 @@
+import mmap
+import os
+import struct
+
+from management import management_pb2
+from .snapshot_store import DESCRIPTOR_CRC, replace_file
+
+MAGIC = b"JGSC"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHIQQ")  # magic, version, descriptor crc, number of entries, offset of the index
+RECORD = struct.Struct("<QIQI")  # key offset, key length, message offset, message length
+
+KIND_CLASSES = {
+    "VertexLabel": management_pb2.VertexLabel,
+    "EdgeLabel": management_pb2.EdgeLabel,
+    "CompositeVertexIndex": management_pb2.CompositeVertexIndex,
+    "CompositeEdgeIndex": management_pb2.CompositeEdgeIndex,
+    "MixedVertexIndex": management_pb2.MixedVertexIndex,
+    "MixedEdgeIndex": management_pb2.MixedEdgeIndex,
+}
+
+
+def __catalog_key__(graph_name, kind, *names):
+    # NUL sorts before any other byte, so sorting the joined keys sorts them part by part and every entry below a
+    # (graph_name, kind, ...) prefix is stored contiguously
+    return b"\0".join(part.encode("utf-8") for part in (graph_name, kind) + names)
+
+
+def write_catalog(path, snapshots):
+    """Writes schema snapshots as a catalog: every serialized message back to back, followed by an index of
+    fixed size records sorted by (graphName, kind, [label name,] name) key.
+
+    Args:
+        path (str):
+        snapshots (Iterable[SchemaSnapshot]):
+    """
+    entries = []
+    for snapshot in snapshots:
+        graph_name = snapshot.graph_name
+
+        for element, kind in (("VertexLabel", "Vertex"), ("EdgeLabel", "Edge")):
+            for name, label in snapshot.get_labels(element).items():
+                entries.append((__catalog_key__(graph_name, element, name), label))
+            for name, index in snapshot.get_composite_indices(element).items():
+                entries.append((__catalog_key__(graph_name, f"Composite{kind}Index", name), index))
+            for label_name, indices in snapshot.get_mixed_indices(element).items():
+                for name, index in indices.items():
+                    entries.append((__catalog_key__(graph_name, f"Mixed{kind}Index", label_name, name), index))
+
+    entries.sort(key=lambda entry: entry[0])
+
+    data = bytearray(HEADER.size)
+    records = []
+    for key, message in entries:
+        key_offset = len(data)
+        data.extend(key)
+        message_offset = len(data)
+        data.extend(message.SerializeToString())
+        records.append(RECORD.pack(key_offset, len(key), message_offset, len(data) - message_offset))
+
+    index_offset = len(data)
+    data.extend(b"".join(records))
+    HEADER.pack_into(data, 0, MAGIC, VERSION, DESCRIPTOR_CRC, len(records), index_offset)
+
+    replace_file(path, data)
+
+
+class SchemaCatalog:
+
+    def __init__(self, path):
+        """Read-only, memory-mapped view of a file written by write_catalog. Lookups binary search the sorted index
+        in place and decode only the messages they return, so worker processes opening the same catalog share its
+        pages through the page cache instead of each holding the decoded schema.
+
+        Args:
+            path (str):
+
+        Raises:
+            ValueError: When the file isn't a catalog or was written by an incompatible version
+        """
+        self.path = path
+        self.MMAP = None
+        self.__open__()
+
+    def __open__(self):
+        with open(self.path, "rb") as catalog_file:
+            self.INODE = os.fstat(catalog_file.fileno()).st_ino
+            self.MMAP = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.MMAP) < HEADER.size:
+            raise ValueError(f"{self.path} is too short to be a schema catalog")
+
+        magic, version, descriptor_crc, self.count, self.index_offset = HEADER.unpack_from(self.MMAP)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a schema catalog")
+        if version != VERSION or descriptor_crc != DESCRIPTOR_CRC:
+            raise ValueError(f"{self.path} was written by an incompatible version (format {version})")
+        if self.index_offset + self.count * RECORD.size > len(self.MMAP):
+            raise ValueError(f"{self.path} is truncated")
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"SchemaCatalog({self.path}, {self.count} entries)"
+
+    def close(self):
+        if self.MMAP is not None:
+            self.MMAP.close()
+            self.MMAP = None
+
+    def is_replaced(self):
+        """Whether the file was replaced since it was opened, e.g. by another write_catalog. Lookups keep reading
+        the mapped one, open a new SchemaCatalog to read the replacement: remapping in place would pull the map
+        from under concurrent lookups.
+
+        Returns:
+            bool
+        """
+        try:
+            return os.stat(self.path).st_ino != self.INODE
+        except FileNotFoundError:
+            return False
+
+    def get_label(self, graph_name, element, name):
+        """
+        Args:
+            graph_name (str):
+            element (str): VertexLabel or EdgeLabel
+            name (str):
+
+        Returns:
+            management_pb2.VertexLabel or management_pb2.EdgeLabel, None when the catalog doesn't have it
+        """
+        return self.get(graph_name, element, name)
+
+    def get_labels(self, graph_name, element):
+        """
+        Returns:
+            Generator: Every VertexLabel/EdgeLabel of the context, decoded one at a time
+        """
+        return self.scan(graph_name, element)
+
+    def get_composite_indices(self, graph_name, element):
+        """
+        Returns:
+            Generator: Every CompositeVertexIndex/CompositeEdgeIndex of the context
+        """
+        return self.scan(graph_name, "CompositeVertexIndex" if element == "VertexLabel" else "CompositeEdgeIndex")
+
+    def get_mixed_indices(self, graph_name, element, label_name):
+        """
+        Returns:
+            Generator: MixedVertexIndex/MixedEdgeIndex of the label
+        """
+        return self.scan(graph_name, "MixedVertexIndex" if element == "VertexLabel" else "MixedEdgeIndex",
+                         label_name)
+
+    def get(self, graph_name, kind, *names):
+        """
+        Args:
+            graph_name (str):
+            kind (str): One of KIND_CLASSES
+            *names (str): Name of the entry, preceded by the label name for mixed indices
+
+        Returns:
+            Decoded message or None
+        """
+        key = __catalog_key__(graph_name, kind, *names)
+
+        i = self.__lower_bound__(key)
+        if i == self.count:
+            return None
+
+        record = self.__record__(i)
+        if self.__key__(record) != key:
+            return None
+
+        return self.__decode__(kind, record)
+
+    def scan(self, graph_name, kind, *prefix):
+        """
+        Returns:
+            Generator: Decoded messages of every entry whose key starts with (graph_name, kind, *prefix), by key
+        """
+        key_prefix = __catalog_key__(graph_name, kind, *prefix) + b"\0"
+
+        for i in range(self.__lower_bound__(key_prefix), self.count):
+            record = self.__record__(i)
+            if not self.__key__(record).startswith(key_prefix):
+                break
+            yield self.__decode__(kind, record)
+
+    def __record__(self, i):
+        return RECORD.unpack_from(self.MMAP, self.index_offset + i * RECORD.size)
+
+    def __key__(self, record):
+        key_offset, key_length, _, _ = record
+        return self.MMAP[key_offset:key_offset + key_length]
+
+    def __decode__(self, kind, record):
+        _, _, message_offset, message_length = record
+        return KIND_CLASSES[kind].FromString(self.MMAP[message_offset:message_offset + message_length])
+
+    def __lower_bound__(self, key):
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__key__(self.__record__(middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,163 @@
+from .schema_snapshot import fetch_schema, fetch_composite_index_labels
+
+VERTEX_LABEL_FLAGS = ["readOnly", "partitioned"]
+EDGE_LABEL_FLAGS = ["multiplicity", "directed"]
+
+
+class SchemaDiff:
+
+    def __init__(self, operations, snapshot, index_labels=None):
+        """Compares the desired Ensure* operations with the live schema and keeps only the ones which change it.
+
+        An operation changes the schema when its label/index doesn't exist yet, or when it adds properties to a
+        label or a mixed index. Differences JanusGraph can't apply to an existing element (flags of a label,
+        dataType/cardinality of an existing property, properties or label constraint of a composite index, backend
+        of a mixed index) are reported as conflicts and not sent.
+
+        Args:
+            operations (Iterable[SchemaOperation]): Desired state, e.g. SchemaManifest.get_operations()
+            snapshot (SchemaSnapshot): Live state
+            index_labels (dict): (element, index name) -> label name of the live composite indices, see
+                fetch_composite_index_labels. None when unknown, the label constraint is then not compared
+        """
+        self.snapshot = snapshot
+        self.index_labels = index_labels
+
+        self.changes = []
+        self.conflicts = []
+        self.unchanged = []
+
+        for operation in operations:
+            if operation.is_label():
+                changes, conflicts = self.__compare_label__(operation)
+            elif operation.kind == "CompositeIndex":
+                changes, conflicts = self.__compare_composite_index__(operation)
+            else:
+                changes, conflicts = self.__compare_mixed_index__(operation)
+
+            if changes:
+                self.changes.append((operation, changes))
+            if conflicts:
+                self.conflicts.append((operation, conflicts))
+            if not changes and not conflicts:
+                self.unchanged.append(operation)
+
+    def get_operations(self):
+        """
+        Returns:
+            list[SchemaOperation]: Operations which change the live schema, in their original order
+        """
+        return [operation for operation, _ in self.changes]
+
+    def report(self):
+        """
+        Returns:
+            list[str]: Dry-run report lines
+        """
+        lines = []
+        for operation, reasons in self.changes:
+            lines.append(f"ENSURE {operation}: {'; '.join(reasons)}")
+        for operation, reasons in self.conflicts:
+            lines.append(f"CONFLICT {operation}: {'; '.join(reasons)}")
+
+        lines.append(f"{len(self.changes)} to ensure, {len(self.conflicts)} conflicting, "
+                     f"{len(self.unchanged)} unchanged")
+        return lines
+
+    def __compare_label__(self, operation):
+        live = self.snapshot.get_labels(operation.element).get(operation.label)
+        if live is None:
+            return [f"{operation.element} doesn't exist"], []
+
+        desired = operation.request.label
+        definition = operation.definition or {}
+        changes = []
+        conflicts = []
+
+        flags = VERTEX_LABEL_FLAGS if operation.element == "VertexLabel" else EDGE_LABEL_FLAGS
+        for flag in flags:
+            if flag in definition and getattr(desired, flag) != getattr(live, flag):
+                conflicts.append(f"{flag} is {getattr(live, flag)} on the server")
+
+        live_properties = {prop.name: prop for prop in live.properties}
+        prop_definitions = {prop["name"]: prop for prop in definition.get("properties", [])}
+
+        missing = [prop.name for prop in desired.properties if prop.name not in live_properties]
+        if missing:
+            changes.append(f"adds properties {missing}")
+
+        for prop in desired.properties:
+            live_prop = live_properties.get(prop.name)
+            if live_prop is None:
+                continue
+
+            for attribute in ["dataType", "cardinality"]:
+                if attribute in prop_definitions.get(prop.name, {}) and getattr(prop, attribute) != getattr(live_prop, attribute):
+                    conflicts.append(f"{attribute} of property {prop.name} differs on the server")
+
+        return changes, conflicts
+
+    def __compare_composite_index__(self, operation):
+        live = self.snapshot.get_composite_indices(operation.element).get(operation.name)
+        if live is None:
+            return ["index doesn't exist"], []
+
+        desired = operation.request.index
+        conflicts = []
+
+        if sorted(prop.name for prop in desired.properties) != sorted(prop.name for prop in live.properties):
+            conflicts.append(f"indexes {[prop.name for prop in live.properties]} on the server")
+        if operation.element == "VertexLabel" and desired.unique != live.unique:
+            conflicts.append(f"unique is {live.unique} on the server")
+        if self.index_labels is not None:
+            # The index is ensured by its label, so it is expected to be constrained to it
+            live_label = self.index_labels.get((operation.element, operation.name))
+            if live_label is None:
+                conflicts.append("isn't constrained to a label on the server")
+            elif live_label != operation.label:
+                conflicts.append(f"is constrained to {live_label} on the server")
+
+        return [], conflicts
+
+    def __compare_mixed_index__(self, operation):
+        live = self.snapshot.get_mixed_indices(operation.element).get(operation.label, {}).get(operation.name)
+        if live is None:
+            return ["index doesn't exist"], []
+
+        desired = operation.request.index
+        changes = []
+        conflicts = []
+
+        live_properties = {prop.name for prop in live.properties}
+        missing = [prop.name for prop in desired.properties if prop.name not in live_properties]
+        if missing:
+            changes.append(f"adds properties {missing}")
+        if desired.backend != live.backend:
+            conflicts.append(f"backend is {live.backend} on the server")
+
+        return changes, conflicts
+
+
+def diff_manifest(channel, manifest):
+    """Fetches the live schema of the manifest's context once and diffs the manifest operations against it. The
+    label constraint of the composite indices is only fetched when the manifest has one which already exists.
+
+    Args:
+        channel (grpc.Channel):
+        manifest (SchemaManifest):
+
+    Returns:
+        SchemaDiff
+    """
+    operations = manifest.get_operations()
+    mixed_index_labels = {(operation.element, operation.label) for operation in operations
+                          if operation.kind == "MixedIndex"}
+
+    snapshot = fetch_schema(channel, manifest.graph_name, mixed_index_labels)
+
+    index_labels = None
+    if any(operation.kind == "CompositeIndex" and operation.name in snapshot.get_composite_indices(operation.element)
+           for operation in operations):
+        index_labels = fetch_composite_index_labels(channel, snapshot)
+
+    return SchemaDiff(operations, snapshot, index_labels)
@@ -0,0 +1,182 @@
+import hashlib
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+# Top level sub-trees of a context, mixed indices are listed per label and hang below their label
+GROUPS = ["VertexLabel", "EdgeLabel", "CompositeVertexIndex", "CompositeEdgeIndex"]
+
+
+class Fingerprint:
+
+    def __init__(self, name, payload=None, children=()):
+        """Node of a schema hash tree. Its digest covers its own canonical definition, if any, and the names and
+        digests of its children, but not its own name: contexts with different names but the same schema have the
+        same root digest.
+
+        Args:
+            name (str):
+            payload (bytes): Canonical definition of the label or index, None for grouping nodes
+            children (Iterable[Fingerprint]):
+        """
+        self.name = name
+        self.children = {child.name: child for child in children}
+        self.payload_digest = None if payload is None else hashlib.sha256(payload).digest()
+
+        digest = hashlib.sha256()
+        digest.update(self.payload_digest or b"")
+        for child_name in sorted(self.children):
+            digest.update(__length_prefixed__(child_name.encode()))
+            digest.update(self.children[child_name].digest)
+        self.digest = digest.digest()
+
+    def __repr__(self):
+        return 'Fingerprint(%s, %s, %d children)' % (self.name, self.hexdigest()[:16], len(self.children))
+
+    def __eq__(self, other):
+        return isinstance(other, Fingerprint) and self.digest == other.digest
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def hexdigest(self):
+        return self.digest.hex()
+
+    def get(self, path):
+        """
+        Args:
+            path (Iterable[str]): Child names from this node, e.g. ("VertexLabel", "person", "byName")
+
+        Returns:
+            Fingerprint: None when there is no such node
+        """
+        node = self
+        for name in path:
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def get_hashes(self, depth=2):
+        """Hashes to exchange with another cluster, the ones which differ tell which sub-trees to drill into.
+
+        Args:
+            depth (int): 0 for the root only, 1 adds the label and index groups, 2 every label and composite index,
+                3 the mixed indices of the labels
+
+        Returns:
+            dict: path tuple -> hex digest, the root being the empty path
+        """
+        hashes = {(): self.hexdigest()}
+        if depth > 0:
+            for name, child in self.children.items():
+                for path, digest in child.get_hashes(depth - 1).items():
+                    hashes[(name,) + path] = digest
+        return hashes
+
+    def diff(self, other):
+        """Drills into the sub-trees whose digests differ, subtrees with equal digests are skipped without being
+        walked.
+
+        Args:
+            other (Fingerprint): e.g. of the same context on another cluster
+
+        Returns:
+            list[tuple]: (path, status) of the deepest nodes which differ, status being ADDED when the node is only
+            in other, REMOVED when it is only in self and CHANGED when its own definition differs. Sorted by path.
+        """
+        differences = []
+        self.__diff__(other, (), differences)
+        return sorted(differences)
+
+    def __diff__(self, other, path, differences):
+        if self.digest == other.digest:
+            return
+
+        if self.payload_digest != other.payload_digest:
+            differences.append((path, CHANGED))
+
+        for name in self.children.keys() | other.children.keys():
+            child = self.children.get(name)
+            other_child = other.children.get(name)
+            if other_child is None:
+                differences.append((path + (name,), REMOVED))
+            elif child is None:
+                differences.append((path + (name,), ADDED))
+            else:
+                child.__diff__(other_child, path + (name,), differences)
+
+
+def __length_prefixed__(data):
+    return len(data).to_bytes(4, "big") + data
+
+
+def canonicalize(message, sort_properties=True):
+    """Canonical bytes of a label or index definition. Ids are assigned by each JanusGraph instance and cleared,
+    properties are sorted by name unless their order is part of the definition.
+
+    Args:
+        message: VertexLabel, EdgeLabel, CompositeVertexIndex, CompositeEdgeIndex, MixedVertexIndex or
+            MixedEdgeIndex
+        sort_properties (bool): False for composite indices, whose key order is part of the index
+
+    Returns:
+        bytes
+    """
+    canonical = type(message)()
+    canonical.CopyFrom(message)
+    canonical.ClearField("id")
+
+    properties = list(canonical.properties)
+    for prop in properties:
+        prop.ClearField("id")
+    if sort_properties:
+        properties.sort(key=lambda prop: prop.name)
+
+    del canonical.properties[:]
+    canonical.properties.extend(properties)
+
+    return canonical.SerializeToString(deterministic=True)
+
+
+def fingerprint_snapshot(snapshot, index_labels=None):
+    """Hash tree of the schema of a context: root -> VertexLabel/EdgeLabel/CompositeVertexIndex/CompositeEdgeIndex
+    -> one node per label or composite index -> one node per mixed index of a label. Two snapshots only have the
+    same fingerprint when they were taken with the mixed indices of the same labels, and both with or both without
+    index_labels.
+
+    Args:
+        snapshot (SchemaSnapshot):
+        index_labels (dict): (element, index name) -> label a composite index is constrained to, as returned by
+            fetch_composite_index_labels. Hashed with the composite indices, an index moved to another label
+            changes its digest. None when unknown, e.g. for a snapshot read from a file
+
+    Returns:
+        Fingerprint: Named after the context
+    """
+    groups = []
+
+    for element in ("VertexLabel", "EdgeLabel"):
+        mixed_indices = snapshot.get_mixed_indices(element)
+        groups.append(Fingerprint(element, children=(
+            Fingerprint(name, canonicalize(label), (
+                Fingerprint(index_name, canonicalize(index))
+                for index_name, index in mixed_indices.get(name, {}).items()))
+            for name, label in snapshot.get_labels(element).items())))
+
+    for group, element in zip(GROUPS[2:], ("VertexLabel", "EdgeLabel")):
+        groups.append(Fingerprint(group, children=(
+            Fingerprint(name, __composite_payload__(index, None if index_labels is None else
+                                                    index_labels.get((element, name), "")))
+            for name, index in snapshot.get_composite_indices(element).items())))
+
+    return Fingerprint(snapshot.graph_name, children=groups)
+
+
+def __composite_payload__(index, constraint):
+    # constraint: label the index is constrained to, "" when it isn't, None when unknown
+    payload = canonicalize(index, sort_properties=False)
+    if constraint is None:
+        return payload
+    return __length_prefixed__(payload) + __length_prefixed__(constraint.encode())
@@ -0,0 +1,170 @@
+import sys
+
+from management import management_pb2
+
+
+class Info:
+    """Immutable read model of a schema message. Subclasses declare their fields as __slots__."""
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.__values__() == other.__values__()
+
+    def __hash__(self):
+        return hash(self.__values__())
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__))
+
+    def __values__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __reduce__(self):
+        return type(self).__new_from__, (self.__values__(),)
+
+    @classmethod
+    def __new_from__(cls, values):
+        return cls(**dict(zip(cls.__slots__, values)))
+
+
+def __id__(message):
+    return message.id.value if message.HasField("id") else None
+
+
+def __enum_name__(enum_type, value):
+    return sys.intern(enum_type.Name(value))
+
+
+class PropertyInfo(Info):
+    __slots__ = ("id", "name", "data_type", "cardinality")
+
+    @classmethod
+    def from_proto(cls, message):
+        """
+        Args:
+            message (management_pb2.VertexProperty or management_pb2.EdgeProperty): Edge properties have no
+                cardinality, it is None for them
+
+        Returns:
+            PropertyInfo
+        """
+        cardinality = None
+        if message.DESCRIPTOR.name == "VertexProperty":
+            cardinality = __enum_name__(management_pb2.VertexProperty.Cardinality, message.cardinality)
+
+        return cls(id=__id__(message), name=sys.intern(message.name),
+                   data_type=__enum_name__(management_pb2.PropertyDataType, message.dataType),
+                   cardinality=cardinality)
+
+
+class VertexLabelInfo(Info):
+    __slots__ = ("id", "name", "properties", "read_only", "partitioned")
+
+    @classmethod
+    def from_proto(cls, message):
+        """
+        Args:
+            message (management_pb2.VertexLabel):
+
+        Returns:
+            VertexLabelInfo
+        """
+        return cls(id=__id__(message), name=sys.intern(message.name),
+                   properties=tuple(PropertyInfo.from_proto(prop) for prop in message.properties),
+                   read_only=message.readOnly, partitioned=message.partitioned)
+
+
+class EdgeLabelInfo(Info):
+    __slots__ = ("id", "name", "properties", "directed", "direction", "multiplicity")
+
+    @classmethod
+    def from_proto(cls, message):
+        """
+        Args:
+            message (management_pb2.EdgeLabel):
+
+        Returns:
+            EdgeLabelInfo
+        """
+        return cls(id=__id__(message), name=sys.intern(message.name),
+                   properties=tuple(PropertyInfo.from_proto(prop) for prop in message.properties),
+                   directed=__enum_name__(management_pb2.EdgeLabel.Directed, message.directed),
+                   direction=__enum_name__(management_pb2.EdgeLabel.Direction, message.direction),
+                   multiplicity=__enum_name__(management_pb2.EdgeLabel.Multiplicity, message.multiplicity))
+
+
+class CompositeIndexInfo(Info):
+    __slots__ = ("id", "name", "element", "properties", "unique")
+
+    @classmethod
+    def from_proto(cls, message):
+        """
+        Args:
+            message (management_pb2.CompositeVertexIndex or management_pb2.CompositeEdgeIndex): Edge indices are
+                never unique
+
+        Returns:
+            CompositeIndexInfo
+        """
+        element = "VertexLabel" if message.DESCRIPTOR.name == "CompositeVertexIndex" else "EdgeLabel"
+
+        return cls(id=__id__(message), name=sys.intern(message.name), element=element,
+                   properties=tuple(PropertyInfo.from_proto(prop) for prop in message.properties),
+                   unique=element == "VertexLabel" and message.unique)
+
+
+class MixedIndexInfo(Info):
+    __slots__ = ("id", "name", "element", "properties", "backend")
+
+    @classmethod
+    def from_proto(cls, message):
+        """
+        Args:
+            message (management_pb2.MixedVertexIndex or management_pb2.MixedEdgeIndex):
+
+        Returns:
+            MixedIndexInfo
+        """
+        element = "VertexLabel" if message.DESCRIPTOR.name == "MixedVertexIndex" else "EdgeLabel"
+
+        return cls(id=__id__(message), name=sys.intern(message.name), element=element,
+                   properties=tuple(PropertyInfo.from_proto(prop) for prop in message.properties),
+                   backend=sys.intern(message.backend))
+
+
+INFO_CLASSES = {
+    "VertexProperty": PropertyInfo,
+    "EdgeProperty": PropertyInfo,
+    "VertexLabel": VertexLabelInfo,
+    "EdgeLabel": EdgeLabelInfo,
+    "CompositeVertexIndex": CompositeIndexInfo,
+    "CompositeEdgeIndex": CompositeIndexInfo,
+    "MixedVertexIndex": MixedIndexInfo,
+    "MixedEdgeIndex": MixedIndexInfo,
+}
+
+
+def to_info(message):
+    """
+    Args:
+        message: Any management_pb2 label, property or index message, or a LazyMessage of one
+
+    Returns:
+        Info: Read model of the message
+    """
+    name = message.DESCRIPTOR.name
+
+    if name not in INFO_CLASSES:
+        raise NotImplementedError(f"No read model for {name}, implemented only for {list(INFO_CLASSES)}")
+
+    return INFO_CLASSES[name].from_proto(message)
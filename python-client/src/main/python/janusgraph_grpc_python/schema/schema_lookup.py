@@ -0,0 +1,183 @@
+import threading
+from collections import defaultdict, Counter
+
+from .schema_info import Info, to_info, VertexLabelInfo, EdgeLabelInfo, CompositeIndexInfo
+
+
+class SchemaLookup:
+
+    def __init__(self, graph_name):
+        """Read models of one context's labels and indices with inverted lookups maintained as they are added,
+        replaced or removed:
+
+            property name -> labels carrying it
+            property name -> composite and mixed indices covering it
+            data type -> property names declared with it
+
+        Args:
+            graph_name (str):
+        """
+        self.graph_name = graph_name
+
+        # (element, label name) -> VertexLabelInfo/EdgeLabelInfo
+        self.labels = {}
+        # (kind, element, [label name,] index name) -> CompositeIndexInfo/MixedIndexInfo
+        self.indices = {}
+
+        self.property_labels = defaultdict(set)
+        self.property_indices = defaultdict(set)
+        # data type -> property name -> number of labels and indices declaring it with that type
+        self.data_type_properties = defaultdict(Counter)
+
+        self.LOCK = threading.RLock()
+
+    def __repr__(self):
+        return 'SchemaLookup(%s, %d labels, %d indices, %d properties)' % (
+            self.graph_name, len(self.labels), len(self.indices), len(self.property_labels))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Args:
+            snapshot (SchemaSnapshot):
+
+        Returns:
+            SchemaLookup
+        """
+        lookup = cls(snapshot.graph_name)
+
+        for element in ("VertexLabel", "EdgeLabel"):
+            for label in snapshot.get_labels(element).values():
+                lookup.update(label)
+            for index in snapshot.get_composite_indices(element).values():
+                lookup.update(index)
+            for label_name, indices in snapshot.get_mixed_indices(element).items():
+                for index in indices.values():
+                    lookup.update(index, label_name)
+
+        return lookup
+
+    def update(self, message, label_name=None):
+        """Adds a label or index, replacing the previous version with the same name. e.g. with an Ensure* response.
+
+        Args:
+            message: management_pb2 label/index message, LazyMessage of one, or its Info read model
+            label_name (str): Label of a mixed index, which the message doesn't carry
+
+        Returns:
+            Info: Read model which was added
+        """
+        info = message if isinstance(message, Info) else to_info(message)
+        key = self.__key__(info, label_name)
+
+        with self.LOCK:
+            self.__remove__(key)
+
+            if key[0] == "Label":
+                self.labels[key[1:]] = info
+                postings = self.property_labels
+            else:
+                self.indices[key] = info
+                postings = self.property_indices
+
+            for prop in info.properties:
+                postings[prop.name].add(key)
+                self.data_type_properties[prop.data_type][prop.name] += 1
+
+        return info
+
+    def remove_label(self, element, name):
+        with self.LOCK:
+            self.__remove__(("Label", element, name))
+
+    def remove_index(self, kind, element, name, label_name=None):
+        """
+        Args:
+            kind (str): CompositeIndex or MixedIndex
+            element (str): VertexLabel or EdgeLabel
+            name (str):
+            label_name (str): Label of a mixed index
+        """
+        key = (kind, element, name) if kind == "CompositeIndex" else (kind, element, label_name, name)
+
+        with self.LOCK:
+            self.__remove__(key)
+
+    def get_labels_with_property(self, property_name, element=None):
+        """
+        Args:
+            property_name (str):
+            element (str): VertexLabel or EdgeLabel, None for both
+
+        Returns:
+            list: VertexLabelInfo/EdgeLabelInfo of the labels carrying the property, by name
+        """
+        with self.LOCK:
+            return sorted((self.labels[key[1:]] for key in self.property_labels.get(property_name, ())
+                           if element is None or key[1] == element), key=lambda label: label.name)
+
+    def get_indices_with_property(self, property_name, element=None, kind=None, label_name=None):
+        """
+        Args:
+            property_name (str):
+            element (str): VertexLabel or EdgeLabel, None for both
+            kind (str): CompositeIndex or MixedIndex, None for both
+            label_name (str): Only keep the mixed indices of this label. Mixed indices are listed per label, so
+                they are constrained to it. Composite indices are listed for the whole graph without their label
+                constraint and always kept, see fetch_composite_index_labels
+
+        Returns:
+            list: CompositeIndexInfo/MixedIndexInfo of the indices covering the property, by name
+        """
+        with self.LOCK:
+            return sorted((self.indices[key] for key in self.property_indices.get(property_name, ())
+                           if (element is None or key[1] == element) and (kind is None or key[0] == kind)
+                           and (label_name is None or key[0] != "MixedIndex" or key[2] == label_name)),
+                          key=lambda index: index.name)
+
+    def get_properties_of_type(self, data_type):
+        """
+        Args:
+            data_type (str): PropertyDataType name, e.g. String
+
+        Returns:
+            list[str]: Property names declared with that data type, sorted
+        """
+        with self.LOCK:
+            return sorted(self.data_type_properties.get(data_type, ()))
+
+    def get_label(self, element, name):
+        return self.labels.get((element, name))
+
+    def __key__(self, info, label_name):
+        if isinstance(info, (VertexLabelInfo, EdgeLabelInfo)):
+            return "Label", "VertexLabel" if isinstance(info, VertexLabelInfo) else "EdgeLabel", info.name
+        if isinstance(info, CompositeIndexInfo):
+            return "CompositeIndex", info.element, info.name
+        if label_name is None:
+            raise ValueError(f"The label_name of mixed index {info.name} is needed to add it")
+        return "MixedIndex", info.element, label_name, info.name
+
+    def __remove__(self, key):
+        if key[0] == "Label":
+            info = self.labels.pop(key[1:], None)
+            postings = self.property_labels
+        else:
+            info = self.indices.pop(key, None)
+            postings = self.property_indices
+
+        if info is None:
+            return
+
+        for prop in info.properties:
+            holders = postings[prop.name]
+            holders.discard(key)
+            if not holders:
+                del postings[prop.name]
+
+            names = self.data_type_properties[prop.data_type]
+            names[prop.name] -= 1
+            if names[prop.name] <= 0:
+                del names[prop.name]
+                if not names:
+                    del self.data_type_properties[prop.data_type]
@@ -0,0 +1,194 @@
+import json
+
+from management import management_pb2
+from graph_operation.graph_adder import GraphElementAdder
+from structure.element.vertex import GRAPH_NAME
+from structure.index.composite_index import CompositeIndex
+from structure.index.mixed_index import MixedIndex
+from .schema_operation import SchemaOperation
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+VERTEX_LABEL_KEYS = ["name", "properties", "readOnly", "partitioned", "compositeIndexes", "mixedIndexes"]
+EDGE_LABEL_KEYS = ["name", "properties", "multiplicity", "directed", "compositeIndexes", "mixedIndexes"]
+PROPERTY_KEYS = ["name", "dataType", "cardinality"]
+COMPOSITE_INDEX_KEYS = ["name", "properties", "unique"]
+MIXED_INDEX_KEYS = ["name", "properties", "backend"]
+
+
+def load_manifest(path):
+    """Reads a JSON manifest, or a YAML one (.yaml/.yml) when PyYAML is installed.
+
+    Args:
+        path (str):
+
+    Returns:
+        SchemaManifest
+    """
+    with open(path) as manifest_file:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError("PyYAML is required to read YAML manifests. Install it with `pip install pyyaml`")
+            definition = yaml.safe_load(manifest_file)
+        else:
+            definition = json.load(manifest_file)
+
+    return SchemaManifest(definition)
+
+
+def __check_keys__(definition, supported_keys, what):
+    invalid_keys = [key for key in definition.keys() if key not in supported_keys]
+
+    if len(invalid_keys) > 0:
+        raise LookupError(f"Invalid parameter passed for {what}. The passed parameter {invalid_keys} "
+                          f"is not part of supported parameter list {supported_keys}")
+    if "name" not in definition:
+        raise AttributeError(f"name needs to be defined for every {what}. Got {definition}")
+
+
+def __property_list__(definition, what):
+    # A single property key may be given as a plain string, which tuple()/iteration would split into characters
+    properties = definition.get("properties", [])
+
+    if isinstance(properties, str):
+        return [properties]
+    if not isinstance(properties, list):
+        raise ValueError(f"properties of {what} must be a list. Got {properties!r}")
+    return properties
+
+
+class SchemaManifest:
+
+    def __init__(self, definition):
+        """Desired schema of one graph context:
+
+            {"graph": "graph_berkleydb",
+             "vertexLabels": [{"name": "person", "readOnly": false, "partitioned": false,
+                               "properties": ["name", {"name": "age", "dataType": "Int32", "cardinality": "Single"}],
+                               "compositeIndexes": [{"name": "byAge", "properties": ["age"], "unique": false}],
+                               "mixedIndexes": [{"name": "byName", "properties": ["name"], "backend": "search"}]}],
+             "edgeLabels": [{"name": "knows", "multiplicity": "Many2One", "directed": true,
+                             "properties": ["since"], "compositeIndexes": [], "mixedIndexes": []}]}
+
+        Args:
+            definition (dict): Parsed JSON/YAML manifest
+        """
+        self.graph_name = definition.get("graph", GRAPH_NAME)
+        self.vertex_labels = [self.__normalize_label__(label, VERTEX_LABEL_KEYS, "VertexLabel")
+                              for label in definition.get("vertexLabels", [])]
+        self.edge_labels = [self.__normalize_label__(label, EDGE_LABEL_KEYS, "EdgeLabel")
+                            for label in definition.get("edgeLabels", [])]
+
+    def __repr__(self):
+        return 'SchemaManifest(%s, %d vertexLabels, %d edgeLabels)' % (self.graph_name, len(self.vertex_labels),
+                                                                       len(self.edge_labels))
+
+    @staticmethod
+    def __normalize_label__(label, supported_keys, element):
+        __check_keys__(label, supported_keys, element)
+
+        label = dict(label)
+        label["properties"] = [{"name": prop} if isinstance(prop, str) else prop
+                               for prop in __property_list__(label, f"{element} {label['name']}")]
+        for prop in label["properties"]:
+            __check_keys__(prop, PROPERTY_KEYS, f"property of {element} {label['name']}")
+
+        label["compositeIndexes"] = [dict(index) for index in label.get("compositeIndexes", [])]
+        for index in label["compositeIndexes"]:
+            __check_keys__(index, COMPOSITE_INDEX_KEYS, f"compositeIndex of {element} {label['name']}")
+            index["properties"] = __property_list__(index, f"compositeIndex {index['name']}")
+
+        label["mixedIndexes"] = [dict(index) for index in label.get("mixedIndexes", [])]
+        for index in label["mixedIndexes"]:
+            __check_keys__(index, MIXED_INDEX_KEYS, f"mixedIndex of {element} {label['name']}")
+            index["properties"] = __property_list__(index, f"mixedIndex {index['name']}")
+
+        return label
+
+    def get_context(self):
+        return management_pb2.JanusGraphContext(graphName=self.graph_name)
+
+    def get_operations(self):
+        """Ensure* operations for every label and index of the manifest, labels first.
+
+        Returns:
+            list[SchemaOperation]
+        """
+        context = self.get_context()
+
+        labels = []
+        indices = []
+        for element, definitions in [("VertexLabel", self.vertex_labels), ("EdgeLabel", self.edge_labels)]:
+            for definition in definitions:
+                labels.append(self.__label_operation__(context, element, definition))
+
+                for index in definition["compositeIndexes"]:
+                    indices.append(self.__composite_index_operation__(context, element, definition["name"], index))
+                for index in definition["mixedIndexes"]:
+                    indices.append(self.__mixed_index_operation__(context, element, definition["name"], index))
+
+        return labels + indices
+
+    @staticmethod
+    def __label_operation__(context, element, definition):
+        properties = [prop["name"] for prop in definition["properties"]]
+
+        if element == "VertexLabel":
+            adder = GraphElementAdder(properties=properties or None, readOnly=definition.get("readOnly"),
+                                      partitioned=definition.get("partitioned"))
+            adder.set_element(management_pb2.VertexLabel(name=definition["name"]))
+        else:
+            adder = GraphElementAdder(properties=properties or None, multiplicity=definition.get("multiplicity"),
+                                      directed=definition.get("directed"))
+            adder.set_element(management_pb2.EdgeLabel(name=definition["name"]))
+
+        label = adder.get_element()
+
+        # GraphElementAdder only builds property names, dataType and cardinality come from the manifest
+        for prop, prop_definition in zip(label.properties, definition["properties"]):
+            if "dataType" in prop_definition:
+                prop.dataType = management_pb2.PropertyDataType.Value(prop_definition["dataType"])
+            if "cardinality" in prop_definition:
+                if element == "EdgeLabel":
+                    raise ValueError(f"cardinality can't be defined for properties of EdgeLabel {definition['name']}")
+                prop.cardinality = management_pb2.VertexProperty.Cardinality.Value(prop_definition["cardinality"])
+
+        if element == "VertexLabel":
+            request = management_pb2.EnsureVertexLabelRequest(context=context, label=label)
+        else:
+            request = management_pb2.EnsureEdgeLabelRequest(context=context, label=label)
+
+        return SchemaOperation(element, element, label.name, label.name, f"Ensure{element}", request, properties,
+                               definition)
+
+    @staticmethod
+    def __label_element__(element, label_name):
+        if element == "VertexLabel":
+            return management_pb2.VertexLabel(name=label_name)
+        return management_pb2.EdgeLabel(name=label_name)
+
+    @staticmethod
+    def __composite_index_operation__(context, element, label_name, definition):
+        index = CompositeIndex(index_type="CompositeIndex", index_name=definition["name"],
+                               index_on=definition["properties"], unique_index=definition.get("unique", False))
+        index.set_context(context)
+        index.set_element(SchemaManifest.__label_element__(element, label_name))
+        index.create_put_index_request()
+
+        return SchemaOperation("CompositeIndex", element, label_name, definition["name"],
+                               f"EnsureCompositeIndexBy{element}", index.REQUEST, definition["properties"], definition)
+
+    @staticmethod
+    def __mixed_index_operation__(context, element, label_name, definition):
+        index = MixedIndex(index_type="MixedIndex", index_name=definition["name"], index_on=definition["properties"],
+                           index_backend=definition.get("backend", "search"))
+        index.set_context(context)
+        index.set_element(SchemaManifest.__label_element__(element, label_name))
+        index.create_put_index_request()
+
+        return SchemaOperation("MixedIndex", element, label_name, definition["name"],
+                               f"EnsureMixedIndexBy{element}", index.REQUEST, definition["properties"], definition)
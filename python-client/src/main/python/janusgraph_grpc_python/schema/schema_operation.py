@@ -0,0 +1,42 @@
+from management import management_pb2_grpc
+
+STUB_CLASSES = {
+    "VertexLabel": management_pb2_grpc.ManagementForVertexLabelsStub,
+    "EdgeLabel": management_pb2_grpc.ManagementForEdgeLabelsStub,
+}
+
+
+class SchemaOperation:
+
+    def __init__(self, kind, element, label, name, rpc, request, properties=(), definition=None):
+        """A single Ensure* RPC of a schema rollout.
+
+        Args:
+            kind (str): VertexLabel, EdgeLabel, CompositeIndex or MixedIndex
+            element (str): VertexLabel or EdgeLabel, the label kind the operation is made on
+            label (str): Name of the label
+            name (str): Name of the label or of the index
+            rpc (str): Name of the stub method, e.g. EnsureCompositeIndexByVertexLabel
+            request: The request message
+            properties (Sequence[str]): Property keys declared (labels) or indexed (indexes), a str for a single one
+            definition (dict): Manifest entry the operation was built from, if any
+        """
+        self.kind = kind
+        self.element = element
+        self.label = label
+        self.name = name
+        self.rpc = rpc
+        self.request = request
+        self.properties = (properties,) if isinstance(properties, str) else tuple(properties)
+        self.definition = definition
+
+    def __repr__(self):
+        if self.kind == self.element:
+            return f'{self.kind}({self.name})'
+        return f'{self.kind}({self.name} on {self.element} {self.label})'
+
+    def get_stub_class(self):
+        return STUB_CLASSES[self.element]
+
+    def is_label(self):
+        return self.kind == self.element
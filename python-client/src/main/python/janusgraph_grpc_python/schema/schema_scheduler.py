@@ -0,0 +1,83 @@
+from collections import defaultdict
+
+
+class SchemaDag:
+
+    def __init__(self, operations):
+        """Dependency graph of SchemaOperations. An index depends on the operation ensuring its label and on
+        every label operation declaring one of its properties (property keys are shared by all labels of a
+        graph). Labels don't depend on anything, so unrelated labels and indices can run concurrently.
+
+        Args:
+            operations (Iterable[SchemaOperation]):
+        """
+        self.operations = list(operations)
+        # operation index -> indices of the operations it waits for / of the operations waiting for it
+        self.dependencies = defaultdict(set)
+        self.dependents = defaultdict(set)
+
+        labels = {}
+        property_providers = defaultdict(set)
+        for i, operation in enumerate(self.operations):
+            if operation.is_label():
+                labels[(operation.element, operation.label)] = i
+                for prop in operation.properties:
+                    property_providers[prop].add(i)
+
+        for i, operation in enumerate(self.operations):
+            if operation.is_label():
+                continue
+
+            dependencies = set()
+            if (operation.element, operation.label) in labels:
+                dependencies.add(labels[(operation.element, operation.label)])
+            for prop in operation.properties:
+                dependencies.update(property_providers[prop])
+
+            for dependency in dependencies:
+                self.dependencies[i].add(dependency)
+                self.dependents[dependency].add(i)
+
+    def __len__(self):
+        return len(self.operations)
+
+    def get_layers(self):
+        """Operations grouped so that every operation only depends on operations of earlier layers.
+
+        Returns:
+            list[list[int]]: Operation indices per layer
+        """
+        remaining = {i: len(self.dependencies[i]) for i in range(len(self.operations))}
+        layer = [i for i, count in remaining.items() if count == 0]
+        layers = []
+
+        while layer:
+            layers.append(layer)
+            next_layer = []
+            for i in layer:
+                for dependent in self.dependents[i]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_layer.append(dependent)
+            layer = sorted(next_layer)
+
+        if sum(len(layer) for layer in layers) != len(self.operations):
+            raise ValueError("Schema operations contain a dependency cycle")
+
+        return layers
+
+    def get_descendants(self, i):
+        """
+        Returns:
+            set[int]: Indices of every operation transitively depending on operation i
+        """
+        descendants = set()
+        stack = list(self.dependents[i])
+
+        while stack:
+            dependent = stack.pop()
+            if dependent not in descendants:
+                descendants.add(dependent)
+                stack.extend(self.dependents[dependent])
+
+        return descendants
@@ -0,0 +1,180 @@
+from collections import deque
+from functools import partial
+
+from management import management_pb2, management_pb2_grpc
+from connection.channel_pool import get_channel_pool
+
+# Streams started and not drained yet, the per label listings would otherwise all be started at once
+DEFAULT_MAX_IN_FLIGHT = 16
+
+
+class SchemaSnapshot:
+
+    def __init__(self, graph_name):
+        """Schema of one graph context as streamed by the server, keyed by name.
+
+        Args:
+            graph_name (str):
+        """
+        self.graph_name = graph_name
+
+        self.vertex_labels = {}
+        self.edge_labels = {}
+        self.composite_vertex_indices = {}
+        self.composite_edge_indices = {}
+        # label name -> {index name -> MixedVertexIndex/MixedEdgeIndex}. Only fetched for the requested labels
+        self.mixed_vertex_indices = {}
+        self.mixed_edge_indices = {}
+
+    def __repr__(self):
+        return 'SchemaSnapshot(%s, %d vertexLabels, %d edgeLabels)' % (self.graph_name, len(self.vertex_labels),
+                                                                       len(self.edge_labels))
+
+    def get_labels(self, element):
+        return self.vertex_labels if element == "VertexLabel" else self.edge_labels
+
+    def get_composite_indices(self, element):
+        return self.composite_vertex_indices if element == "VertexLabel" else self.composite_edge_indices
+
+    def get_mixed_indices(self, element):
+        return self.mixed_vertex_indices if element == "VertexLabel" else self.mixed_edge_indices
+
+
+def fetch_schema(channel, graph_name, mixed_index_labels=(), max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """Fetches the schema of a context with one call of each streaming RPC. The four listing RPCs are started
+    together and drained afterwards, mixed indices are only listed per label so they are fetched for
+    mixed_index_labels only.
+
+    Args:
+        channel (grpc.Channel):
+        graph_name (str):
+        mixed_index_labels (Iterable[tuple]): (element, label name) pairs to fetch mixed indices for
+        max_in_flight (int): Streams started before waiting for the oldest one to be drained
+
+    Returns:
+        SchemaSnapshot
+    """
+    channel_pool = get_channel_pool()
+    vertex_service = channel_pool.get_stub(channel, management_pb2_grpc.ManagementForVertexLabelsStub)
+    edge_service = channel_pool.get_stub(channel, management_pb2_grpc.ManagementForEdgeLabelsStub)
+
+    context = management_pb2.JanusGraphContext(graphName=graph_name)
+    snapshot = SchemaSnapshot(graph_name)
+
+    streams = [
+        (snapshot.vertex_labels, partial(vertex_service.GetVertexLabels,
+                                         management_pb2.GetVertexLabelsRequest(context=context))),
+        (snapshot.edge_labels, partial(edge_service.GetEdgeLabels,
+                                       management_pb2.GetEdgeLabelsRequest(context=context))),
+        (snapshot.composite_vertex_indices, partial(
+            vertex_service.GetCompositeIndicesForVertex,
+            management_pb2.GetCompositeIndicesForVertexRequest(context=context))),
+        (snapshot.composite_edge_indices, partial(
+            edge_service.GetCompositeIndicesForEdge,
+            management_pb2.GetCompositeIndicesForEdgeRequest(context=context))),
+    ]
+
+    streams.extend(__mixed_index_streams__(vertex_service, edge_service, snapshot, mixed_index_labels))
+
+    for target, message in __drain_streams__(streams, max_in_flight):
+        target[message.name] = message
+
+    return snapshot
+
+
+def fetch_mixed_indices(channel, snapshot, mixed_index_labels, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """Adds the mixed indices of more labels to an already fetched snapshot, e.g. of every label it lists.
+
+    Args:
+        channel (grpc.Channel):
+        snapshot (SchemaSnapshot):
+        mixed_index_labels (Iterable[tuple]): (element, label name) pairs to fetch mixed indices for
+        max_in_flight (int): Streams started before waiting for the oldest one to be drained
+
+    Returns:
+        SchemaSnapshot
+    """
+    channel_pool = get_channel_pool()
+    vertex_service = channel_pool.get_stub(channel, management_pb2_grpc.ManagementForVertexLabelsStub)
+    edge_service = channel_pool.get_stub(channel, management_pb2_grpc.ManagementForEdgeLabelsStub)
+
+    streams = __mixed_index_streams__(vertex_service, edge_service, snapshot, mixed_index_labels)
+    for target, message in __drain_streams__(streams, max_in_flight):
+        target[message.name] = message
+
+    return snapshot
+
+
+def fetch_composite_index_labels(channel, snapshot, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """Lists the composite indices of every label of the snapshot, which tells the label an index is constrained
+    to. GetCompositeIndicesForVertex/ForEdge list every composite index without it.
+
+    Args:
+        channel (grpc.Channel):
+        snapshot (SchemaSnapshot):
+        max_in_flight (int): Streams started before waiting for the oldest one to be drained
+
+    Returns:
+        dict: (element, index name) -> label name, for the label constrained composite indices only
+    """
+    channel_pool = get_channel_pool()
+    vertex_service = channel_pool.get_stub(channel, management_pb2_grpc.ManagementForVertexLabelsStub)
+    edge_service = channel_pool.get_stub(channel, management_pb2_grpc.ManagementForEdgeLabelsStub)
+
+    context = management_pb2.JanusGraphContext(graphName=snapshot.graph_name)
+    streams = []
+
+    for label_name in snapshot.vertex_labels:
+        request = management_pb2.GetCompositeIndicesByVertexLabelRequest(
+            context=context, vertexLabel=management_pb2.VertexLabel(name=label_name))
+        streams.append((("VertexLabel", label_name), partial(vertex_service.GetCompositeIndicesByVertexLabel, request)))
+    for label_name in snapshot.edge_labels:
+        request = management_pb2.GetCompositeIndicesByEdgeLabelRequest(
+            context=context, edgeLabel=management_pb2.EdgeLabel(name=label_name))
+        streams.append((("EdgeLabel", label_name), partial(edge_service.GetCompositeIndicesByEdgeLabel, request)))
+
+    index_labels = {}
+    for (element, label_name), message in __drain_streams__(streams, max_in_flight):
+        index_labels[(element, message.name)] = label_name
+
+    return index_labels
+
+
+def __mixed_index_streams__(vertex_service, edge_service, snapshot, mixed_index_labels):
+    context = management_pb2.JanusGraphContext(graphName=snapshot.graph_name)
+    streams = []
+
+    for element, label_name in mixed_index_labels:
+        indices = snapshot.get_mixed_indices(element).setdefault(label_name, {})
+
+        if element == "VertexLabel":
+            request = management_pb2.GetMixedIndicesByVertexLabelRequest(
+                context=context, vertexLabel=management_pb2.VertexLabel(name=label_name))
+            streams.append((indices, partial(vertex_service.GetMixedIndicesByVertexLabel, request)))
+        else:
+            request = management_pb2.GetMixedIndicesByEdgeLabelRequest(
+                context=context, edgeLabel=management_pb2.EdgeLabel(name=label_name))
+            streams.append((indices, partial(edge_service.GetMixedIndicesByEdgeLabel, request)))
+
+    return streams
+
+
+def __drain_streams__(streams, max_in_flight):
+    # streams: (target, call) pairs, call() starting the streaming RPC. Yields (target, message) with at most
+    # max_in_flight streams started and not drained
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at-least 1. Got {max_in_flight}")
+
+    in_flight = deque()
+    for target, call in streams:
+        in_flight.append((target, call()))
+
+        if len(in_flight) >= max_in_flight:
+            target, stream = in_flight.popleft()
+            for message in stream:
+                yield target, message
+
+    while in_flight:
+        target, stream = in_flight.popleft()
+        for message in stream:
+            yield target, message
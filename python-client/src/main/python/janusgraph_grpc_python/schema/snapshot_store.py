@@ -0,0 +1,313 @@
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from management import management_pb2, management_pb2_grpc
+from connection.channel_pool import get_channel_pool
+from .schema_snapshot import SchemaSnapshot, fetch_schema, fetch_mixed_indices
+from .schema_lookup import SchemaLookup
+
+MAGIC = b"JGSS"
+VERSION = 1
+# Snapshots written against another management.proto are discarded instead of being misread
+DESCRIPTOR_CRC = zlib.crc32(management_pb2.DESCRIPTOR.serialized_pb)
+
+HEADER = struct.Struct("<4sHId")  # magic, version, descriptor crc, written at (epoch seconds)
+FRAME = struct.Struct("<BI")  # kind, payload length
+
+# Frame kinds. Every frame belongs to the last CONTEXT frame, mixed index frames to the last MIXED_*_LABEL frame
+CONTEXT = 1
+VERTEX_LABEL = 2
+EDGE_LABEL = 3
+COMPOSITE_VERTEX_INDEX = 4
+COMPOSITE_EDGE_INDEX = 5
+MIXED_VERTEX_LABEL = 6
+MIXED_VERTEX_INDEX = 7
+MIXED_EDGE_LABEL = 8
+MIXED_EDGE_INDEX = 9
+
+MESSAGE_FRAMES = {
+    VERTEX_LABEL: ("vertex_labels", management_pb2.VertexLabel),
+    EDGE_LABEL: ("edge_labels", management_pb2.EdgeLabel),
+    COMPOSITE_VERTEX_INDEX: ("composite_vertex_indices", management_pb2.CompositeVertexIndex),
+    COMPOSITE_EDGE_INDEX: ("composite_edge_indices", management_pb2.CompositeEdgeIndex),
+}
+MIXED_FRAMES = {
+    MIXED_VERTEX_LABEL: ("mixed_vertex_indices", MIXED_VERTEX_INDEX, management_pb2.MixedVertexIndex),
+    MIXED_EDGE_LABEL: ("mixed_edge_indices", MIXED_EDGE_INDEX, management_pb2.MixedEdgeIndex),
+}
+
+DEFAULT_REFRESH_INTERVAL = 300
+
+
+def fetch_snapshots(channel, graph_names=None, mixed_indices=True):
+    """
+    Args:
+        channel (grpc.Channel):
+        graph_names (list): Contexts to fetch. None for every context returned by GetContexts
+        mixed_indices (bool): Also fetch the mixed indices of every label, one RPC per label
+
+    Returns:
+        dict: graphName -> SchemaSnapshot
+    """
+    if graph_names is None:
+        service = get_channel_pool().get_stub(channel, management_pb2_grpc.AccessContextStub)
+        graph_names = [context.graphName for context in service.GetContexts(management_pb2.GetContextsRequest())]
+
+    snapshots = {}
+    for graph_name in graph_names:
+        snapshot = fetch_schema(channel, graph_name)
+        if mixed_indices:
+            fetch_mixed_indices(channel, snapshot,
+                                [("VertexLabel", name) for name in snapshot.vertex_labels] +
+                                [("EdgeLabel", name) for name in snapshot.edge_labels])
+        snapshots[graph_name] = snapshot
+
+    return snapshots
+
+
+def replace_file(path, data):
+    """Atomically replaces path by a file holding data, so readers see either the old or the new content
+
+    Args:
+        path (str):
+        data (bytes):
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path))
+    try:
+        # mkstemp creates the file owner-only, other worker users must be able to read it
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def write_snapshots(path, snapshots):
+    """Writes schema snapshots as length-prefixed protobuf frames behind a versioned header. The file is
+    replaced atomically so readers never see a partial snapshot.
+
+    Args:
+        path (str):
+        snapshots (Iterable[SchemaSnapshot]):
+    """
+    data = bytearray(HEADER.pack(MAGIC, VERSION, DESCRIPTOR_CRC, time.time()))
+
+    def frame(kind, payload):
+        data.extend(FRAME.pack(kind, len(payload)))
+        data.extend(payload)
+
+    for snapshot in snapshots:
+        frame(CONTEXT, snapshot.graph_name.encode("utf-8"))
+
+        for kind, (attribute, _) in MESSAGE_FRAMES.items():
+            for message in getattr(snapshot, attribute).values():
+                frame(kind, message.SerializeToString())
+
+        for label_kind, (attribute, index_kind, _) in MIXED_FRAMES.items():
+            for label_name, indices in getattr(snapshot, attribute).items():
+                frame(label_kind, label_name.encode("utf-8"))
+                for message in indices.values():
+                    frame(index_kind, message.SerializeToString())
+
+    replace_file(path, data)
+
+
+def read_snapshots(path):
+    """
+    Args:
+        path (str): File written by write_snapshots
+
+    Returns:
+        tuple: (written at in epoch seconds, dict of graphName -> SchemaSnapshot)
+
+    Raises:
+        ValueError: When the file isn't a snapshot, was written by another format version or against another
+        management.proto, or is truncated
+    """
+    with open(path, "rb") as snapshot_file:
+        data = snapshot_file.read()
+
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a schema snapshot")
+
+    magic, version, descriptor_crc, written_at = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a schema snapshot")
+    if version != VERSION or descriptor_crc != DESCRIPTOR_CRC:
+        raise ValueError(f"{path} was written by an incompatible version (format {version})")
+
+    snapshots = {}
+    snapshot = None
+    mixed_indices = None
+    offset = HEADER.size
+
+    while offset < len(data):
+        if offset + FRAME.size > len(data):
+            raise ValueError(f"{path} is truncated")
+        kind, length = FRAME.unpack_from(data, offset)
+        offset += FRAME.size
+        payload = data[offset:offset + length]
+        if len(payload) != length:
+            raise ValueError(f"{path} is truncated")
+        offset += length
+
+        if kind == CONTEXT:
+            snapshot = SchemaSnapshot(payload.decode("utf-8"))
+            snapshots[snapshot.graph_name] = snapshot
+        elif snapshot is None:
+            raise ValueError(f"{path} has a schema frame outside of a context")
+        elif kind in MESSAGE_FRAMES:
+            attribute, message_class = MESSAGE_FRAMES[kind]
+            message = message_class.FromString(payload)
+            getattr(snapshot, attribute)[message.name] = message
+        elif kind in MIXED_FRAMES:
+            attribute, index_kind, message_class = MIXED_FRAMES[kind]
+            mixed_indices = (index_kind, message_class,
+                             getattr(snapshot, attribute).setdefault(payload.decode("utf-8"), {}))
+        elif mixed_indices is not None and kind == mixed_indices[0]:
+            message = mixed_indices[1].FromString(payload)
+            mixed_indices[2][message.name] = message
+        else:
+            raise ValueError(f"{path} has an unexpected frame of kind {kind}")
+
+    return written_at, snapshots
+
+
+class SnapshotStore:
+
+    def __init__(self, path, target, graph_names=None, refresh_interval=DEFAULT_REFRESH_INTERVAL,
+                 mixed_indices=True):
+        """Schema snapshots of one or more contexts persisted to a local file, so a new process can serve label and
+        index lookups from disk right away and refresh them from the server in the background.
+
+        Args:
+            path (str): Snapshot file
+            target (str): host:port refresh() fetches the schema from. Its channel is taken from the channel pool
+                on every refresh, the pool closes the channels left idle in between
+            graph_names (list): Contexts to snapshot. None for every context returned by GetContexts
+            refresh_interval (float): Seconds between background refreshes
+            mixed_indices (bool): Also fetch the mixed indices of every label, one RPC per label
+        """
+        self.path = path
+        self.target = target
+        self.graph_names = graph_names
+        self.refresh_interval = refresh_interval
+        self.mixed_indices = mixed_indices
+
+        self.snapshots = {}
+        self.lookups = {}
+        self.written_at = None
+        self.caches = []
+
+        self.STOPPED = threading.Event()
+        self.THREAD = None
+
+    def get_snapshot(self, graph_name):
+        """
+        Returns:
+            SchemaSnapshot: Or None when the context isn't part of the snapshot
+        """
+        return self.snapshots.get(graph_name)
+
+    def get_lookup(self, graph_name):
+        """
+        Returns:
+            SchemaLookup: Inverted lookups over the snapshot of the context, rebuilt after every load/refresh. None
+            when the context isn't part of the snapshot
+        """
+        lookups = self.lookups
+        lookup = lookups.get(graph_name)
+
+        if lookup is None and graph_name in self.snapshots:
+            lookup = lookups[graph_name] = SchemaLookup.from_snapshot(self.snapshots[graph_name])
+
+        return lookup
+
+    def get_age(self):
+        """
+        Returns:
+            float: Seconds since the snapshot was written, None when nothing is loaded
+        """
+        return None if self.written_at is None else time.time() - self.written_at
+
+    def load(self):
+        """
+        Returns:
+            bool: Whether a usable snapshot file was loaded
+        """
+        try:
+            written_at, snapshots = read_snapshots(self.path)
+        except (OSError, ValueError) as e:
+            print(f"Not loading schema snapshot: {e}")
+            return False
+
+        self.snapshots, self.lookups, self.written_at = snapshots, {}, written_at
+        self.__warm_caches__()
+        return True
+
+    def refresh(self):
+        """Fetches the schema of every context from the server and rewrites the snapshot file"""
+        channel = get_channel_pool().get_channel(self.target)
+        snapshots = fetch_snapshots(channel, self.graph_names, self.mixed_indices)
+
+        write_snapshots(self.path, snapshots.values())
+
+        self.snapshots, self.lookups, self.written_at = snapshots, {}, time.time()
+        self.__warm_caches__()
+
+    def warm(self, cache):
+        """Fills a SchemaCache with the label lookups of the snapshot, now and after every refresh
+
+        Args:
+            cache (SchemaCache):
+        """
+        self.caches.append(cache)
+        self.__warm_cache__(cache)
+
+    def start(self):
+        """Refreshes in a daemon thread every refresh_interval seconds, right away when no snapshot is loaded or the
+        loaded one is older than refresh_interval"""
+        if self.THREAD is not None:
+            return
+
+        self.STOPPED.clear()
+        self.THREAD = threading.Thread(target=self.__run__, name="schema-snapshot-refresh", daemon=True)
+        self.THREAD.start()
+
+    def stop(self):
+        self.STOPPED.set()
+        if self.THREAD is not None:
+            self.THREAD.join()
+            self.THREAD = None
+
+    def __run__(self):
+        age = self.get_age()
+        delay = 0 if age is None else max(0, self.refresh_interval - age)
+
+        while not self.STOPPED.wait(delay):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Refreshing schema snapshot {self.path} failed: {type(e).__name__}: {e}")
+            delay = self.refresh_interval
+
+    def __warm_caches__(self):
+        for cache in self.caches:
+            self.__warm_cache__(cache)
+
+    def __warm_cache__(self, cache):
+        for graph_name, snapshot in self.snapshots.items():
+            for element in ("VertexLabel", "EdgeLabel"):
+                labels = snapshot.get_labels(element)
+
+                cache.invalidate(graph_name, element)
+                cache.put(graph_name, element, "ALL", labels.values())
+                for name, label in labels.items():
+                    cache.put(graph_name, element, name, [label])
@@ -0,0 +1,194 @@
+import argparse
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from concurrent import futures
+
+import grpc
+
+from management import management_pb2, management_pb2_grpc
+from server.schema_store import SchemaStore, DEFAULT_STRIPES
+
+DEFAULT_MAX_WORKERS = 32
+
+
+def __run__(context, fn, *args):
+    # The Kotlin server answers failed lookups and JanusGraph exceptions with a plain Throwable, seen as UNKNOWN
+    try:
+        return fn(*args)
+    except (LookupError, ValueError) as e:
+        context.abort(grpc.StatusCode.UNKNOWN, str(e))
+
+
+class AccessContext(management_pb2_grpc.AccessContextServicer):
+
+    def __init__(self, store):
+        self.store = store
+
+    def GetContexts(self, request, context):
+        return iter(self.store.get_contexts())
+
+    def GetContextByGraphName(self, request, context):
+        return __run__(context, lambda: self.store.get_context(
+            management_pb2.JanusGraphContext(graphName=request.name)).context)
+
+
+class ManagementForVertexLabels(management_pb2_grpc.ManagementForVertexLabelsServicer):
+
+    def __init__(self, store):
+        self.store = store
+
+    def GetVertexLabels(self, request, context):
+        return iter(__run__(context, self.store.get_labels, request.context, "VertexLabel"))
+
+    def GetVertexLabelsByName(self, request, context):
+        return iter(__run__(context, self.store.get_labels, request.context, "VertexLabel", request.name))
+
+    def EnsureVertexLabel(self, request, context):
+        return __run__(context, self.store.ensure_label, request.context, "VertexLabel", request.label)
+
+    def GetCompositeIndicesByVertexLabel(self, request, context):
+        return iter(__run__(context, self.store.get_indices, request.context, "VertexLabel", "CompositeIndex",
+                            request.vertexLabel))
+
+    def EnsureCompositeIndexByVertexLabel(self, request, context):
+        return __run__(context, self.store.ensure_index, request.context, "VertexLabel", "CompositeIndex",
+                       request.vertexLabel, request.index)
+
+    def GetCompositeIndicesForVertex(self, request, context):
+        return iter(__run__(context, self.store.get_indices, request.context, "VertexLabel", "CompositeIndex"))
+
+    def GetMixedIndicesByVertexLabel(self, request, context):
+        return iter(__run__(context, self.store.get_indices, request.context, "VertexLabel", "MixedIndex",
+                            request.vertexLabel))
+
+    def EnsureMixedIndexByVertexLabel(self, request, context):
+        return __run__(context, self.store.ensure_index, request.context, "VertexLabel", "MixedIndex",
+                       request.vertexLabel, request.index)
+
+
+class ManagementForEdgeLabels(management_pb2_grpc.ManagementForEdgeLabelsServicer):
+
+    def __init__(self, store):
+        self.store = store
+
+    def GetEdgeLabels(self, request, context):
+        return iter(__run__(context, self.store.get_labels, request.context, "EdgeLabel"))
+
+    def GetEdgeLabelsByName(self, request, context):
+        return iter(__run__(context, self.store.get_labels, request.context, "EdgeLabel", request.name))
+
+    def EnsureEdgeLabel(self, request, context):
+        return __run__(context, self.store.ensure_label, request.context, "EdgeLabel", request.label)
+
+    def GetCompositeIndicesByEdgeLabel(self, request, context):
+        return iter(__run__(context, self.store.get_indices, request.context, "EdgeLabel", "CompositeIndex",
+                            request.edgeLabel))
+
+    def EnsureCompositeIndexByEdgeLabel(self, request, context):
+        return __run__(context, self.store.ensure_index, request.context, "EdgeLabel", "CompositeIndex",
+                       request.edgeLabel, request.index)
+
+    def GetCompositeIndicesForEdge(self, request, context):
+        return iter(__run__(context, self.store.get_indices, request.context, "EdgeLabel", "CompositeIndex"))
+
+    def GetMixedIndicesByEdgeLabel(self, request, context):
+        return iter(__run__(context, self.store.get_indices, request.context, "EdgeLabel", "MixedIndex",
+                            request.edgeLabel))
+
+    def EnsureMixedIndexByEdgeLabel(self, request, context):
+        return __run__(context, self.store.ensure_index, request.context, "EdgeLabel", "MixedIndex",
+                       request.edgeLabel, request.index)
+
+
+class ReferenceServer:
+
+    def __init__(self, store=None, address="localhost:0", max_workers=DEFAULT_MAX_WORKERS, options=None):
+        """In-process stand-in for the Kotlin server, serving the three management services from a SchemaStore.
+        Listings are copied under the context lock and streamed after it is released, one message at a time.
+
+        Args:
+            store (SchemaStore): Defaults to an empty graph_berkleydb context
+            address (str): host:port, port 0 picking a free one, or unix:/path
+            max_workers (int): Threads serving RPCs, a streaming RPC holds one until it is drained
+            options (list): gRPC server arguments, gRPC's defaults when None
+        """
+        self.store = SchemaStore() if store is None else store
+        self.address = address
+        self.max_workers = max_workers
+        self.options = options
+        self.server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """
+        Returns:
+            str: Target to open channels to, e.g. localhost:41234 or unix:/tmp/janusgraph.sock
+        """
+        if self.server is not None:
+            raise ValueError("ReferenceServer is already started")
+
+        server = grpc.server(futures.ThreadPoolExecutor(self.max_workers), options=self.options)
+        management_pb2_grpc.add_AccessContextServicer_to_server(AccessContext(self.store), server)
+        management_pb2_grpc.add_ManagementForVertexLabelsServicer_to_server(ManagementForVertexLabels(self.store),
+                                                                            server)
+        management_pb2_grpc.add_ManagementForEdgeLabelsServicer_to_server(ManagementForEdgeLabels(self.store), server)
+
+        port = server.add_insecure_port(self.address)
+        if not self.address.startswith("unix:"):
+            if port == 0:
+                raise ValueError(f"Could not bind {self.address}")
+            self.address = f"{self.address.rsplit(':', 1)[0]}:{port}"
+
+        server.start()
+        self.server = server
+        return self.address
+
+    def stop(self, grace=None):
+        if self.server is not None:
+            self.server.stop(grace).wait()
+            self.server = None
+
+    def wait(self):
+        self.server.wait_for_termination()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--address', type=str, default="localhost:10182",
+                        help="host:port, port 0 picking a free one, or unix:/path")
+    parser.add_argument('--graph', type=str, action='append', default=None,
+                        help="Context to serve, may be repeated. Defaults to graph_berkleydb")
+    parser.add_argument('--vertex-labels', type=int, default=0, help="Vertex labels generated in every context")
+    parser.add_argument('--edge-labels', type=int, default=0, help="Edge labels generated in every context")
+    parser.add_argument('--properties-per-label', type=int, default=4)
+    parser.add_argument('--no-indices', action='store_true',
+                        help="Don't generate a composite and a mixed index per generated label")
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS)
+    parser.add_argument('--stripes', type=int, default=DEFAULT_STRIPES)
+
+    return parser
+
+
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+
+    schema_store = SchemaStore(args.graph or ["graph_berkleydb"], args.stripes)
+    for graph_name in args.graph or ["graph_berkleydb"]:
+        schema_store.populate(graph_name, args.vertex_labels, args.edge_labels, args.properties_per_label,
+                              not args.no_indices)
+
+    reference_server = ReferenceServer(schema_store, args.address, args.max_workers)
+    print(f"Serving {schema_store} on {reference_server.start()}")
+
+    try:
+        reference_server.wait()
+    except KeyboardInterrupt:
+        reference_server.stop()
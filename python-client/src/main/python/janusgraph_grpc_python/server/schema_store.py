@@ -0,0 +1,312 @@
+import itertools
+import threading
+import zlib
+
+from management import management_pb2
+
+DEFAULT_STRIPES = 16
+
+LABEL_CLASSES = {"VertexLabel": management_pb2.VertexLabel, "EdgeLabel": management_pb2.EdgeLabel}
+INDEX_CLASSES = {
+    ("VertexLabel", "CompositeIndex"): management_pb2.CompositeVertexIndex,
+    ("VertexLabel", "MixedIndex"): management_pb2.MixedVertexIndex,
+    ("EdgeLabel", "CompositeIndex"): management_pb2.CompositeEdgeIndex,
+    ("EdgeLabel", "MixedIndex"): management_pb2.MixedEdgeIndex,
+}
+
+
+class ContextSchema:
+
+    def __init__(self, context, lock):
+        """Schema of one graph context. Stored messages are never mutated, an update replaces them, so a listing
+        can be streamed from a copy of the dict values after the lock is released.
+
+        Args:
+            context (management_pb2.JanusGraphContext):
+            lock (threading.RLock): Stripe guarding this context, shared with other contexts
+        """
+        self.context = context
+        self.lock = lock
+        self.ids = itertools.count(1)
+
+        # name -> (id, dataType, cardinality). Property keys are shared by the vertex and edge labels
+        self.property_keys = {}
+        # element -> {name -> VertexLabel/EdgeLabel}
+        self.labels = {"VertexLabel": {}, "EdgeLabel": {}}
+        # element -> {id -> name}
+        self.label_ids = {"VertexLabel": {}, "EdgeLabel": {}}
+        # (element, kind) -> {index name -> index}. Index names are unique in a graph, whatever their kind
+        self.indices = {key: {} for key in INDEX_CLASSES}
+        # (element, kind, label name) -> {index name -> index}
+        self.label_indices = {}
+        self.index_names = set()
+
+    def __repr__(self):
+        return 'ContextSchema(%s, %d vertexLabels, %d edgeLabels, %d indices)' % (
+            self.context.graphName, len(self.labels["VertexLabel"]), len(self.labels["EdgeLabel"]),
+            len(self.index_names))
+
+
+class SchemaStore:
+
+    def __init__(self, contexts=("graph_berkleydb",), stripes=DEFAULT_STRIPES):
+        """Thread-safe in-memory schema of several graph contexts, following the JanusGraph management semantics
+        of the Kotlin server: labels are created or get new properties, property keys are created on first use
+        and never change, indices are only created.
+
+        Contexts are guarded by a fixed number of lock stripes, so writes to different contexts rarely contend and
+        the number of locks doesn't grow with the contexts.
+
+        Args:
+            contexts (Iterable): Graph names or JanusGraphContext messages
+            stripes (int): Number of locks shared by the contexts
+        """
+        if stripes < 1:
+            raise ValueError(f"stripes must be at-least 1. Got {stripes}")
+
+        self.LOCKS = [threading.RLock() for _ in range(stripes)]
+        self.CONTEXTS = {}
+
+        for context in contexts:
+            self.add_context(context)
+
+    def __repr__(self):
+        return 'SchemaStore(%s)' % ", ".join(map(repr, self.CONTEXTS.values()))
+
+    def add_context(self, context, storage_backend="inmemory"):
+        """
+        Args:
+            context (str or management_pb2.JanusGraphContext): Graph name or context
+            storage_backend (str): Used when context is a graph name
+
+        Returns:
+            ContextSchema
+        """
+        if isinstance(context, str):
+            context = management_pb2.JanusGraphContext(graphName=context, storageBackend=storage_backend)
+
+        lock = self.LOCKS[zlib.crc32(context.graphName.encode()) % len(self.LOCKS)]
+        return self.CONTEXTS.setdefault(context.graphName, ContextSchema(context, lock))
+
+    def get_contexts(self):
+        return [schema.context for schema in self.CONTEXTS.values()]
+
+    def get_context(self, context):
+        """
+        Args:
+            context (management_pb2.JanusGraphContext): Only its graphName is used
+
+        Returns:
+            ContextSchema
+        """
+        schema = self.CONTEXTS.get(context.graphName)
+        if schema is None:
+            raise LookupError("Incorrect context")
+        return schema
+
+    def get_labels(self, context, element, name=None):
+        """
+        Args:
+            context (management_pb2.JanusGraphContext):
+            element (str): VertexLabel or EdgeLabel
+            name (str): Only this label, None for every label
+
+        Returns:
+            list: VertexLabel or EdgeLabel messages
+        """
+        schema = self.get_context(context)
+        with schema.lock:
+            labels = schema.labels[element]
+            if name is None:
+                return list(labels.values())
+            return [labels[name]] if name in labels else []
+
+    def get_indices(self, context, element, kind, label=None):
+        """
+        Args:
+            context (management_pb2.JanusGraphContext):
+            element (str): VertexLabel or EdgeLabel
+            kind (str): CompositeIndex or MixedIndex
+            label (management_pb2.VertexLabel or management_pb2.EdgeLabel): Only the indices constrained to it,
+                None for every index of the kind
+
+        Returns:
+            list: Index messages
+        """
+        schema = self.get_context(context)
+        with schema.lock:
+            if label is None:
+                return list(schema.indices[(element, kind)].values())
+
+            found = self.__find_label__(schema, element, label)
+            if found is None:
+                return []
+            return list(schema.label_indices.get((element, kind, found.name), {}).values())
+
+    def ensure_label(self, context, element, request_label):
+        """Finds the label by id or name, renames it when found by id under another name, creates it otherwise,
+        and adds the requested properties it doesn't have yet.
+
+        Args:
+            context (management_pb2.JanusGraphContext):
+            element (str): VertexLabel or EdgeLabel
+            request_label (management_pb2.VertexLabel or management_pb2.EdgeLabel):
+
+        Returns:
+            VertexLabel or EdgeLabel: With the requested properties only, as the server answers
+        """
+        if not request_label.name:
+            raise ValueError("name should not be null")
+
+        schema = self.get_context(context)
+        with schema.lock:
+            labels = schema.labels[element]
+            label = self.__find_label__(schema, element, request_label)
+
+            if label is None:
+                label = LABEL_CLASSES[element](name=request_label.name)
+                label.id.value = next(schema.ids)
+                if element == "VertexLabel":
+                    label.readOnly = request_label.readOnly
+                    label.partitioned = request_label.partitioned
+                else:
+                    label.multiplicity = request_label.multiplicity
+                    label.directed = request_label.directed
+            elif label.name != request_label.name:
+                if request_label.name in labels:
+                    raise ValueError(f"Name '{request_label.name}' is already used by another {element}")
+                del labels[label.name]
+                self.__rename_label_indices__(schema, element, label.name, request_label.name)
+                label = self.__copy_message__(label)
+                label.name = request_label.name
+            else:
+                label = self.__copy_message__(label)
+
+            known = {prop.name for prop in label.properties}
+            properties = [self.__get_or_create_property__(schema, element, prop) for prop in request_label.properties]
+            for prop in properties:
+                if prop.name not in known:
+                    known.add(prop.name)
+                    label.properties.append(prop)
+
+            labels[label.name] = label
+            schema.label_ids[element][label.id.value] = label.name
+
+            response = self.__copy_message__(label)
+            del response.properties[:]
+            response.properties.extend(properties)
+            return response
+
+    def ensure_index(self, context, element, kind, request_label, request_index):
+        """Builds an index constrained to a label. Like JanusGraph, an index name can only be used once and its
+        keys must be existing property keys.
+
+        Args:
+            context (management_pb2.JanusGraphContext):
+            element (str): VertexLabel or EdgeLabel
+            kind (str): CompositeIndex or MixedIndex
+            request_label (management_pb2.VertexLabel or management_pb2.EdgeLabel):
+            request_index: CompositeVertexIndex, MixedVertexIndex, CompositeEdgeIndex or MixedEdgeIndex
+
+        Returns:
+            The created index
+        """
+        schema = self.get_context(context)
+        with schema.lock:
+            label = self.__find_label__(schema, element, request_label)
+            if label is None:
+                raise LookupError(f"{element} {request_label.name} should exists")
+            if request_index.name in schema.index_names:
+                raise ValueError(f"An index with name '{request_index.name}' has already been defined")
+            if not request_index.properties:
+                raise ValueError("Need to provide at least one index key")
+
+            index = INDEX_CLASSES[(element, kind)](name=request_index.name)
+            index.id.value = next(schema.ids)
+            for prop in request_index.properties:
+                if prop.name not in schema.property_keys:
+                    raise LookupError(f"Property key {prop.name} doesn't exist")
+                index.properties.append(self.__property_message__(schema, element, prop.name))
+
+            if kind == "MixedIndex":
+                index.backend = request_index.backend
+            elif element == "VertexLabel":
+                index.unique = request_index.unique
+
+            schema.index_names.add(index.name)
+            schema.indices[(element, kind)][index.name] = index
+            schema.label_indices.setdefault((element, kind, label.name), {})[index.name] = index
+
+            return index
+
+    def populate(self, graph_name, vertex_labels=0, edge_labels=0, properties_per_label=4, indices=True):
+        """Generates a schema through the same code path as the Ensure RPCs, e.g. to serve thousands of labels.
+        Label i gets properties_per_label properties out of a shared pool, and with indices a composite index on its
+        first property and a mixed index on the others.
+
+        Args:
+            graph_name (str): Context, created when missing
+            vertex_labels (int):
+            edge_labels (int):
+            properties_per_label (int):
+            indices (bool):
+
+        Returns:
+            ContextSchema
+        """
+        schema = self.add_context(graph_name)
+        context = schema.context
+        pool_size = max(properties_per_label * 4, 1)
+
+        for element, count in (("VertexLabel", vertex_labels), ("EdgeLabel", edge_labels)):
+            prefix = "vertex" if element == "VertexLabel" else "edge"
+            property_class = management_pb2.VertexProperty if element == "VertexLabel" else management_pb2.EdgeProperty
+
+            for i in range(count):
+                names = [f"{prefix}Property{(i + j) % pool_size}" for j in range(properties_per_label)]
+                label = LABEL_CLASSES[element](name=f"{prefix}{i}",
+                                               properties=[property_class(name=name) for name in names])
+                self.ensure_label(context, element, label)
+
+                if indices and names:
+                    self.ensure_index(context, element, "CompositeIndex", label, INDEX_CLASSES[
+                        (element, "CompositeIndex")](name=f"by{prefix.title()}{i}", properties=label.properties[:1]))
+                if indices and names[1:]:
+                    self.ensure_index(context, element, "MixedIndex", label, INDEX_CLASSES[(element, "MixedIndex")](
+                        name=f"by{prefix.title()}{i}Mixed", properties=label.properties[1:], backend="search"))
+
+        return schema
+
+    def __find_label__(self, schema, element, label):
+        if label.HasField("id"):
+            name = schema.label_ids[element].get(label.id.value)
+            if name is None:
+                raise LookupError(f"No {element} found with id {label.id.value}")
+            return schema.labels[element][name]
+        return schema.labels[element].get(label.name)
+
+    def __rename_label_indices__(self, schema, element, old_name, new_name):
+        for kind in ("CompositeIndex", "MixedIndex"):
+            indices = schema.label_indices.pop((element, kind, old_name), None)
+            if indices is not None:
+                schema.label_indices[(element, kind, new_name)] = indices
+
+    def __get_or_create_property__(self, schema, element, prop):
+        if prop.name not in schema.property_keys:
+            cardinality = prop.cardinality if element == "VertexLabel" else management_pb2.VertexProperty.Single
+            schema.property_keys[prop.name] = (next(schema.ids), prop.dataType, cardinality)
+        return self.__property_message__(schema, element, prop.name)
+
+    def __property_message__(self, schema, element, name):
+        key_id, data_type, cardinality = schema.property_keys[name]
+        if element == "VertexLabel":
+            prop = management_pb2.VertexProperty(name=name, dataType=data_type, cardinality=cardinality)
+            prop.id.value = key_id
+            return prop
+        # The server leaves the id of edge properties unset
+        return management_pb2.EdgeProperty(name=name, dataType=data_type)
+
+    def __copy_message__(self, message):
+        copy = type(message)()
+        copy.CopyFrom(message)
+        return copy
@@ -12,6 +12,7 @@ class Edge(GraphElement):
 
         self.operation = operation
         self.element_label = label
+        self.context_name = GRAPH_NAME
 
         self.CONTEXT = None
         self.REQUEST = None
@@ -29,7 +30,7 @@ class Edge(GraphElement):
         self.OPTIONAL_OPERATOR = addtnl_operator
 
     def __generate_context__(self):
-        self.CONTEXT = management_pb2.JanusGraphContext(graphName=GRAPH_NAME)
+        self.CONTEXT = management_pb2.JanusGraphContext(graphName=self.context_name)
         return self
 
     def __generate_request__(self):
@@ -52,9 +53,11 @@ class Edge(GraphElement):
 
         if self.OPTIONAL_METADATA is None:
             if self.element_label == "ALL":
-                return self.service.GetEdgeLabels(self.REQUEST)
+                return self.__cached_lookup__(self.service.GetEdgeLabels, self.REQUEST,
+                                              self.CONTEXT.graphName, self.element_label)
             else:
-                return self.service.GetEdgeLabelsByName(self.REQUEST)
+                return self.__cached_lookup__(self.service.GetEdgeLabelsByName, self.REQUEST,
+                                              self.CONTEXT.graphName, self.element_label)
         else:
             self.OPTIONAL_OPERATOR.set_context(self.CONTEXT)
 
@@ -75,7 +78,7 @@ class Edge(GraphElement):
         self.__generate_context__()
         self.__generate_request__()
         if self.OPTIONAL_METADATA is None:
-            return self.service.EnsureEdgeLabel(self.REQUEST)
+            return self.__write_through__(self.service.EnsureEdgeLabel(self.REQUEST), self.CONTEXT.graphName)
 
         else:
             if isinstance(self.OPTIONAL_OPERATOR, GraphIndexer):
@@ -96,7 +99,7 @@ class Edge(GraphElement):
                 print("Not yet implemented PUT method for GraphAdder instance in EdgeLabel. "
                       "--TODO--[Case when Vertex is added without defaults]")
 
-                return self.service.EnsureEdgeLabel(self.REQUEST)
+                return self.__write_through__(self.service.EnsureEdgeLabel(self.REQUEST), self.CONTEXT.graphName)
 
             else:
                 raise ValueError("Invalid graph operator got. Expecting either of GraphIndexer of GraphElementAdder")
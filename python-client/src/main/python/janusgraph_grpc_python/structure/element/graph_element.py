@@ -1,9 +1,13 @@
+import grpc
+
+
 class GraphElement(object):
     def __init__(self, element, operation, metadata, optional_metadata):
         self.element = element
         self.operation = operation
         self.metadata = metadata
         self.service = None
+        self.cache = None
 
         self.OPTIONAL_METADATA = optional_metadata
         pass
@@ -14,6 +18,54 @@ class GraphElement(object):
     def set_service(self, stub):
         self.service = stub
 
+    def set_context_name(self, context_name):
+        """
+        Args:
+            context_name (str): graphName of the JanusGraphContext the requests are made against
+
+        Returns:
+
+        """
+        self.context_name = context_name
+
+    def set_cache(self, cache):
+        """
+        Args:
+            cache (SchemaCache): Opt-in cache consulted before the label lookup RPCs
+
+        Returns:
+
+        """
+        self.cache = cache
+
+    def __cached_lookup__(self, rpc, request, graph_name, name):
+        """Serves a streaming label lookup from the cache, calling rpc(request) only on a miss"""
+        if self.cache is None:
+            return rpc(request)
+
+        messages = self.cache.get(graph_name, self.element, name)
+        if messages is None:
+            messages = list(rpc(request))
+            self.cache.put(graph_name, self.element, name, messages)
+
+        return iter(messages)
+
+    def __write_through__(self, response, graph_name):
+        """Replaces the cached entry of an ensured label by the server response so a PUT leaves nothing stale"""
+        if self.cache is not None:
+            if isinstance(response, grpc.Future):
+                # Issued through FutureStub, populate once the response arrives
+                def on_done(future):
+                    if future.exception() is None:
+                        self.__write_through__(future.result(), graph_name)
+
+                response.add_done_callback(on_done)
+            else:
+                self.cache.put(graph_name, self.element, response.name, [response])
+                self.cache.invalidate(graph_name, self.element, "ALL")
+
+        return response
+
     def operate(self):
 
         if self.service is None:
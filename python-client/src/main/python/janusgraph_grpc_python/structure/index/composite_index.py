@@ -31,24 +31,6 @@ class CompositeIndex(GraphIndexer):
                              f"Expecting VertexLabel/EdgeLabel for {str(self.element_to_index)}")
         return self
 
-    def __generate_vertex_properties__(self):
-        vertex_properties = []
-        if isinstance(self.index_on, str):
-            vertex_properties.append(management_pb2.VertexProperty(name=self.index_on))
-        else:
-            for elem in self.index_on:
-                vertex_properties.append(management_pb2.VertexProperty(name=elem))
-        return vertex_properties
-
-    def __generate_edge_properties__(self):
-        edge_properties = []
-        if isinstance(self.index_on, str):
-            edge_properties.append(management_pb2.EdgeProperty(name=self.index_on))
-        else:
-            for elem in self.index_on:
-                edge_properties.append(management_pb2.EdgeProperty(name=elem))
-        return edge_properties
-
     def create_put_index_request(self):
         if str(self.element_to_index) == "VertexLabel":
             vp = self.__generate_vertex_properties__()
@@ -1,7 +1,10 @@
 from graph_operation.graph_indexer import GraphIndexer
+from management import management_pb2
 
 
 class MixedIndex(GraphIndexer):
+    REQUEST = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -11,3 +14,103 @@ class MixedIndex(GraphIndexer):
     def create(self):
         self.index_type = str(self)
         return
+
+    def create_get_indices_by_name_request(self):
+        self.REQUEST = self.__indices_by_label_request__(self.ELEMENT)
+        return self
+
+    def create_get_all_labels_request(self):
+        if str(self.element_to_index) == "VertexLabel":
+            self.REQUEST = management_pb2.GetVertexLabelsRequest(context=self.CONTEXT)
+        elif str(self.element_to_index) == "EdgeLabel":
+            self.REQUEST = management_pb2.GetEdgeLabelsRequest(context=self.CONTEXT)
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {str(self.element_to_index)}")
+        return self
+
+    def __indices_by_label_request__(self, label):
+        if str(self.element_to_index) == "VertexLabel":
+            return management_pb2.GetMixedIndicesByVertexLabelRequest(context=self.CONTEXT, vertexLabel=label)
+        elif str(self.element_to_index) == "EdgeLabel":
+            return management_pb2.GetMixedIndicesByEdgeLabelRequest(context=self.CONTEXT, edgeLabel=label)
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {str(self.element_to_index)}")
+
+    def __label_message__(self, name):
+        # Built from the element kind: a listed label may be a LazyMessage, which can't be constructed like one
+        if str(self.element_to_index) == "VertexLabel":
+            return management_pb2.VertexLabel(name=name)
+        elif str(self.element_to_index) == "EdgeLabel":
+            return management_pb2.EdgeLabel(name=name)
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {str(self.element_to_index)}")
+
+    def create_put_index_request(self):
+        if str(self.element_to_index) == "VertexLabel":
+            vp = self.__generate_vertex_properties__()
+            index = management_pb2.MixedVertexIndex(name=self.index_name, properties=vp, backend=self.index_backend)
+            self.REQUEST = management_pb2.EnsureMixedIndexByVertexLabelRequest(context=self.CONTEXT, vertexLabel=self.ELEMENT, index=index)
+
+        elif str(self.element_to_index) == "EdgeLabel":
+            ep = self.__generate_edge_properties__()
+            index = management_pb2.MixedEdgeIndex(name=self.index_name, properties=ep, backend=self.index_backend)
+            self.REQUEST = management_pb2.EnsureMixedIndexByEdgeLabelRequest(context=self.CONTEXT, edgeLabel=self.ELEMENT, index=index)
+
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {str(self.element_to_index)}")
+        return self
+
+    def put_index(self):
+        self.__are_required_parameters_set__()
+
+        self.create_put_index_request()
+
+        if self.element_to_index == "VertexLabel":
+            return self.SERVICE.EnsureMixedIndexByVertexLabel(self.REQUEST)
+        elif self.element_to_index == "EdgeLabel":
+            return self.SERVICE.EnsureMixedIndexByEdgeLabel(self.REQUEST)
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {self.element_to_index}")
+
+    def get_indices_by_label(self):
+        self.__are_required_parameters_set__(self.GET_OPERATION_PARAMS)
+
+        self.create_get_indices_by_name_request()
+
+        if self.element_to_index == "VertexLabel":
+            return self.SERVICE.GetMixedIndicesByVertexLabel(self.REQUEST)
+        elif self.element_to_index == "EdgeLabel":
+            return self.SERVICE.GetMixedIndicesByEdgeLabel(self.REQUEST)
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {self.element_to_index}")
+
+    def get_all_indices(self):
+        """The server lists mixed indices per label only: lists the labels of the context, then the mixed indices
+        of each label one after the other.
+
+        Returns:
+            Iterator: MixedVertexIndex/MixedEdgeIndex messages of every label, streamed lazily
+        """
+        self.__are_required_parameters_set__(self.GET_OPERATION_PARAMS)
+
+        self.create_get_all_labels_request()
+
+        if self.element_to_index == "VertexLabel":
+            return self.__all_indices__(self.SERVICE.GetVertexLabels(self.REQUEST),
+                                        self.SERVICE.GetMixedIndicesByVertexLabel)
+        elif self.element_to_index == "EdgeLabel":
+            return self.__all_indices__(self.SERVICE.GetEdgeLabels(self.REQUEST),
+                                        self.SERVICE.GetMixedIndicesByEdgeLabel)
+        else:
+            raise ValueError(f"Invalid element_to_index parameter. "
+                             f"Expecting VertexLabel/EdgeLabel for {self.element_to_index}")
+
+    def __all_indices__(self, labels, get_indices):
+        for label in labels:
+            yield from get_indices(self.__indices_by_label_request__(self.__label_message__(label.name)))
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from aio.async_channel_pool import AsyncChannelPool
+from aio.async_graph_operation import AsyncGraphOperation
+from aio.async_metrics_interceptor import async_metrics_interceptors
+from cache.schema_cache import SchemaCache
+from connection.rpc_metrics import RpcMetrics
+from graph_operation.command_action.graph_operation_metadata import GraphOperationMetadata
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+from type_class.graph_element_type import GraphElementType
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def async_operation(op, command):
+    """
+    Args:
+        op (str): GET or PUT
+        command (str): Values of an --arg, split like the command line ones
+    """
+    element_type, element_name, *metadata = command.split()
+    operation = AsyncGraphOperation(GraphElementType().set(element_type), element_name,
+                                    GraphOperationMetadata().set(metadata or None))
+    operation.set_operation(op)
+    return operation
+
+
+class AsyncGraphOperationTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=3, edge_labels=2)
+        cls.server = ReferenceServer(store)
+        cls.target = cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def run_with_pool(self, coroutine_function, **kwargs):
+        """Runs coroutine_function(pool) on a new event loop, the pool's aio channels being bound to it"""
+        async def main():
+            pool = AsyncChannelPool(**kwargs)
+            try:
+                return await coroutine_function(pool)
+            finally:
+                await pool.close()
+
+        return asyncio.run(main())
+
+    def test_streaming_and_unary_rpcs(self):
+        async def operate(pool):
+            channel = pool.get_channel(self.target)
+
+            get_all = async_operation("GET", "VertexLabel ALL")
+            get_all.set_channel(channel)
+            put = async_operation("PUT", "VertexLabel person properties=name,age")
+            put.set_channel(channel)
+
+            return await get_all.get_processor().collect(), await put.get_processor().collect()
+
+        labels, person = self.run_with_pool(operate, interceptors=[])
+
+        self.assertEqual(sorted(label.name for label in labels), ["vertex0", "vertex1", "vertex2"])
+        self.assertEqual(person.name, "person")
+        self.assertEqual([prop.name for prop in person.properties], ["name", "age"])
+
+    def test_indices_of_every_label(self):
+        async def operate(pool):
+            operation = async_operation("GET", "EdgeLabel ALL INDEX index_type=MixedIndex")
+            operation.set_channel(pool.get_channel(self.target))
+            return await operation.get_processor().collect()
+
+        indices = self.run_with_pool(operate, interceptors=[])
+
+        self.assertEqual(sorted(index.name for index in indices), ["byEdge0Mixed", "byEdge1Mixed"])
+
+    def test_cached_lookups_are_replayed(self):
+        cache = SchemaCache(ttl=None)
+        metrics = RpcMetrics()
+
+        async def operate(pool):
+            results = []
+            for _ in range(2):
+                operation = async_operation("GET", "VertexLabel vertex1")
+                operation.set_channel(pool.get_channel(self.target))
+                operation.set_cache(cache)
+                results.append(await operation.get_processor().collect())
+            return results
+
+        first, second = self.run_with_pool(operate, interceptors=async_metrics_interceptors(metrics))
+
+        self.assertEqual(first, second)
+        self.assertEqual([label.name for label in second], ["vertex1"])
+        self.assertEqual(sum(sum(method.codes.values()) for method in metrics.METHODS.values()), 1)
+
+    def test_channels_are_pooled_per_target(self):
+        async def operate(pool):
+            channel = pool.get_channel(self.target)
+            return channel is pool.get_channel(self.target), len(pool.CHANNELS)
+
+        same_channel, channels = self.run_with_pool(operate, interceptors=[])
+
+        self.assertTrue(same_channel)
+        self.assertEqual(channels, 1)
+
+
+class AsyncMetricsInterceptorTest(unittest.TestCase):
+
+    def test_unary_and_streaming_calls_are_recorded(self):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=3)
+        server = ReferenceServer(store)
+        target = server.start()
+        self.addCleanup(server.stop)
+        metrics = RpcMetrics()
+
+        async def operate():
+            pool = AsyncChannelPool(interceptors=async_metrics_interceptors(metrics))
+            try:
+                channel = pool.get_channel(target)
+                for op, command in (("GET", "VertexLabel ALL"), ("PUT", "VertexLabel person")):
+                    operation = async_operation(op, command)
+                    operation.set_channel(channel)
+                    await operation.get_processor().collect()
+            finally:
+                await pool.close()
+
+        asyncio.run(operate())
+
+        streamed = metrics.get_method("/grpc.ManagementForVertexLabels/GetVertexLabels")
+        unary = metrics.get_method("/grpc.ManagementForVertexLabels/EnsureVertexLabel")
+        self.assertEqual(streamed.codes, {"OK": 1})
+        self.assertEqual(len(streamed.messages), 1)
+        self.assertEqual(unary.codes, {"OK": 1})
+        self.assertGreater(unary.response_bytes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import threading
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from client.batch_executor import BatchExecutor, parse_batch_line
+from connection.future_stub import FutureStub, UnaryFuture
+from management import management_pb2, management_pb2_grpc
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+
+BATCH = """
+# vertex0..vertex3 are served with the composite index byVertex{i} on vertexProperty{i}
+VertexLabel ALL
+GET VertexLabel vertex1
+PUT VertexLabel person properties=name,age
+PUT VertexLabel vertex1 INDEX index_type=CompositeIndex index_on=vertexProperty1 index_name=byVertex1
+GET VertexLabel person
+GET EdgeLabel ALL
+"""
+
+
+class BatchExecutorTest(unittest.TestCase):
+
+    def setUp(self):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=4, edge_labels=2)
+        self.server = ReferenceServer(store)
+        self.channel = grpc.insecure_channel(self.server.start())
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop()
+
+    def commands(self):
+        return [command for command in map(parse_batch_line, BATCH.splitlines()) if command is not None]
+
+    def test_blank_lines_and_comments_are_skipped(self):
+        self.assertEqual([op for op, _ in self.commands()], ["GET", "GET", "PUT", "PUT", "GET", "GET"])
+
+    def test_results_are_in_input_order_with_an_error_mid_batch(self):
+        for max_in_flight in (1, 2, 3, 16):
+            with self.subTest(max_in_flight=max_in_flight):
+                results = list(BatchExecutor(self.channel, max_in_flight).execute(self.commands()))
+
+                self.assertEqual([result.index for result in results], list(range(6)))
+                self.assertEqual([result.op for result in results], ["GET", "GET", "PUT", "PUT", "GET", "GET"])
+                # The duplicate index fails alone, the commands submitted after it still succeed
+                self.assertEqual([result.error is None for result in results], [True, True, True, False, True, True])
+                self.assertIsNone(results[3].responses)
+                self.assertIn("has already been defined", results[3].error.details())
+                self.assertEqual([label.name for label in results[4].responses], ["person"])
+
+    def test_streamed_responses_are_collected(self):
+        results = list(BatchExecutor(self.channel, 2).execute(self.commands()))
+
+        self.assertEqual(sorted(label.name for label in results[0].responses), [f"vertex{i}" for i in range(4)])
+        self.assertEqual([label.name for label in results[1].responses], ["vertex1"])
+        self.assertEqual(sorted(label.name for label in results[5].responses), ["edge0", "edge1"])
+
+    def test_max_in_flight_bounds_submitted_commands(self):
+        commands = self.commands()
+        pulled = []
+
+        def counted():
+            for command in commands:
+                pulled.append(command)
+                yield command
+
+        for result in BatchExecutor(self.channel, 2).execute(counted()):
+            # The result of command i is only waited for once command i + 1 is submitted
+            self.assertLessEqual(len(pulled), result.index + 2)
+
+    def test_max_in_flight_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            BatchExecutor(self.channel, 0)
+
+
+class FutureStubTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=2)
+        cls.server = ReferenceServer(store)
+        cls.channel = grpc.insecure_channel(cls.server.start())
+        cls.context = management_pb2.JanusGraphContext(graphName=GRAPH_NAME)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.channel.close()
+        cls.server.stop()
+
+    def stub(self):
+        return FutureStub(management_pb2_grpc.ManagementForVertexLabelsStub(self.channel))
+
+    def test_unary_rpc_returns_a_future(self):
+        done = threading.Event()
+        callbacks = []
+
+        future = self.stub().EnsureVertexLabel(management_pb2.EnsureVertexLabelRequest(
+            context=self.context, label=management_pb2.VertexLabel(name="person")))
+        future.add_done_callback(lambda f: (callbacks.append(f), done.set()))
+
+        self.assertIsInstance(future, UnaryFuture)
+        self.assertEqual(future.result(timeout=10).name, "person")
+        self.assertTrue(done.wait(10))
+        self.assertIs(callbacks[0], future)
+        self.assertTrue(future.done())
+
+    def test_unary_rpc_error_is_raised_by_result(self):
+        index = management_pb2.CompositeVertexIndex(
+            name="byVertex0", properties=[management_pb2.VertexProperty(name="vertexProperty0")])
+        future = self.stub().EnsureCompositeIndexByVertexLabel(management_pb2.EnsureCompositeIndexByVertexLabelRequest(
+            context=self.context, vertexLabel=management_pb2.VertexLabel(name="vertex0"), index=index))
+
+        with self.assertRaises(grpc.RpcError):
+            future.result(timeout=10)
+        self.assertIsInstance(future.exception(timeout=10), grpc.RpcError)
+
+    def test_streaming_rpc_is_returned_untouched(self):
+        responses = self.stub().GetVertexLabels(management_pb2.GetVertexLabelsRequest(context=self.context))
+
+        self.assertNotIsInstance(responses, UnaryFuture)
+        self.assertEqual(sorted(label.name for label in responses), ["vertex0", "vertex1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
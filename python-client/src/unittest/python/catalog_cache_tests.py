@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from cache.catalog_cache import CatalogCache
+from management import management_pb2
+from schema.schema_catalog import SchemaCatalog, write_catalog
+from schema.schema_snapshot import SchemaSnapshot
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def snapshot(*vertex_label_names):
+    schema_snapshot = SchemaSnapshot(GRAPH_NAME)
+    for name in vertex_label_names:
+        schema_snapshot.vertex_labels[name] = management_pb2.VertexLabel(name=name)
+    schema_snapshot.edge_labels["knows"] = management_pb2.EdgeLabel(name="knows")
+    return schema_snapshot
+
+
+class CatalogCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "schema.catalog")
+        write_catalog(self.path, [snapshot("person", "software")])
+        self.cache = CatalogCache(SchemaCatalog(self.path), reload_interval=None)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def names(self, element, name):
+        messages = self.cache.get(GRAPH_NAME, element, name)
+        return None if messages is None else [message.name for message in messages]
+
+    def test_lookups_are_served_from_the_catalog(self):
+        self.assertEqual(self.names("VertexLabel", "person"), ["person"])
+        self.assertEqual(self.names("VertexLabel", "ALL"), ["person", "software"])
+        self.assertIsNone(self.names("VertexLabel", "missing"))
+        self.assertIsNone(self.cache.get("other", "VertexLabel", "ALL"))
+
+    def test_written_through_label_shadows_the_catalog(self):
+        ensured = management_pb2.VertexLabel(name="person", readOnly=True)
+        self.cache.put(GRAPH_NAME, "VertexLabel", "person", [ensured])
+
+        self.assertEqual(self.cache.get(GRAPH_NAME, "VertexLabel", "person"), [ensured])
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(GRAPH_NAME, "VertexLabel", "person"))
+        self.assertEqual(self.names("VertexLabel", "software"), ["software"])
+
+    def test_invalidation_shadows_exactly_what_it_matches(self):
+        self.cache.invalidate(GRAPH_NAME, "VertexLabel", "person")
+        self.assertIsNone(self.names("VertexLabel", "person"))
+        self.assertEqual(self.names("VertexLabel", "software"), ["software"])
+
+        self.cache.invalidate(GRAPH_NAME, "VertexLabel")
+        self.assertIsNone(self.names("VertexLabel", "software"))
+        self.assertEqual(self.names("EdgeLabel", "knows"), ["knows"])
+
+        self.cache.invalidate(GRAPH_NAME)
+        self.assertIsNone(self.names("EdgeLabel", "knows"))
+
+    def test_rebuilt_catalog_is_reloaded_and_no_longer_shadowed(self):
+        self.cache.invalidate(GRAPH_NAME)
+        self.assertFalse(self.cache.reload())
+
+        write_catalog(self.path, [snapshot("person", "software", "newLabel")])
+
+        self.assertTrue(self.cache.reload())
+        self.assertEqual(self.cache.SHADOWED, set())
+        self.assertEqual(self.names("VertexLabel", "newLabel"), ["newLabel"])
+
+    def test_get_checks_for_a_rebuilt_catalog_every_reload_interval(self):
+        cache = CatalogCache(SchemaCatalog(self.path), reload_interval=0)
+        self.assertIsNone(cache.get(GRAPH_NAME, "VertexLabel", "newLabel"))
+
+        write_catalog(self.path, [snapshot("newLabel")])
+
+        self.assertEqual([label.name for label in cache.get(GRAPH_NAME, "VertexLabel", "newLabel")], ["newLabel"])
+
+
+if __name__ == '__main__':
+    unittest.main()
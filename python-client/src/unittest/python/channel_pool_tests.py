@@ -0,0 +1,182 @@
+import time
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from connection.channel_pool import ChannelPool
+from management import management_pb2, management_pb2_grpc
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+# Nothing listens on these, calls on an open channel fail with UNAVAILABLE instead of ValueError
+TARGET = "unix:/tmp/channel_pool_tests_first.sock"
+SECOND_TARGET = "unix:/tmp/channel_pool_tests_second.sock"
+THIRD_TARGET = "unix:/tmp/channel_pool_tests_third.sock"
+
+
+def is_closed(pool, channel):
+    service = pool.get_stub(channel, management_pb2_grpc.AccessContextStub)
+    try:
+        service.GetContextByGraphName(management_pb2.GetContextByGraphNameRequest(name="graph_berkleydb"),
+                                      timeout=1)
+    except grpc.RpcError:
+        return False
+    except ValueError:
+        return True
+    return False
+
+
+def wait_closed(pool, channel):
+    # Channels whose last call just completed are closed by another thread
+    deadline = time.monotonic() + 5
+    while not is_closed(pool, channel):
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class ChannelPoolTest(unittest.TestCase):
+
+    def test_channel_and_stubs_are_reused(self):
+        pool = ChannelPool()
+        channel = pool.get_channel(TARGET)
+
+        self.assertIs(pool.get_channel(TARGET), channel)
+        self.assertIs(pool.get_stub(channel, management_pb2_grpc.AccessContextStub),
+                      pool.get_stub(channel, management_pb2_grpc.AccessContextStub))
+        second = pool.get_channel(SECOND_TARGET)
+        self.assertIsNot(pool.get_stub(channel, management_pb2_grpc.ManagementForVertexLabelsStub),
+                         pool.get_stub(second, management_pb2_grpc.ManagementForVertexLabelsStub))
+        self.assertEqual(len(pool), 2)
+        pool.close()
+
+    def test_least_recently_used_channel_is_closed_beyond_max_size(self):
+        pool = ChannelPool(max_size=2)
+        first = pool.get_channel(TARGET)
+        second = pool.get_channel(SECOND_TARGET)
+        pool.get_channel(TARGET)
+        pool.get_channel(THIRD_TARGET)
+
+        self.assertEqual(list(pool.CHANNELS), [TARGET, THIRD_TARGET])
+        self.assertIs(pool.get_channel(TARGET), first)
+        self.assertFalse(is_closed(pool, first))
+        self.assertNotIn(second, pool.STUBS)
+        self.assertTrue(is_closed(pool, second))
+        pool.close()
+
+    def test_max_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ChannelPool(max_size=0)
+
+    def test_idle_channel_is_evicted_and_reopened(self):
+        pool = ChannelPool(idle_timeout=0.05)
+        channel = pool.get_channel(TARGET)
+
+        time.sleep(0.1)
+        pool.evict_idle()
+        self.assertEqual(len(pool), 0)
+        self.assertTrue(is_closed(pool, channel))
+
+        reopened = pool.get_channel(TARGET)
+        self.assertIsNot(reopened, channel)
+        self.assertFalse(is_closed(pool, reopened))
+        pool.close()
+
+    def test_no_eviction_without_idle_timeout(self):
+        pool = ChannelPool(idle_timeout=None)
+        channel = pool.get_channel(TARGET)
+
+        time.sleep(0.05)
+        pool.evict_idle()
+        self.assertIs(pool.get_channel(TARGET), channel)
+        pool.close()
+
+    def test_close_closes_every_channel(self):
+        pool = ChannelPool()
+        channels = [pool.get_channel(TARGET), pool.get_channel(SECOND_TARGET)]
+
+        pool.close()
+        self.assertEqual(len(pool), 0)
+        self.assertTrue(all(is_closed(pool, channel) for channel in channels))
+
+
+
+class ChannelInUseTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate("graph_berkleydb", vertex_labels=50)
+        cls.server = ReferenceServer(store)
+        cls.target = cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def open_stream(self, pool, channel):
+        service = pool.get_stub(channel, management_pb2_grpc.ManagementForVertexLabelsStub)
+        stream = service.GetVertexLabels(management_pb2.GetVertexLabelsRequest(
+            context=management_pb2.JanusGraphContext(graphName="graph_berkleydb")))
+        # Messages are received as they are read, the call stays in flight until the stream is drained
+        self.assertEqual(next(stream).name, "vertex0")
+        return stream
+
+    def test_channel_with_an_open_stream_is_not_evicted(self):
+        pool = ChannelPool(idle_timeout=0.05, interceptors=[])
+        channel = pool.get_channel(self.target)
+        stream = self.open_stream(pool, channel)
+
+        time.sleep(0.1)
+        pool.evict_idle()
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(len(list(stream)), 49)
+
+        time.sleep(0.1)
+        pool.evict_idle()
+        self.assertEqual(len(pool), 0)
+        self.assertTrue(is_closed(pool, channel))
+        pool.close()
+
+    def test_completed_call_keeps_the_channel_warm(self):
+        pool = ChannelPool(idle_timeout=0.2, interceptors=[])
+        channel = pool.get_channel(self.target)
+
+        time.sleep(0.15)
+        self.assertEqual(len(list(self.open_stream(pool, channel))), 49)
+        time.sleep(0.1)
+        pool.evict_idle()
+        self.assertIs(pool.get_channel(self.target), channel)
+        pool.close()
+
+    def test_lru_channel_with_an_open_stream_is_closed_once_drained(self):
+        pool = ChannelPool(max_size=1, interceptors=[])
+        channel = pool.get_channel(self.target)
+        stream = self.open_stream(pool, channel)
+
+        pool.get_channel(SECOND_TARGET)
+        self.assertEqual(list(pool.CHANNELS), [SECOND_TARGET])
+        self.assertEqual(len(list(stream)), 49)
+        self.assertTrue(wait_closed(pool, channel))
+        pool.close()
+
+    def test_lru_channel_without_calls_in_flight_is_closed_first(self):
+        pool = ChannelPool(max_size=2, interceptors=[])
+        busy = pool.get_channel(self.target)
+        stream = self.open_stream(pool, busy)
+        idle = pool.get_channel(SECOND_TARGET)
+
+        pool.get_channel(THIRD_TARGET)
+        self.assertEqual(list(pool.CHANNELS), [self.target, THIRD_TARGET])
+        self.assertTrue(is_closed(pool, idle))
+        self.assertEqual(len(list(stream)), 49)
+        self.assertIs(pool.get_channel(self.target), busy)
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from client.context_fan_out import ContextFanOut
+from graph_operation.command_action.graph_operation_action import GraphOperationAction
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                            "janusgraph_grpc_python"))
+VERTEX_LABELS = {"prod_a": 2, "prod_b": 3, "test_c": 1}
+
+
+class ContextFanOutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SchemaStore(contexts=())
+        for graph_name, vertex_labels in VERTEX_LABELS.items():
+            self.store.populate(graph_name, vertex_labels=vertex_labels)
+        self.server = ReferenceServer(self.store)
+        self.address = self.server.start()
+        self.channel = grpc.insecure_channel(self.address)
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop()
+
+    def test_results_are_tagged_with_their_context(self):
+        for max_in_flight in (1, 2, 8):
+            with self.subTest(max_in_flight=max_in_flight):
+                # The same GraphOperation is pointed at every context in turn while earlier ones are in flight
+                get_all = GraphOperationAction.build_operation(["VertexLabel", "ALL"])
+                get_one = GraphOperationAction.build_operation(["VertexLabel", "vertex1"])
+                fan_out = ContextFanOut(self.channel, "prod_*", max_in_flight)
+
+                results = list(fan_out.operate([("GET", get_all), ("GET", get_one)]))
+
+                self.assertEqual([result.graph_name for result in results], ["prod_a", "prod_b"] * 2)
+                self.assertTrue(all(result.error is None for result in results))
+                self.assertEqual([sorted(label.name for label in result.responses) for result in results[:2]],
+                                 [[f"vertex{i}" for i in range(VERTEX_LABELS[graph_name])]
+                                  for graph_name in ("prod_a", "prod_b")])
+                self.assertEqual([[label.name for label in result.responses] for result in results[2:]],
+                                 [["vertex1"], ["vertex1"]])
+
+    def test_writes_reach_matching_contexts_only(self):
+        put = GraphOperationAction.build_operation(["VertexLabel", "fanned"])
+
+        results = list(ContextFanOut(self.channel, "prod_*", 1).operate([("PUT", put)]))
+
+        self.assertEqual([(result.graph_name, result.error) for result in results],
+                         [("prod_a", None), ("prod_b", None)])
+        for graph_name, expected in (("prod_a", True), ("prod_b", True), ("test_c", False)):
+            labels = self.store.get_labels(self.store.CONTEXTS[graph_name].context, "VertexLabel")
+            self.assertEqual("fanned" in [label.name for label in labels], expected, graph_name)
+
+    def test_no_matching_context_raises(self):
+        get_all = GraphOperationAction.build_operation(["VertexLabel", "ALL"])
+
+        with self.assertRaisesRegex(LookupError, r"No context matches staging_\*"):
+            next(ContextFanOut(self.channel, "staging_*").operate([("GET", get_all)]))
+
+    def test_cli_exits_non_zero_when_no_context_matches(self):
+        host, port = self.address.rsplit(":", 1)
+
+        completed = subprocess.run(
+            [sys.executable, os.path.join(PACKAGE_ROOT, "client", "management_client.py"), "--host", host, "--port",
+             port, "--graphs", "staging_*", "--op", "GET", "--arg", "VertexLabel", "ALL"],
+            env={**os.environ, "PYTHONPATH": PACKAGE_ROOT}, capture_output=True, text=True, timeout=60)
+
+        self.assertEqual(completed.returncode, 1, completed.stderr)
+        self.assertIn("No context matches staging_*", completed.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
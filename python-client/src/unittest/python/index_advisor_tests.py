@@ -0,0 +1,96 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from analysis.index_advisor import IndexAdvisor, SpaceSaving, to_command
+from management import management_pb2
+from schema.schema_lookup import SchemaLookup
+from schema.schema_snapshot import SchemaSnapshot
+
+GRAPH_NAME = "graph_berkleydb"
+
+LOG = (["2026-10-18T10:00:00 INFO g.V().has('newA', 'vertexProperty3', 'a').out()"] * 5
+       + ["g.V().has('vertex19', 'vertexProperty3', 'b')"] * 4
+       + ["g.V().hasLabel('person').has('age', gt(30)).has('name', 'marko')"] * 3
+       + ["g.V().has('name', 'marko')"] * 2
+       + ["not a traversal", "g.V(1).out()", "g.V().out()"])
+
+
+def add_vertex_label(snapshot, i):
+    # Same layout as SchemaStore.populate: vertexProperty{i % 16} to {(i + 3) % 16}, a composite index on the first
+    # one and a mixed index on the others
+    name = f"vertex{i}"
+    properties = [management_pb2.VertexProperty(name=f"vertexProperty{(i + j) % 16}", dataType=management_pb2.String)
+                  for j in range(4)]
+
+    snapshot.vertex_labels[name] = management_pb2.VertexLabel(name=name, properties=properties)
+    snapshot.composite_vertex_indices[f"byVertex{i}"] = management_pb2.CompositeVertexIndex(
+        name=f"byVertex{i}", properties=properties[:1])
+    snapshot.mixed_vertex_indices[name] = {f"byVertex{i}Mixed": management_pb2.MixedVertexIndex(
+        name=f"byVertex{i}Mixed", properties=properties[1:], backend="search")}
+
+
+class SpaceSavingTest(unittest.TestCase):
+
+    def test_heavy_hitters_are_kept(self):
+        sketch = SpaceSaving(capacity=3)
+        for i in range(1000):
+            sketch.add("hot" if i % 2 == 0 else f"cold{i}")
+
+        key, count, error = sketch.get_top(1)[0]
+        self.assertEqual(key, "hot")
+        self.assertLessEqual(count - error, 500)
+        self.assertGreaterEqual(count, 500)
+        self.assertEqual(len(sketch), 3)
+
+
+class IndexAdvisorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # byVertex19 is a composite index on vertexProperty3 constrained to vertex19
+        snapshot = SchemaSnapshot(GRAPH_NAME)
+        add_vertex_label(snapshot, 19)
+
+        cls.index_labels = {("VertexLabel", "byVertex19"): "vertex19"}
+        cls.lookup = SchemaLookup.from_snapshot(snapshot)
+
+    def recommendations(self, advisor):
+        return {(recommendation.label, recommendation.index_type, recommendation.properties): recommendation.weight
+                for recommendation in advisor.process(LOG).recommend()}
+
+    def test_log_lines_are_counted(self):
+        advisor = IndexAdvisor(self.lookup, index_labels=self.index_labels).process(LOG)
+
+        self.assertEqual((advisor.lines, advisor.skipped), (len(LOG), 3))
+        self.assertEqual(len(advisor.patterns), 4)
+
+    def test_hot_lookup_on_a_label_without_index_is_recommended(self):
+        recommendations = self.recommendations(IndexAdvisor(self.lookup, index_labels=self.index_labels))
+
+        self.assertEqual(recommendations[("newA", "CompositeIndex", ("vertexProperty3",))], 5)
+        self.assertNotIn(("vertex19", "CompositeIndex", ("vertexProperty3",)), recommendations)
+        self.assertEqual(recommendations[("person", "MixedIndex", ("age", "name"))], 3)
+        self.assertEqual(recommendations[(None, "CompositeIndex", ("name",))], 2)
+
+    def test_unknown_constraints_hide_the_lookups_of_other_labels(self):
+        recommendations = self.recommendations(IndexAdvisor(self.lookup))
+
+        self.assertNotIn(("newA", "CompositeIndex", ("vertexProperty3",)), recommendations)
+
+    def test_every_pattern_is_recommended_without_schema(self):
+        recommendations = self.recommendations(IndexAdvisor())
+
+        self.assertEqual(recommendations[("vertex19", "CompositeIndex", ("vertexProperty3",))], 4)
+
+    def test_recommendation_is_a_batch_file_command(self):
+        advisor = IndexAdvisor(self.lookup, index_labels=self.index_labels).process(LOG)
+
+        self.assertEqual(to_command(advisor.recommend(1)[0]),
+                         "PUT VertexLabel newA INDEX index_type=CompositeIndex index_on=vertexProperty3 "
+                         "index_name=byNewAVertexProperty3")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from analysis.gremlin_parser import Predicate
+from analysis.index_coverage import IndexCoverage
+from management import management_pb2
+from schema.schema_lookup import SchemaLookup
+from schema.schema_snapshot import SchemaSnapshot
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def add_label(snapshot, element, i):
+    # Same layout as SchemaStore.populate: properties {i % 16} to {(i + 3) % 16}, a composite index on the first
+    # one and a mixed index on the others
+    prefix = "vertex" if element == "VertexLabel" else "edge"
+    property_class = management_pb2.VertexProperty if element == "VertexLabel" else management_pb2.EdgeProperty
+    properties = [property_class(name=f"{prefix}Property{(i + j) % 16}", dataType=management_pb2.String)
+                  for j in range(4)]
+
+    name = f"{prefix}{i}"
+    if element == "VertexLabel":
+        snapshot.vertex_labels[name] = management_pb2.VertexLabel(name=name, properties=properties)
+        snapshot.composite_vertex_indices[f"byVertex{i}"] = management_pb2.CompositeVertexIndex(
+            name=f"byVertex{i}", properties=properties[:1])
+        snapshot.mixed_vertex_indices[name] = {f"byVertex{i}Mixed": management_pb2.MixedVertexIndex(
+            name=f"byVertex{i}Mixed", properties=properties[1:], backend="search")}
+    else:
+        snapshot.edge_labels[name] = management_pb2.EdgeLabel(name=name, properties=properties)
+        snapshot.composite_edge_indices[f"byEdge{i}"] = management_pb2.CompositeEdgeIndex(
+            name=f"byEdge{i}", properties=properties[:1])
+
+
+class IndexCoverageTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # vertex3 and vertex19 both have a composite index on vertexProperty3
+        snapshot = SchemaSnapshot(GRAPH_NAME)
+        for i in (3, 4, 19):
+            add_label(snapshot, "VertexLabel", i)
+        add_label(snapshot, "EdgeLabel", 1)
+
+        # Every composite index is constrained to its own label, as ensured by SchemaStore.populate
+        cls.index_labels = {("VertexLabel", f"byVertex{i}"): f"vertex{i}" for i in (3, 4, 19)}
+        cls.index_labels[("EdgeLabel", "byEdge1")] = "edge1"
+
+        cls.lookup = SchemaLookup.from_snapshot(snapshot)
+        cls.coverage = IndexCoverage(cls.lookup, cls.index_labels)
+
+    def test_composite_index_serves_equality_on_its_label(self):
+        for label in ("vertex3", "vertex19"):
+            result = self.coverage.check(label, [Predicate("vertexProperty3", "eq", ("a",))])
+
+            self.assertEqual(result.index.name, f"by{label.title()}")
+            self.assertEqual(result.residual, ())
+
+    def test_composite_index_constrained_to_another_label_is_not_used(self):
+        for label in (None, "newA", "vertex4"):
+            result = self.coverage.check(label, [Predicate("vertexProperty3", "eq", ("a",))])
+
+            self.assertTrue(result.is_full_scan(), result)
+            self.assertIn("composite byVertex19 only serves vertex19", result.reason)
+
+    def test_unconstrained_composite_index_serves_every_label(self):
+        index_labels = dict(self.index_labels)
+        del index_labels[("VertexLabel", "byVertex19")]
+
+        result = IndexCoverage(self.lookup, index_labels).check("newA", [Predicate("vertexProperty3", "eq", ("a",))])
+        self.assertEqual(result.index.name, "byVertex19")
+
+    def test_unknown_constraints_keep_every_composite_index(self):
+        result = IndexCoverage(self.lookup).check(None, [Predicate("vertexProperty3", "eq", ("a",))])
+
+        self.assertIn(result.index.name, ("byVertex3", "byVertex19"))
+
+    def test_mixed_index_serves_ranges_on_its_label_only(self):
+        predicates = [Predicate("vertexProperty4", "gt", (3,)), Predicate("vertexProperty5", "eq", ("b",))]
+
+        result = self.coverage.check("vertex3", predicates)
+        self.assertEqual(result.index.name, "byVertex3Mixed")
+        self.assertEqual(len(result.served), 2)
+        self.assertTrue(self.coverage.check("vertex4", predicates[:1]).is_full_scan())
+
+    def test_text_predicate_needs_a_string_property(self):
+        result = self.coverage.check("vertex3", [Predicate("vertexProperty4", "textContains", ("a",))])
+        self.assertEqual(result.index.name, "byVertex3Mixed")
+
+        result = self.coverage.check("vertex3", [Predicate("vertexProperty4", "without", ("a",))])
+        self.assertTrue(result.is_full_scan())
+
+    def test_composite_index_needs_equality_on_its_properties(self):
+        result = self.coverage.check("vertex3", [Predicate("vertexProperty3", "gt", (3,))])
+
+        self.assertTrue(result.is_full_scan())
+        self.assertIn("composite byVertex3 needs equality on vertexProperty3", result.reason)
+
+    def test_unindexed_property_is_a_full_scan(self):
+        result = self.coverage.check("vertex3", [Predicate("unknown", "eq", ("a",))])
+
+        self.assertTrue(result.is_full_scan())
+        self.assertIn("FULL SCAN", str(result))
+
+    def test_gremlin_traversal_is_checked_per_label(self):
+        results = self.coverage.check_gremlin(
+            "g.V().hasLabel('vertex4', 'newA').has('vertexProperty5', gt(3)).out('knows')")
+
+        self.assertEqual([(result.label, None if result.index is None else result.index.name) for result in results],
+                         [("vertex4", "byVertex4Mixed"), ("newA", None)])
+
+    def test_constrained_lookups_are_checked_per_label(self):
+        results = self.coverage.check_gremlin(
+            "g.V().hasLabel('vertex19', 'newA').has('vertexProperty3', 'a').out('knows')")
+
+        self.assertEqual([(result.label, None if result.index is None else result.index.name) for result in results],
+                         [("vertex19", "byVertex19"), ("newA", None)])
+
+    def test_edge_lookup(self):
+        result = self.coverage.check_gremlin("g.E().hasLabel('edge1').has('edgeProperty1', 3)")[0]
+
+        self.assertEqual(result.index.name, "byEdge1")
+
+    def test_lookup_by_id_is_not_analysed(self):
+        with self.assertRaises(ValueError):
+            self.coverage.check_gremlin("g.V(1).out()")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from connection.lazy_stub import LazyMessage, LazyStub, get_lazy_stub_class
+from management import management_pb2, management_pb2_grpc
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+CONTEXT = management_pb2.JanusGraphContext(graphName=GRAPH_NAME)
+
+
+class LazyMessageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.message = management_pb2.VertexLabel(name="person", properties=[management_pb2.VertexProperty(name="age")])
+        self.lazy = LazyMessage(management_pb2.VertexLabel, self.message.SerializeToString())
+
+    def test_sizes_and_bytes_do_not_decode(self):
+        self.assertEqual(self.lazy.ByteSize(), self.message.ByteSize())
+        self.assertEqual(self.lazy.SerializeToString(), self.message.SerializeToString())
+        self.assertFalse(self.lazy.is_decoded())
+        self.assertIn("bytes", repr(self.lazy))
+
+    def test_reading_a_field_decodes_once(self):
+        self.assertEqual(self.lazy.name, "person")
+        self.assertTrue(self.lazy.is_decoded())
+
+        decoded = self.lazy.decode()
+        self.assertEqual([prop.name for prop in self.lazy.properties], ["age"])
+        self.assertIs(self.lazy.decode(), decoded)
+
+    def test_equals_the_decoded_message(self):
+        self.assertEqual(self.lazy, self.message)
+        self.assertEqual(self.message, self.lazy)
+        self.assertEqual(self.lazy, LazyMessage(management_pb2.VertexLabel, self.message.SerializeToString()))
+        self.assertNotEqual(self.lazy, management_pb2.VertexLabel(name="software"))
+        self.assertEqual(str(self.lazy), str(self.message))
+
+    def test_can_be_embedded_in_a_request(self):
+        self.assertIsInstance(self.lazy, management_pb2.VertexLabel)
+        self.assertIsInstance(self.lazy, LazyMessage)
+
+        request = management_pb2.EnsureVertexLabelRequest(context=CONTEXT, label=self.lazy)
+        self.assertEqual(request.label, self.message)
+
+
+class LazyStubTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=3)
+        cls.server = ReferenceServer(store)
+        cls.channel = grpc.insecure_channel(cls.server.start())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.channel.close()
+        cls.server.stop()
+
+    def test_responses_are_not_decoded_until_read(self):
+        stub = get_lazy_stub_class(management_pb2_grpc.ManagementForVertexLabelsStub)(self.channel)
+        eager = management_pb2_grpc.ManagementForVertexLabelsStub(self.channel)
+        request = management_pb2.GetVertexLabelsRequest(context=CONTEXT)
+
+        responses = list(stub.GetVertexLabels(request))
+
+        self.assertTrue(all(isinstance(response, LazyMessage) for response in responses))
+        self.assertFalse(any(response.is_decoded() for response in responses))
+        self.assertEqual(sum(response.ByteSize() for response in responses),
+                         sum(response.ByteSize() for response in eager.GetVertexLabels(request)))
+        self.assertFalse(any(response.is_decoded() for response in responses))
+
+        self.assertEqual(responses, list(eager.GetVertexLabels(request)))
+        self.assertEqual(sorted(response.name for response in responses), ["vertex0", "vertex1", "vertex2"])
+
+    def test_unary_responses_are_lazy(self):
+        stub = get_lazy_stub_class(management_pb2_grpc.ManagementForVertexLabelsStub)(self.channel)
+
+        response = stub.EnsureVertexLabel(management_pb2.EnsureVertexLabelRequest(
+            context=CONTEXT, label=management_pb2.VertexLabel(name="person")))
+
+        self.assertIsInstance(response, LazyMessage)
+        self.assertFalse(response.is_decoded())
+        self.assertEqual(response.name, "person")
+
+    def test_lazy_stub_classes_are_cached_per_stub_class(self):
+        lazy_stub_class = get_lazy_stub_class(management_pb2_grpc.AccessContextStub)
+
+        self.assertIs(get_lazy_stub_class(management_pb2_grpc.AccessContextStub), lazy_stub_class)
+        self.assertIsNot(get_lazy_stub_class(management_pb2_grpc.ManagementForEdgeLabelsStub), lazy_stub_class)
+        self.assertTrue(hasattr(lazy_stub_class(self.channel), "GetContexts"))
+
+    def test_unknown_service_raises(self):
+        with self.assertRaises(LookupError):
+            LazyStub(self.channel, "ManagementForProperties")
+
+
+if __name__ == '__main__':
+    unittest.main()
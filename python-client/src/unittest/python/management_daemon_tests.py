@@ -0,0 +1,122 @@
+import json
+import os
+import re
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from client.management_daemon import ManagementDaemon
+from client.management_shim import forward
+from connection.channel_pool import ChannelPool
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+class ManagementDaemonTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=3, edge_labels=2)
+        cls.server = ReferenceServer(store)
+        cls.host, cls.port = cls.server.start().rsplit(":", 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.directory.name, "daemon.sock")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def start_daemon(self, **kwargs):
+        daemon = ManagementDaemon(self.socket_path, ChannelPool(interceptors=[]), **kwargs)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            daemon.shutdown()
+            daemon.server_close()
+            thread.join()
+        self.addCleanup(stop)
+        return daemon
+
+    def forward(self, *argv):
+        response = forward(["--host", self.host, "--port", self.port, *argv], self.socket_path)
+        return response["status"], response["output"]
+
+    def test_every_mixed_index_is_listed_with_lazy_decoding(self):
+        self.start_daemon(lazy_decoding=True)
+
+        for element, prefix in (("VertexLabel", "Vertex"), ("EdgeLabel", "Edge")):
+            status, output = self.forward("--op", "GET", "--arg", element, "ALL", "INDEX", "index_type=MixedIndex")
+
+            self.assertEqual(status, 0, output)
+            self.assertEqual([re.search(r'^name: "(\w+)"', message, re.MULTILINE).group(1) for message in output],
+                             [f"by{prefix}{i}Mixed" for i in range(3 if element == "VertexLabel" else 2)])
+
+    def test_single_command_is_executed(self):
+        self.start_daemon()
+
+        status, output = self.forward("--op", "GET", "--arg", "VertexLabel", "vertex1")
+        self.assertEqual(status, 0)
+        self.assertIn('name: "vertex1"', output[0])
+
+        status, output = self.forward("--op", "PUT", "--arg", "VertexLabel", "vertex1", "INDEX",
+                                      "index_type=CompositeIndex", "index_on=vertexProperty1", "index_name=byVertex1")
+        self.assertEqual(status, 1)
+        self.assertIn("has already been defined", output[0])
+
+    def test_commands_the_daemon_does_not_run_are_rejected(self):
+        self.start_daemon()
+
+        for argv, message in [
+                (["--arg", "VertexLabel", "vertex1", "--arg", "EdgeLabel", "ALL"], "single --arg, got 2"),
+                (["--batch", "--arg", "VertexLabel", "ALL"], "--batch not supported"),
+                (["--graphs", "prod*", "--arg", "VertexLabel", "ALL"], "--graphs not supported"),
+                (["--snapshot", "schema.snapshot", "--catalog", "schema.catalog", "--arg", "VertexLabel", "ALL"],
+                 "--snapshot, --catalog not supported"),
+                (["--op", "GET"], "Expecting an --arg"),
+                (["--unknown"], "unrecognized arguments")]:
+            status, output = self.forward(*argv)
+
+            self.assertEqual(status, 2, argv)
+            self.assertIn(message, output[0])
+
+    def test_socket_is_owner_only(self):
+        self.start_daemon()
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+
+    def test_malformed_request_is_answered(self):
+        self.start_daemon()
+
+        for line in [b"not json\n", b'{"args": []}\n', b'["--op"]\n', b'{"argv": "--op GET"}\n', b"\xff\n", b"\n"]:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(10)
+                sock.connect(self.socket_path)
+
+                with sock.makefile("rwb") as stream:
+                    stream.write(line)
+                    stream.flush()
+                    response = json.loads(stream.readline().decode("utf-8"))
+
+            self.assertEqual(response["status"], 2, line)
+            self.assertIn("Malformed request", response["output"][0])
+
+        # The daemon keeps serving
+        self.assertEqual(self.forward("--arg", "VertexLabel", "vertex1")[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
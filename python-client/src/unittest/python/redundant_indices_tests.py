@@ -0,0 +1,87 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from analysis.redundant_indices import IndexRedundancy, DUPLICATE, REORDERED, COVERED_BY_MIXED
+from management import management_pb2
+from schema.schema_lookup import SchemaLookup
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def properties(*names):
+    return [management_pb2.VertexProperty(name=name) for name in names]
+
+
+def composite(name, *keys, unique=False):
+    return management_pb2.CompositeVertexIndex(name=name, properties=properties(*keys), unique=unique)
+
+
+class IndexRedundancyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        lookup = SchemaLookup(GRAPH_NAME)
+        lookup.update(management_pb2.VertexLabel(name="person", properties=properties("name", "age", "email")))
+        lookup.update(management_pb2.VertexLabel(name="software", properties=properties("name", "age")))
+        lookup.update(management_pb2.MixedVertexIndex(name="personMixed", properties=properties("name", "email"),
+                                                      backend="search"), "person")
+
+        for index in (composite("byNameAge", "name", "age"),
+                      composite("byNameAge2", "name", "age"),
+                      composite("byReversed", "age", "name"),
+                      composite("byLogin", "email"),
+                      composite("uniqueEmail", "email", unique=True),
+                      composite("byNameEmail", "name", "email"),
+                      composite("bySoftwareNameAge", "name", "age")):
+            lookup.update(index)
+
+        cls.lookup = lookup
+        cls.index_labels = {("VertexLabel", name): "person" for name in
+                            ("byNameAge", "byNameAge2", "byReversed", "byLogin", "uniqueEmail", "byNameEmail")}
+        cls.index_labels[("VertexLabel", "bySoftwareNameAge")] = "software"
+
+    def findings(self, redundancy):
+        return {finding.index.name: (finding.kind, finding.keep.name) for finding in redundancy.findings}
+
+    def test_every_finding_kind(self):
+        redundancy = IndexRedundancy(self.lookup, self.index_labels)
+
+        self.assertEqual(self.findings(redundancy), {
+            "byNameAge2": (DUPLICATE, "byNameAge"),
+            "byReversed": (REORDERED, "byNameAge"),
+            # Unique indices are kept over non unique ones with the same keys
+            "byLogin": (DUPLICATE, "uniqueEmail"),
+            "byNameEmail": (COVERED_BY_MIXED, "personMixed")})
+
+    def test_write_savings_per_label(self):
+        redundancy = IndexRedundancy(self.lookup, self.index_labels)
+
+        self.assertEqual(redundancy.write_savings, {("VertexLabel", "person"): (6, 4),
+                                                    ("VertexLabel", "software"): (1, 0)})
+        self.assertIn("VertexLabel person: 4 of 6 composite index writes per mutation saved", redundancy.report())
+        self.assertEqual(redundancy.report()[-1], "4 redundant composite indices")
+
+    def test_unknown_constraints_compare_indices_across_labels(self):
+        redundancy = IndexRedundancy(self.lookup)
+
+        findings = self.findings(redundancy)
+        self.assertEqual(findings["bySoftwareNameAge"], (DUPLICATE, "byNameAge"))
+        self.assertNotIn(COVERED_BY_MIXED, [kind for kind, _ in findings.values()])
+        self.assertIn("mixed index coverage wasn't checked", redundancy.report()[-2])
+
+    def test_unique_index_is_not_covered_by_mixed(self):
+        lookup = SchemaLookup(GRAPH_NAME)
+        lookup.update(management_pb2.VertexLabel(name="person", properties=properties("email")))
+        lookup.update(management_pb2.MixedVertexIndex(name="personMixed", properties=properties("email"),
+                                                      backend="search"), "person")
+        lookup.update(composite("uniqueEmail", "email", unique=True))
+
+        redundancy = IndexRedundancy(lookup, {("VertexLabel", "uniqueEmail"): "person"})
+
+        self.assertEqual(redundancy.findings, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import threading
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from management import management_pb2, management_pb2_grpc
+from server.reference_server import ReferenceServer, __run__
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def context(graph_name=GRAPH_NAME):
+    return management_pb2.JanusGraphContext(graphName=graph_name)
+
+
+class SchemaStoreTest(unittest.TestCase):
+
+    def test_contexts_share_a_fixed_number_of_stripes(self):
+        store = SchemaStore(contexts=[f"graph{i}" for i in range(64)], stripes=4)
+
+        locks = {id(schema.lock) for schema in store.CONTEXTS.values()}
+        self.assertLessEqual(len(locks), 4)
+        self.assertTrue(locks <= {id(lock) for lock in store.LOCKS})
+        # A context keeps its stripe when it is added again
+        self.assertIs(store.add_context("graph0").lock, store.CONTEXTS["graph0"].lock)
+
+    def test_stripes_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            SchemaStore(stripes=0)
+
+    def test_concurrent_ensures_on_contexts_sharing_stripes(self):
+        graph_names = [f"graph{i}" for i in range(8)]
+        store = SchemaStore(contexts=graph_names, stripes=2)
+
+        def ensure(graph_name, worker):
+            for i in range(50):
+                store.ensure_label(context(graph_name), "VertexLabel", management_pb2.VertexLabel(
+                    name="person", properties=[management_pb2.VertexProperty(name=f"p{worker}_{i}")]))
+
+        threads = [threading.Thread(target=ensure, args=(graph_name, worker))
+                   for graph_name in graph_names for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for graph_name in graph_names:
+            person = store.get_labels(context(graph_name), "VertexLabel", "person")[0]
+            self.assertEqual(len(person.properties), 200, graph_name)
+            self.assertEqual(len({prop.id.value for prop in person.properties}), 200)
+
+    def test_labels_get_properties_and_indices_are_only_created(self):
+        store = SchemaStore()
+        store.ensure_label(context(), "VertexLabel", management_pb2.VertexLabel(
+            name="person", properties=[management_pb2.VertexProperty(name="name")]))
+        response = store.ensure_label(context(), "VertexLabel", management_pb2.VertexLabel(
+            name="person", properties=[management_pb2.VertexProperty(name="age")]))
+        index = management_pb2.CompositeVertexIndex(name="byName", properties=[
+            management_pb2.VertexProperty(name="name")])
+        store.ensure_index(context(), "VertexLabel", "CompositeIndex", response, index)
+
+        # The response only carries the requested properties, the label keeps both
+        self.assertEqual([prop.name for prop in response.properties], ["age"])
+        self.assertEqual([prop.name for prop in store.get_labels(context(), "VertexLabel", "person")[0].properties],
+                         ["name", "age"])
+        with self.assertRaisesRegex(ValueError, "already been defined"):
+            store.ensure_index(context(), "VertexLabel", "CompositeIndex", response, index)
+        with self.assertRaisesRegex(LookupError, "Property key email"):
+            store.ensure_index(context(), "VertexLabel", "MixedIndex", response, management_pb2.MixedVertexIndex(
+                name="byEmail", properties=[management_pb2.VertexProperty(name="email")]))
+        with self.assertRaisesRegex(LookupError, "Incorrect context"):
+            store.get_labels(context("missing"), "VertexLabel")
+
+
+class AbortingContext:
+
+    def abort(self, code, details):
+        # grpc.ServicerContext.abort raises to end the RPC
+        raise RuntimeError(code, details)
+
+
+class RunTest(unittest.TestCase):
+
+    def test_lookup_and_value_errors_abort_with_unknown(self):
+        for error in (LookupError("Incorrect context"), ValueError("name should not be null")):
+            def fail():
+                raise error
+
+            with self.subTest(error=error):
+                with self.assertRaises(RuntimeError) as raised:
+                    __run__(AbortingContext(), fail)
+                self.assertEqual(raised.exception.args, (grpc.StatusCode.UNKNOWN, str(error)))
+
+    def test_result_and_other_errors_are_passed_through(self):
+        self.assertEqual(__run__(AbortingContext(), lambda a, b: a + b, 1, 2), 3)
+
+        with self.assertRaises(TypeError):
+            __run__(AbortingContext(), lambda: None + 1)
+
+    def test_aborted_rpc_reaches_the_client(self):
+        server = ReferenceServer(SchemaStore())
+        self.addCleanup(server.stop)
+
+        with grpc.insecure_channel(server.start()) as channel:
+            stub = management_pb2_grpc.ManagementForVertexLabelsStub(channel)
+
+            with self.assertRaises(grpc.RpcError) as raised:
+                stub.EnsureVertexLabel(management_pb2.EnsureVertexLabelRequest(
+                    context=context(), label=management_pb2.VertexLabel()))
+            self.assertEqual(raised.exception.code(), grpc.StatusCode.UNKNOWN)
+            self.assertEqual(raised.exception.details(), "name should not be null")
+
+            with self.assertRaises(grpc.RpcError) as raised:
+                management_pb2_grpc.AccessContextStub(channel).GetContextByGraphName(
+                    management_pb2.GetContextByGraphNameRequest(name="missing"))
+            self.assertEqual(raised.exception.details(), "Incorrect context")
+
+            # The server keeps serving after aborted RPCs
+            self.assertEqual(stub.EnsureVertexLabel(management_pb2.EnsureVertexLabelRequest(
+                context=context(), label=management_pb2.VertexLabel(name="person"))).name, "person")
+
+
+if __name__ == '__main__':
+    unittest.main()
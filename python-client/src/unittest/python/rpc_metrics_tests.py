@@ -0,0 +1,116 @@
+import math
+import random
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from connection.channel_pool import ChannelPool
+from connection.metrics_interceptor import MetricsInterceptor
+from connection.rpc_metrics import Histogram, RpcMetrics, DEFAULT_SUB_BUCKET_BITS
+from management import management_pb2, management_pb2_grpc
+from server.reference_server import ReferenceServer
+
+
+def nearest_rank(values, q):
+    return sorted(values)[max(math.ceil(q * len(values)), 1) - 1]
+
+
+class HistogramTest(unittest.TestCase):
+
+    def test_small_values_are_exact(self):
+        histogram = Histogram()
+        values = list(range(1, 1 << DEFAULT_SUB_BUCKET_BITS))
+        for value in values:
+            histogram.record(value)
+
+        for q in (0.01, 0.5, 0.9, 0.99, 1):
+            self.assertEqual(histogram.percentile(q), nearest_rank(values, q))
+
+    def test_percentiles_are_within_the_relative_error(self):
+        rng = random.Random(7)
+        values = [int(rng.lognormvariate(8, 1.5)) for _ in range(20000)]
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+
+        # The upper bound of a bucket is returned, at most one bucket width above the recorded value
+        precision = 1 / (1 << (DEFAULT_SUB_BUCKET_BITS - 1))
+        for q in (0.5, 0.9, 0.99, 0.999):
+            expected = nearest_rank(values, q)
+            self.assertGreaterEqual(histogram.percentile(q), expected)
+            self.assertLessEqual(histogram.percentile(q), expected * (1 + precision))
+
+        self.assertEqual(histogram.percentile(1), max(values))
+        self.assertEqual((histogram.count, histogram.sum, histogram.max), (len(values), sum(values), max(values)))
+
+    def test_bucket_bounds_contain_their_values(self):
+        histogram = Histogram(sub_bucket_bits=3)
+        for value in (0, 1, 7, 8, 9, 15, 16, 17, 1000, 123456789):
+            low, high = histogram.__bounds__(histogram.__bucket__(value))
+            self.assertLessEqual(low, value)
+            self.assertLessEqual(value, high)
+
+    def test_weighted_and_negative_values(self):
+        histogram = Histogram()
+        histogram.record(-5)
+        histogram.record(10, count=99)
+
+        self.assertEqual(histogram.percentile(0.01), 0)
+        self.assertEqual(histogram.percentile(0.5), 10)
+        self.assertEqual(len(histogram), 100)
+
+    def test_empty_histogram(self):
+        self.assertEqual(Histogram().percentile(0.99), 0)
+        self.assertEqual(Histogram().cumulative_counts([1, 10]), [0, 0])
+
+    def test_cumulative_counts(self):
+        histogram = Histogram()
+        for value in (1, 5, 50, 500):
+            histogram.record(value)
+
+        self.assertEqual(histogram.cumulative_counts([0, 1, 10, 100, 10000]), [0, 1, 2, 3, 4])
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            Histogram(sub_bucket_bits=0)
+
+
+class RpcMetricsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ReferenceServer()
+        cls.target = cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_intercepted_calls_are_recorded_and_exported(self):
+        metrics = RpcMetrics()
+        pool = ChannelPool(interceptors=[MetricsInterceptor(metrics)])
+        service = pool.get_stub(pool.get_channel(self.target), management_pb2_grpc.AccessContextStub)
+
+        self.assertEqual(len(list(service.GetContexts(management_pb2.GetContextsRequest()))), 1)
+        service.GetContextByGraphName(management_pb2.GetContextByGraphNameRequest(name="graph_berkleydb"))
+        with self.assertRaises(grpc.RpcError):
+            service.GetContextByGraphName(management_pb2.GetContextByGraphNameRequest(name="missing"))
+        pool.close()
+
+        streamed = metrics.get_method("/grpc.AccessContext/GetContexts")
+        self.assertEqual((streamed.latency.count, streamed.messages.count, streamed.messages.max), (1, 1, 1))
+        unary = metrics.get_method("/grpc.AccessContext/GetContextByGraphName")
+        self.assertEqual(unary.codes, {"OK": 1, "UNKNOWN": 1})
+
+        exported = metrics.to_prometheus()
+        self.assertIn('janusgraph_grpc_client_rpcs_total{service="grpc.AccessContext",method="GetContextByGraphName",'
+                      'code="UNKNOWN"} 1', exported)
+        self.assertIn('janusgraph_grpc_client_stream_messages_count{service="grpc.AccessContext",'
+                      'method="GetContexts"} 1', exported)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import time
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from cache.schema_cache import SchemaCache
+from connection.channel_pool import get_channel_pool
+from graph_operation.command_action.graph_operation_action import GraphOperationAction
+from management import management_pb2
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def vertex_label(name):
+    return management_pb2.VertexLabel(name=name)
+
+
+class SchemaCacheTest(unittest.TestCase):
+
+    def test_entry_expires_after_ttl(self):
+        cache = SchemaCache(ttl=0.05)
+        cache.put(GRAPH_NAME, "VertexLabel", "person", [vertex_label("person")])
+
+        self.assertEqual(cache.get(GRAPH_NAME, "VertexLabel", "person"), [vertex_label("person")])
+        time.sleep(0.1)
+        self.assertIsNone(cache.get(GRAPH_NAME, "VertexLabel", "person"))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 0))
+
+    def test_entry_without_ttl_never_expires(self):
+        cache = SchemaCache(ttl=None)
+        cache.put(GRAPH_NAME, "VertexLabel", "person", [vertex_label("person")])
+
+        time.sleep(0.05)
+        self.assertEqual(cache.get(GRAPH_NAME, "VertexLabel", "person"), [vertex_label("person")])
+
+    def test_invalidate_by_graph_element_and_name(self):
+        cache = SchemaCache()
+        for graph_name in (GRAPH_NAME, "other"):
+            for element in ("VertexLabel", "EdgeLabel"):
+                for name in ("a", "b"):
+                    cache.put(graph_name, element, name, [])
+
+        cache.invalidate(GRAPH_NAME, "VertexLabel", "a")
+        self.assertIsNone(cache.get(GRAPH_NAME, "VertexLabel", "a"))
+        self.assertEqual(cache.get(GRAPH_NAME, "VertexLabel", "b"), [])
+
+        cache.invalidate(GRAPH_NAME, "EdgeLabel")
+        self.assertIsNone(cache.get(GRAPH_NAME, "EdgeLabel", "b"))
+        self.assertEqual(cache.get(GRAPH_NAME, "VertexLabel", "b"), [])
+
+        cache.invalidate(GRAPH_NAME)
+        self.assertEqual(sorted(key[0] for key in cache.ENTRIES), ["other"] * 4)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SchemaCache(max_entries=2)
+        cache.put(GRAPH_NAME, "VertexLabel", "a", [])
+        cache.put(GRAPH_NAME, "VertexLabel", "b", [])
+        cache.get(GRAPH_NAME, "VertexLabel", "a")
+        cache.put(GRAPH_NAME, "VertexLabel", "c", [])
+
+        self.assertEqual([key[2] for key in cache.ENTRIES], ["a", "c"])
+
+    def test_max_bytes_bounds_the_serialized_size(self):
+        label = vertex_label("person")
+        cache = SchemaCache(max_entries=None, max_bytes=2 * label.ByteSize())
+        for name in ("a", "b", "c"):
+            cache.put(GRAPH_NAME, "VertexLabel", name, [label])
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 2 * label.ByteSize())
+
+
+class CachedOperationTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=3)
+        cls.server = ReferenceServer(store)
+        cls.channel = get_channel_pool().get_channel(cls.server.start())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def operate(self, op, values, cache):
+        operation = GraphOperationAction.build_operation(values)
+        operation.set_operation(op)
+        operation.set_channel(self.channel)
+        operation.set_cache(cache)
+        return operation.get_processor().operate()
+
+    def test_lookup_is_served_from_the_cache(self):
+        cache = SchemaCache()
+
+        self.assertEqual([label.name for label in self.operate("GET", ["VertexLabel", "vertex1"], cache)], ["vertex1"])
+        self.assertEqual([label.name for label in self.operate("GET", ["VertexLabel", "vertex1"], cache)], ["vertex1"])
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+    def test_ensured_label_is_written_through_and_listing_invalidated(self):
+        cache = SchemaCache()
+        self.assertEqual(len(list(self.operate("GET", ["VertexLabel", "ALL"], cache))), 3)
+
+        response = self.operate("PUT", ["VertexLabel", "cachedPerson", "properties=name"], cache)
+
+        self.assertEqual(cache.get(GRAPH_NAME, "VertexLabel", "cachedPerson"), [response])
+        self.assertIsNone(cache.get(GRAPH_NAME, "VertexLabel", "ALL"))
+        self.assertIn("cachedPerson", [label.name for label in self.operate("GET", ["VertexLabel", "ALL"], cache)])
+
+
+if __name__ == '__main__':
+    unittest.main()
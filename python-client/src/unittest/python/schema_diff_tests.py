@@ -0,0 +1,96 @@
+import os
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from schema.schema_diff import SchemaDiff, diff_manifest
+from schema.schema_manifest import SchemaManifest
+from schema.schema_snapshot import fetch_schema
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def manifest(*vertex_labels):
+    return SchemaManifest({"graph": GRAPH_NAME, "vertexLabels": list(vertex_labels)})
+
+
+def composite_index(name, *properties):
+    return {"name": name, "properties": list(properties)}
+
+
+class SchemaDiffTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # vertex{i} has vertexProperty{i}..vertexProperty{i+3} and the composite index byVertex{i} on vertexProperty{i}
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=2)
+        cls.server = ReferenceServer(store)
+        cls.channel = grpc.insecure_channel(cls.server.start())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.channel.close()
+        cls.server.stop()
+
+    def reasons(self, schema_diff):
+        return {(operation.kind, operation.label, operation.name): reasons
+                for operation, reasons in schema_diff.changes + schema_diff.conflicts}
+
+    def test_existing_schema_is_unchanged(self):
+        schema_diff = diff_manifest(self.channel, manifest(
+            {"name": "vertex0", "properties": ["vertexProperty0"],
+             "compositeIndexes": [composite_index("byVertex0", "vertexProperty0")]}))
+
+        self.assertEqual(schema_diff.get_operations(), [])
+        self.assertEqual(schema_diff.conflicts, [])
+        self.assertEqual([operation.name for operation in schema_diff.unchanged], ["vertex0", "byVertex0"])
+
+    def test_changes_are_reported(self):
+        schema_diff = diff_manifest(self.channel, manifest(
+            {"name": "vertex0", "properties": ["vertexProperty0", "added"],
+             "compositeIndexes": [composite_index("byAdded", "added")]},
+            {"name": "person"}))
+
+        self.assertEqual(self.reasons(schema_diff), {
+            ("VertexLabel", "vertex0", "vertex0"): ["adds properties ['added']"],
+            ("CompositeIndex", "vertex0", "byAdded"): ["index doesn't exist"],
+            ("VertexLabel", "person", "person"): ["VertexLabel doesn't exist"]})
+        self.assertEqual(schema_diff.conflicts, [])
+
+    def test_composite_index_keys_conflict(self):
+        schema_diff = diff_manifest(self.channel, manifest(
+            {"name": "vertex1", "compositeIndexes": [composite_index("byVertex1", "vertexProperty2")]}))
+
+        self.assertEqual([reasons for _, reasons in schema_diff.conflicts],
+                         [["indexes ['vertexProperty1'] on the server"]])
+        self.assertEqual(schema_diff.get_operations(), [])
+
+    def test_composite_index_on_another_label_conflicts(self):
+        schema_diff = diff_manifest(self.channel, manifest(
+            {"name": "vertex1", "compositeIndexes": [composite_index("byVertex0", "vertexProperty0")]}))
+
+        self.assertEqual([(operation.label, operation.name, reasons) for operation, reasons in schema_diff.conflicts],
+                         [("vertex1", "byVertex0", ["is constrained to vertex0 on the server"])])
+        self.assertIn("CONFLICT", schema_diff.report()[0])
+
+    def test_label_constraint_is_compared_when_known(self):
+        operations = manifest(
+            {"name": "vertex1", "compositeIndexes": [composite_index("byVertex0", "vertexProperty0")]}).get_operations()
+        snapshot = fetch_schema(self.channel, GRAPH_NAME)
+
+        unknown = SchemaDiff(operations, snapshot)
+        unconstrained = SchemaDiff(operations, snapshot, {})
+
+        self.assertEqual(unknown.conflicts, [])
+        self.assertEqual([reasons for _, reasons in unconstrained.conflicts],
+                         [["isn't constrained to a label on the server"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from google.protobuf.wrappers_pb2 import Int64Value
+
+from management import management_pb2
+from schema.schema_fingerprint import fingerprint_snapshot, ADDED, REMOVED, CHANGED
+from schema.schema_snapshot import SchemaSnapshot
+
+
+def vertex_property(name, id_value=None):
+    prop = management_pb2.VertexProperty(name=name, dataType=management_pb2.String)
+    if id_value is not None:
+        prop.id.CopyFrom(Int64Value(value=id_value))
+    return prop
+
+
+def build_snapshot(graph_name, ids=0, reverse_properties=False):
+    """person(name, age) with the composite index byName and the mixed index personMixed, and the edge label knows.
+    ids offsets the ids assigned by the server, reverse_properties the order the label properties are listed in.
+    """
+    snapshot = SchemaSnapshot(graph_name)
+    properties = [vertex_property("age", ids + 1), vertex_property("name", ids + 2)]
+    if reverse_properties:
+        properties.reverse()
+
+    snapshot.vertex_labels["person"] = management_pb2.VertexLabel(name="person", properties=properties,
+                                                                  id=Int64Value(value=ids + 10))
+    snapshot.edge_labels["knows"] = management_pb2.EdgeLabel(name="knows", id=Int64Value(value=ids + 11))
+    snapshot.composite_vertex_indices["byName"] = management_pb2.CompositeVertexIndex(
+        name="byName", properties=[vertex_property("name", ids + 2)], id=Int64Value(value=ids + 12))
+    snapshot.mixed_vertex_indices["person"] = {"personMixed": management_pb2.MixedVertexIndex(
+        name="personMixed", properties=[vertex_property("age", ids + 1)], backend="search")}
+    return snapshot
+
+
+INDEX_LABELS = {("VertexLabel", "byName"): "person"}
+
+
+class SchemaFingerprintTest(unittest.TestCase):
+
+    def test_same_schema_has_the_same_digest(self):
+        fingerprint = fingerprint_snapshot(build_snapshot("graph_a"), INDEX_LABELS)
+        # Other context name, other ids and other label property order
+        other = fingerprint_snapshot(build_snapshot("graph_b", ids=100, reverse_properties=True), INDEX_LABELS)
+
+        self.assertEqual(fingerprint.hexdigest(), other.hexdigest())
+        self.assertEqual(fingerprint.diff(other), [])
+
+    def test_added_removed_and_changed_nodes(self):
+        other_snapshot = build_snapshot("graph_b")
+        other_snapshot.vertex_labels["software"] = management_pb2.VertexLabel(name="software")
+        del other_snapshot.edge_labels["knows"]
+        other_snapshot.vertex_labels["person"].properties.append(vertex_property("email"))
+        other_snapshot.mixed_vertex_indices["person"]["emailMixed"] = management_pb2.MixedVertexIndex(
+            name="emailMixed", properties=[vertex_property("email")], backend="search")
+
+        fingerprint = fingerprint_snapshot(build_snapshot("graph_a"), INDEX_LABELS)
+        other = fingerprint_snapshot(other_snapshot, INDEX_LABELS)
+
+        self.assertEqual(fingerprint.diff(other), [
+            (("EdgeLabel", "knows"), REMOVED),
+            (("VertexLabel", "person"), CHANGED),
+            (("VertexLabel", "person", "emailMixed"), ADDED),
+            (("VertexLabel", "software"), ADDED)])
+        self.assertNotEqual(fingerprint.get(("VertexLabel",)), other.get(("VertexLabel",)))
+        self.assertEqual(fingerprint.get(("CompositeVertexIndex",)), other.get(("CompositeVertexIndex",)))
+
+    def test_composite_index_key_order_and_constraint_are_hashed(self):
+        fingerprint = fingerprint_snapshot(build_snapshot("graph_a"), INDEX_LABELS)
+
+        reordered_snapshot = build_snapshot("graph_b")
+        reordered_snapshot.composite_vertex_indices["byName"].properties.insert(0, vertex_property("age"))
+        reordered = fingerprint_snapshot(reordered_snapshot, INDEX_LABELS)
+        moved = fingerprint_snapshot(build_snapshot("graph_b"), {("VertexLabel", "byName"): "software"})
+        unconstrained = fingerprint_snapshot(build_snapshot("graph_b"), {})
+
+        for other in (reordered, moved, unconstrained):
+            self.assertEqual(fingerprint.diff(other), [(("CompositeVertexIndex", "byName"), CHANGED)])
+
+    def test_hashes_by_depth(self):
+        fingerprint = fingerprint_snapshot(build_snapshot("graph_a"), INDEX_LABELS)
+
+        self.assertEqual(list(fingerprint.get_hashes(0)), [()])
+        self.assertEqual(sorted(fingerprint.get_hashes(1)), [(), ("CompositeEdgeIndex",), ("CompositeVertexIndex",),
+                                                              ("EdgeLabel",), ("VertexLabel",)])
+        self.assertIn(("VertexLabel", "person", "personMixed"), fingerprint.get_hashes(3))
+        self.assertNotIn(("VertexLabel", "person", "personMixed"), fingerprint.get_hashes(2))
+        self.assertEqual(fingerprint.get_hashes(2)[("CompositeVertexIndex", "byName")],
+                         fingerprint.get(("CompositeVertexIndex", "byName")).hexdigest())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import pickle
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from google.protobuf.wrappers_pb2 import Int64Value
+
+from connection.lazy_stub import LazyMessage
+from management import management_pb2
+from schema.schema_info import (to_info, PropertyInfo, VertexLabelInfo, EdgeLabelInfo, CompositeIndexInfo,
+                                MixedIndexInfo)
+
+PERSON = management_pb2.VertexLabel(id=Int64Value(value=7), name="person", partitioned=True, properties=[
+    management_pb2.VertexProperty(id=Int64Value(value=8), name="nicknames", dataType=management_pb2.String,
+                                  cardinality=management_pb2.VertexProperty.Set)])
+
+
+class SchemaInfoTest(unittest.TestCase):
+
+    def test_labels_are_converted_with_enum_names(self):
+        person = to_info(PERSON)
+        since = management_pb2.EdgeProperty(name="since", dataType=management_pb2.Int32)
+        knows = to_info(management_pb2.EdgeLabel(name="knows", multiplicity=management_pb2.EdgeLabel.One2One,
+                                                 properties=[since]))
+
+        self.assertEqual(person, VertexLabelInfo(id=7, name="person", read_only=False, partitioned=True, properties=(
+            PropertyInfo(id=8, name="nicknames", data_type="String", cardinality="Set"),)))
+        self.assertIsInstance(knows, EdgeLabelInfo)
+        self.assertIsNone(knows.id)
+        self.assertEqual(knows.multiplicity, "One2One")
+        # Edge properties have no cardinality
+        self.assertEqual(knows.properties, (PropertyInfo(id=None, name="since", data_type="Int32", cardinality=None),))
+
+    def test_indices_are_converted(self):
+        vertex_index = to_info(management_pb2.CompositeVertexIndex(name="byName", unique=True, properties=[
+            management_pb2.VertexProperty(name="name")]))
+        edge_index = to_info(management_pb2.CompositeEdgeIndex(name="bySince", properties=[
+            management_pb2.EdgeProperty(name="since")]))
+        mixed_index = to_info(management_pb2.MixedEdgeIndex(name="bySinceMixed", backend="search"))
+
+        self.assertIsInstance(vertex_index, CompositeIndexInfo)
+        self.assertEqual((vertex_index.element, vertex_index.unique), ("VertexLabel", True))
+        self.assertEqual((edge_index.element, edge_index.unique), ("EdgeLabel", False))
+        self.assertIsInstance(mixed_index, MixedIndexInfo)
+        self.assertEqual((mixed_index.element, mixed_index.backend), ("EdgeLabel", "search"))
+
+    def test_lazy_message_is_converted_like_the_decoded_one(self):
+        self.assertEqual(to_info(LazyMessage(management_pb2.VertexLabel, PERSON.SerializeToString())), to_info(PERSON))
+
+    def test_message_without_read_model_raises(self):
+        with self.assertRaises(NotImplementedError):
+            to_info(management_pb2.JanusGraphContext(graphName="graph_berkleydb"))
+
+    def test_infos_are_immutable_hashable_and_picklable(self):
+        person = to_info(PERSON)
+
+        with self.assertRaises(AttributeError):
+            person.name = "software"
+        with self.assertRaises(AttributeError):
+            del person.name
+
+        self.assertEqual(len({person, to_info(PERSON)}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(person)), person)
+        self.assertNotEqual(person, to_info(management_pb2.VertexLabel(name="person")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from analysis.schema_linter import SchemaLinter
+from management import management_pb2
+from schema.schema_lookup import SchemaLookup
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def edge_properties(*names):
+    return [management_pb2.EdgeProperty(name=name) for name in names]
+
+
+class SchemaLinterTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        lookup = SchemaLookup(GRAPH_NAME)
+
+        tags = management_pb2.VertexProperty(name="tags", cardinality=management_pb2.VertexProperty.List)
+        blob = management_pb2.VertexProperty(name="blob", dataType=management_pb2.JavaObject)
+        lookup.update(management_pb2.VertexLabel(name="person", properties=[tags, blob]))
+        lookup.update(management_pb2.VertexLabel(name="wide", properties=[
+            management_pb2.VertexProperty(name=f"column{i}") for i in range(3)]))
+        lookup.update(management_pb2.VertexLabel(name="hub"))
+        lookup.update(management_pb2.VertexLabel(name="shard", partitioned=True))
+
+        lookup.update(management_pb2.CompositeVertexIndex(name="byTags", properties=[
+            management_pb2.VertexProperty(name="tags")]))
+        lookup.update(management_pb2.MixedVertexIndex(name="byBlob", properties=[blob], backend="search"), "person")
+
+        # Multi is the default multiplicity
+        lookup.update(management_pb2.EdgeLabel(name="follows", properties=edge_properties("since")))
+        lookup.update(management_pb2.EdgeLabel(name="bought"))
+        lookup.update(management_pb2.EdgeLabel(name="rated", properties=edge_properties("stars")))
+        lookup.update(management_pb2.EdgeLabel(name="knows", properties=edge_properties("weight")))
+        lookup.update(management_pb2.EdgeLabel(name="married", multiplicity=management_pb2.EdgeLabel.One2One,
+                                               properties=edge_properties("date")))
+        lookup.update(management_pb2.CompositeEdgeIndex(name="byStars", properties=edge_properties("stars")))
+        lookup.update(management_pb2.MixedEdgeIndex(name="byWeight", properties=edge_properties("weight"),
+                                                    backend="search"), "knows")
+
+        cls.lookup = lookup
+        cls.index_labels = {("VertexLabel", "byTags"): "person", ("EdgeLabel", "byStars"): "rated"}
+
+    def issues(self, linter):
+        return [(issue.rule, issue.element, issue.name) for issue in linter.lint()]
+
+    def test_every_rule(self):
+        linter = SchemaLinter(self.lookup, self.index_labels, max_properties=2, high_degree_labels=["hub", "shard"])
+
+        self.assertEqual(self.issues(linter), [
+            ("unindexed-multi-edge", "EdgeLabel", "bought"),
+            ("unindexed-multi-edge", "EdgeLabel", "follows"),
+            ("too-many-properties", "VertexLabel", "wide"),
+            ("multi-valued-composite-key", "VertexLabel", "byTags"),
+            ("unpartitioned-high-degree", "VertexLabel", "hub"),
+            ("java-object-index-key", "VertexLabel", "byBlob")])
+
+    def test_multi_edge_index_must_be_constrained_to_it(self):
+        index_labels = dict(self.index_labels)
+        index_labels[("EdgeLabel", "byStars")] = "follows"
+
+        issues = self.issues(SchemaLinter(self.lookup, index_labels, disabled_rules=["multi-valued-composite-key"]))
+        self.assertIn(("unindexed-multi-edge", "EdgeLabel", "rated"), issues)
+        self.assertNotIn(("unindexed-multi-edge", "EdgeLabel", "follows"), issues)
+
+        # Without the constraints, a composite index on the properties of the label counts
+        issues = self.issues(SchemaLinter(self.lookup))
+        self.assertNotIn(("unindexed-multi-edge", "EdgeLabel", "rated"), issues)
+
+    def test_disabled_rules_are_skipped(self):
+        linter = SchemaLinter(self.lookup, self.index_labels, max_properties=2, disabled_rules=SchemaLinter.RULES[1:])
+
+        self.assertEqual({rule for rule, _, _ in self.issues(linter)}, {"unindexed-multi-edge"})
+
+    def test_unknown_rule_raises(self):
+        with self.assertRaisesRegex(LookupError, "no-such-rule"):
+            SchemaLinter(self.lookup, disabled_rules=["no-such-rule"])
+
+    def test_unknown_high_degree_label_raises(self):
+        for name in ("nobody", "follows"):
+            with self.subTest(name=name), self.assertRaisesRegex(LookupError, name):
+                SchemaLinter(self.lookup, high_degree_labels=["hub", name])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from management import management_pb2
+from schema.schema_lookup import SchemaLookup
+from schema.schema_snapshot import SchemaSnapshot
+
+GRAPH_NAME = "graph_berkleydb"
+
+
+def vertex_properties(*names, data_type=management_pb2.String):
+    return [management_pb2.VertexProperty(name=name, dataType=data_type) for name in names]
+
+
+def names(infos):
+    return [info.name for info in infos]
+
+
+class SchemaLookupTest(unittest.TestCase):
+
+    def setUp(self):
+        snapshot = SchemaSnapshot(GRAPH_NAME)
+        snapshot.vertex_labels["person"] = management_pb2.VertexLabel(name="person", properties=vertex_properties(
+            "name", "age"))
+        snapshot.vertex_labels["software"] = management_pb2.VertexLabel(name="software", properties=vertex_properties(
+            "name"))
+        snapshot.edge_labels["created"] = management_pb2.EdgeLabel(name="created", properties=[
+            management_pb2.EdgeProperty(name="name", dataType=management_pb2.String)])
+        snapshot.composite_vertex_indices["byName"] = management_pb2.CompositeVertexIndex(
+            name="byName", properties=vertex_properties("name"))
+        snapshot.mixed_vertex_indices["person"] = {"personMixed": management_pb2.MixedVertexIndex(
+            name="personMixed", properties=vertex_properties("name", "age"), backend="search")}
+        snapshot.mixed_vertex_indices["software"] = {"softwareMixed": management_pb2.MixedVertexIndex(
+            name="softwareMixed", properties=vertex_properties("name"), backend="search")}
+
+        self.lookup = SchemaLookup.from_snapshot(snapshot)
+
+    def test_labels_with_property(self):
+        self.assertEqual(names(self.lookup.get_labels_with_property("name")), ["created", "person", "software"])
+        self.assertEqual(names(self.lookup.get_labels_with_property("name", "VertexLabel")), ["person", "software"])
+        self.assertEqual(self.lookup.get_labels_with_property("missing"), [])
+
+    def test_indices_with_property(self):
+        self.assertEqual(names(self.lookup.get_indices_with_property("name")),
+                         ["byName", "personMixed", "softwareMixed"])
+        self.assertEqual(names(self.lookup.get_indices_with_property("name", kind="MixedIndex")),
+                         ["personMixed", "softwareMixed"])
+        # Mixed indices are constrained to their label, composite ones are always kept
+        self.assertEqual(names(self.lookup.get_indices_with_property("name", label_name="software")),
+                         ["byName", "softwareMixed"])
+
+    def test_replaced_label_updates_the_postings(self):
+        self.lookup.update(management_pb2.VertexLabel(name="person", properties=vertex_properties(
+            "email", data_type=management_pb2.Int64)))
+
+        self.assertEqual(names(self.lookup.get_labels_with_property("age")), [])
+        self.assertEqual(names(self.lookup.get_labels_with_property("email")), ["person"])
+        self.assertEqual(self.lookup.get_properties_of_type("Int64"), ["email"])
+        # age is still declared by personMixed
+        self.assertEqual(self.lookup.get_properties_of_type("String"), ["age", "name"])
+
+    def test_removed_elements_leave_no_postings(self):
+        self.lookup.remove_index("MixedIndex", "VertexLabel", "personMixed", "person")
+        self.lookup.remove_label("VertexLabel", "person")
+
+        self.assertEqual(self.lookup.get_properties_of_type("String"), ["name"])
+        self.assertNotIn("age", self.lookup.property_labels)
+        self.assertNotIn("age", self.lookup.property_indices)
+        self.assertIsNone(self.lookup.get_label("VertexLabel", "person"))
+
+        self.lookup.remove_index("CompositeIndex", "VertexLabel", "byName")
+        self.assertEqual(names(self.lookup.get_indices_with_property("name")), ["softwareMixed"])
+
+    def test_mixed_index_needs_its_label(self):
+        with self.assertRaises(ValueError):
+            self.lookup.update(management_pb2.MixedVertexIndex(name="orphan", properties=vertex_properties("name")))
+
+
+if __name__ == '__main__':
+    unittest.main()
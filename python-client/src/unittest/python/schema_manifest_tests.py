@@ -0,0 +1,139 @@
+import json
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from connection.channel_pool import get_channel_pool
+from management import management_pb2
+from schema.schema_applier import SchemaApplier
+from schema.schema_manifest import SchemaManifest, load_manifest
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+MANIFEST = {
+    "graph": "graph_berkleydb",
+    "vertexLabels": [
+        {"name": "person", "readOnly": False, "partitioned": True,
+         "properties": ["name", {"name": "nicknames", "dataType": "String", "cardinality": "Set"}],
+         "compositeIndexes": [{"name": "byName", "properties": "name", "unique": True}],
+         "mixedIndexes": [{"name": "byNicknames", "properties": ["nicknames"], "backend": "search"}]},
+    ],
+    "edgeLabels": [
+        {"name": "knows", "multiplicity": "Many2One", "directed": True,
+         "properties": [{"name": "since", "dataType": "Int32"}]},
+    ],
+}
+
+MANIFEST_YAML = """
+graph: graph_berkleydb
+vertexLabels:
+  - name: person
+    properties: [name]
+    compositeIndexes:
+      - {name: byName, properties: [name]}
+"""
+
+
+class SchemaManifestTest(unittest.TestCase):
+
+    def operations(self, definition=MANIFEST):
+        return {operation.name: operation for operation in SchemaManifest(definition).get_operations()}
+
+    def test_labels_come_before_indices(self):
+        operations = SchemaManifest(MANIFEST).get_operations()
+
+        self.assertEqual([(operation.kind, operation.name) for operation in operations], [
+            ("VertexLabel", "person"), ("EdgeLabel", "knows"), ("CompositeIndex", "byName"),
+            ("MixedIndex", "byNicknames")])
+        self.assertEqual([operation.rpc for operation in operations], [
+            "EnsureVertexLabel", "EnsureEdgeLabel", "EnsureCompositeIndexByVertexLabel",
+            "EnsureMixedIndexByVertexLabel"])
+        self.assertTrue(all(operation.request.context.graphName == "graph_berkleydb" for operation in operations))
+
+    def test_label_requests(self):
+        operations = self.operations()
+
+        person = operations["person"].request.label
+        self.assertTrue(person.partitioned)
+        self.assertEqual([(prop.name, prop.cardinality) for prop in person.properties],
+                         [("name", management_pb2.VertexProperty.Single),
+                          ("nicknames", management_pb2.VertexProperty.Set)])
+        self.assertEqual(operations["person"].properties, ("name", "nicknames"))
+
+        knows = operations["knows"].request.label
+        self.assertEqual(knows.multiplicity, management_pb2.EdgeLabel.Many2One)
+        self.assertEqual([(prop.name, prop.dataType) for prop in knows.properties], [("since", management_pb2.Int32)])
+
+    def test_index_requests(self):
+        operations = self.operations()
+
+        by_name = operations["byName"]
+        self.assertEqual(by_name.label, "person")
+        self.assertEqual(by_name.request.vertexLabel.name, "person")
+        # A single property key may be given as a string
+        self.assertEqual([prop.name for prop in by_name.request.index.properties], ["name"])
+        self.assertTrue(by_name.request.index.unique)
+
+        self.assertEqual(operations["byNicknames"].request.index.backend, "search")
+
+    def test_invalid_definitions_raise(self):
+        invalid = [
+            ({"vertexLabels": [{"name": "person", "color": "red"}]}, LookupError),
+            ({"vertexLabels": [{"properties": ["name"]}]}, AttributeError),
+            ({"vertexLabels": [{"name": "person", "properties": {"name": "name"}}]}, ValueError),
+            ({"edgeLabels": [{"name": "knows", "properties": [{"name": "since", "cardinality": "List"}]}]},
+             ValueError),
+        ]
+
+        for definition, error in invalid:
+            with self.subTest(definition=definition), self.assertRaises(error):
+                SchemaManifest(definition).get_operations()
+
+    def test_json_and_yaml_manifests_are_loaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "schema.json")
+            yaml_path = os.path.join(directory, "schema.yaml")
+            with open(json_path, "w") as manifest_file:
+                json.dump(MANIFEST, manifest_file)
+            with open(yaml_path, "w") as manifest_file:
+                manifest_file.write(MANIFEST_YAML)
+
+            self.assertEqual(load_manifest(json_path).vertex_labels, SchemaManifest(MANIFEST).vertex_labels)
+            self.assertEqual([operation.name for operation in load_manifest(yaml_path).get_operations()],
+                             ["person", "byName"])
+
+
+class SchemaApplierFailureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SchemaStore()
+        self.server = ReferenceServer(self.store)
+        self.channel = get_channel_pool().get_channel(self.server.start())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_failed_index_does_not_stop_the_other_operations(self):
+        # byName is already used by another index, only its own Ensure fails
+        self.store.populate("graph_berkleydb", vertex_labels=1)
+        manifest = SchemaManifest(dict(MANIFEST, vertexLabels=[dict(MANIFEST["vertexLabels"][0], compositeIndexes=[
+            {"name": "byVertex0", "properties": ["name"]}])]))
+
+        summary = SchemaApplier(self.channel, 2).apply(manifest.get_operations())
+
+        self.assertEqual([operation.name for operation, _ in summary.failures], ["byVertex0"])
+        self.assertEqual(summary.skipped, [])
+        self.assertEqual(dict(summary.applied), {"VertexLabel": 1, "EdgeLabel": 1, "MixedIndex": 1})
+        self.assertEqual(summary.report()[-1], "1 failed, 0 skipped")
+        self.assertIn("already been defined", summary.report()[1])
+
+    def test_max_in_flight_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            SchemaApplier(self.channel, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
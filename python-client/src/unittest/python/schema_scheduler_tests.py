@@ -0,0 +1,108 @@
+import unittest
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from connection.channel_pool import get_channel_pool
+from schema.schema_applier import SchemaApplier
+from schema.schema_manifest import SchemaManifest
+from schema.schema_scheduler import SchemaDag
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+MANIFEST = {
+    "vertexLabels": [
+        {"name": "person", "properties": ["name", "age"],
+         "compositeIndexes": [{"name": "byName", "properties": "name"}],
+         # lang is declared by software only
+         "mixedIndexes": [{"name": "byAgeLang", "properties": ["age", "lang"]}]},
+        {"name": "software", "properties": ["lang"]},
+    ],
+    "edgeLabels": [
+        {"name": "created", "properties": ["weight"],
+         "compositeIndexes": [{"name": "byWeight", "properties": ["weight"]}]},
+    ],
+}
+
+
+def names(dag, layer):
+    return sorted(dag.operations[i].name for i in layer)
+
+
+class SchemaDagTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dag = SchemaDag(SchemaManifest(MANIFEST).get_operations())
+        self.positions = {operation.name: i for i, operation in enumerate(self.dag.operations)}
+
+    def dependencies(self, name):
+        return sorted(self.dag.operations[i].name for i in self.dag.dependencies[self.positions[name]])
+
+    def test_labels_come_before_their_indices(self):
+        layers = self.dag.get_layers()
+
+        self.assertEqual([names(self.dag, layer) for layer in layers],
+                         [["created", "person", "software"], ["byAgeLang", "byName", "byWeight"]])
+
+    def test_index_depends_on_its_label_and_the_labels_declaring_its_properties(self):
+        self.assertEqual(self.dependencies("byName"), ["person"])
+        self.assertEqual(self.dependencies("byAgeLang"), ["person", "software"])
+        self.assertEqual(self.dependencies("byWeight"), ["created"])
+        self.assertEqual(self.dependencies("software"), [])
+
+    def test_single_property_key_is_not_split(self):
+        self.assertEqual(self.dag.operations[self.positions["byName"]].properties, ("name",))
+
+    def test_descendants_of_a_label(self):
+        descendants = self.dag.get_descendants(self.positions["software"])
+        self.assertEqual(sorted(self.dag.operations[i].name for i in descendants), ["byAgeLang"])
+
+    def test_cycle_is_rejected(self):
+        self.dag.dependencies[self.positions["person"]].add(self.positions["byName"])
+        self.dag.dependents[self.positions["byName"]].add(self.positions["person"])
+
+        with self.assertRaises(ValueError):
+            self.dag.get_layers()
+
+
+class SchemaApplierTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SchemaStore()
+        self.server = ReferenceServer(self.store)
+        self.channel = get_channel_pool().get_channel(self.server.start())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def apply(self, max_in_flight):
+        summary = SchemaApplier(self.channel, max_in_flight).apply(SchemaManifest(MANIFEST).get_operations())
+
+        self.assertEqual(summary.failures, [])
+        self.assertEqual(summary.skipped, [])
+        self.assertEqual(dict(summary.applied), {"VertexLabel": 2, "EdgeLabel": 1, "CompositeIndex": 2,
+                                                 "MixedIndex": 1})
+        self.assertEqual(summary.depth, 2)
+        self.assertEqual(sorted(self.store.CONTEXTS["graph_berkleydb"].index_names),
+                         ["byAgeLang", "byName", "byWeight"])
+
+    def test_manifest_is_applied_one_operation_at_a_time(self):
+        # The server rejects an index whose label or property keys don't exist yet
+        self.apply(1)
+
+    def test_manifest_is_applied_concurrently(self):
+        self.apply(32)
+
+    def test_operations_depending_on_a_failed_one_are_skipped(self):
+        manifest = SchemaManifest(dict(MANIFEST, graph="missing"))
+
+        summary = SchemaApplier(self.channel).apply(manifest.get_operations())
+
+        self.assertEqual(sorted(operation.name for operation, _ in summary.failures), ["created", "person", "software"])
+        self.assertEqual(sorted(operation.name for operation, _ in summary.skipped),
+                         ["byAgeLang", "byName", "byWeight"])
+        self.assertEqual(sum(summary.applied.values()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+import grpc
+
+from connection.single_flight import SingleFlight, SingleFlightStub
+from management import management_pb2, management_pb2_grpc
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+CALLERS = 8
+
+
+def context_request(name):
+    return management_pb2.GetContextByGraphNameRequest(name=name)
+
+
+class BlockingRpc:
+
+    def __init__(self, respond):
+        """Stands in for a multi-callable, every call blocks until release() and is counted"""
+        self.respond = respond
+        self.requests = []
+        self.released = threading.Event()
+        self.lock = threading.Lock()
+
+    def __call__(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+        self.released.wait(10)
+        return self.respond(request)
+
+    def release(self):
+        self.released.set()
+
+
+class UnaryRpc(BlockingRpc):
+
+    def future(self, request, **kwargs):
+        raise NotImplementedError
+
+
+class FakeStub:
+
+    def __init__(self, error=None):
+        def context(request):
+            if error is not None:
+                raise error
+            return management_pb2.JanusGraphContext(graphName=request.name)
+
+        self.GetContextByGraphName = UnaryRpc(context)
+        self.GetVertexLabels = BlockingRpc(lambda request: iter([management_pb2.VertexLabel(name="a"),
+                                                                 management_pb2.VertexLabel(name="b")]))
+        self.EnsureVertexLabel = UnaryRpc(lambda request: request.label)
+
+
+class SingleFlightStubTest(unittest.TestCase):
+
+    def concurrently(self, rpc, *calls):
+        """Starts every call, lets them join the flights in progress, then lets the RPCs return
+
+        Returns:
+            list: Return value or exception of each call, in order
+        """
+        outcomes = [None] * len(calls)
+        barrier = threading.Barrier(len(calls) + 1)
+
+        def run(i, call):
+            barrier.wait()
+            try:
+                outcomes[i] = call()
+            except Exception as e:
+                outcomes[i] = e
+
+        threads = [threading.Thread(target=run, args=(i, call)) for i, call in enumerate(calls)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        time.sleep(0.2)
+        rpc.release()
+        for thread in threads:
+            thread.join(10)
+        return outcomes
+
+    def test_identical_gets_share_one_rpc(self):
+        stub = FakeStub()
+        single_flight = SingleFlight()
+        wrapped = SingleFlightStub(stub, single_flight)
+
+        outcomes = self.concurrently(stub.GetContextByGraphName,
+                                     *[lambda: wrapped.GetContextByGraphName(context_request("person"))] * CALLERS)
+
+        self.assertEqual(len(stub.GetContextByGraphName.requests), 1)
+        self.assertEqual([outcome.graphName for outcome in outcomes], ["person"] * CALLERS)
+        self.assertEqual(len(single_flight), 0)
+
+    def test_different_requests_are_not_merged(self):
+        stub = FakeStub()
+        wrapped = SingleFlightStub(stub, SingleFlight())
+
+        outcomes = self.concurrently(stub.GetContextByGraphName,
+                                     lambda: wrapped.GetContextByGraphName(context_request("person")),
+                                     lambda: wrapped.GetContextByGraphName(context_request("person")),
+                                     lambda: wrapped.GetContextByGraphName(context_request("software")))
+
+        self.assertEqual(sorted(request.name for request in stub.GetContextByGraphName.requests),
+                         ["person", "software"])
+        self.assertEqual([outcome.graphName for outcome in outcomes], ["person", "person", "software"])
+
+    def test_stubs_of_different_channels_are_not_merged(self):
+        stub = FakeStub()
+        other = FakeStub()
+        other.GetContextByGraphName = stub.GetContextByGraphName
+        single_flight = SingleFlight()
+
+        self.concurrently(stub.GetContextByGraphName,
+                          lambda: SingleFlightStub(stub, single_flight).GetContextByGraphName(context_request("a")),
+                          lambda: SingleFlightStub(other, single_flight).GetContextByGraphName(context_request("a")))
+
+        self.assertEqual(len(stub.GetContextByGraphName.requests), 2)
+
+    def test_streams_are_buffered_for_every_caller(self):
+        stub = FakeStub()
+        wrapped = SingleFlightStub(stub, SingleFlight())
+        request = management_pb2.GetVertexLabelsRequest(context=management_pb2.JanusGraphContext(graphName=GRAPH_NAME))
+
+        outcomes = self.concurrently(stub.GetVertexLabels, *[lambda: wrapped.GetVertexLabels(request)] * CALLERS)
+
+        self.assertEqual(len(stub.GetVertexLabels.requests), 1)
+        # Each caller drains its own iterator over the buffered responses
+        self.assertEqual([[label.name for label in outcome] for outcome in outcomes], [["a", "b"]] * CALLERS)
+
+    def test_error_is_shared_and_not_cached(self):
+        error = ValueError("unavailable")
+        stub = FakeStub(error)
+        single_flight = SingleFlight()
+        wrapped = SingleFlightStub(stub, single_flight)
+
+        outcomes = self.concurrently(stub.GetContextByGraphName,
+                                     *[lambda: wrapped.GetContextByGraphName(context_request("person"))] * CALLERS)
+
+        self.assertEqual(len(stub.GetContextByGraphName.requests), 1)
+        self.assertTrue(all(outcome is error for outcome in outcomes))
+
+        with self.assertRaises(ValueError):
+            wrapped.GetContextByGraphName(context_request("person"))
+        self.assertEqual(len(stub.GetContextByGraphName.requests), 2)
+
+    def test_ensure_and_calls_with_arguments_go_straight_through(self):
+        stub = FakeStub()
+        stub.EnsureVertexLabel.release()
+        stub.GetContextByGraphName.release()
+        single_flight = SingleFlight()
+        wrapped = SingleFlightStub(stub, single_flight)
+
+        self.assertIs(wrapped.EnsureVertexLabel, stub.EnsureVertexLabel)
+        wrapped.GetContextByGraphName(context_request("person"), timeout=5)
+        wrapped.GetContextByGraphName(context_request("person"), timeout=5)
+
+        self.assertEqual(len(stub.GetContextByGraphName.requests), 2)
+
+
+class ReferenceServerSingleFlightTest(unittest.TestCase):
+
+    def test_responses_match_the_wrapped_stub(self):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=3)
+
+        server = ReferenceServer(store)
+        self.addCleanup(server.stop)
+
+        with grpc.insecure_channel(server.start()) as channel:
+            stub = management_pb2_grpc.ManagementForVertexLabelsStub(channel)
+            wrapped = SingleFlightStub(stub, SingleFlight())
+            request = management_pb2.GetVertexLabelsRequest(
+                context=management_pb2.JanusGraphContext(graphName=GRAPH_NAME))
+            self.assertEqual(list(wrapped.GetVertexLabels(request)), list(stub.GetVertexLabels(request)))
+
+            stub = management_pb2_grpc.AccessContextStub(channel)
+            wrapped = SingleFlightStub(stub, SingleFlight())
+            self.assertEqual(wrapped.GetContextByGraphName(context_request(GRAPH_NAME)),
+                             stub.GetContextByGraphName(context_request(GRAPH_NAME)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "main", "python",
+                                             "janusgraph_grpc_python")))
+
+from cache.schema_cache import SchemaCache
+from connection.channel_pool import get_channel_pool
+from management import management_pb2
+from schema.schema_snapshot import SchemaSnapshot, fetch_schema
+from schema.snapshot_store import SnapshotStore, read_snapshots, write_snapshots
+from server.reference_server import ReferenceServer
+from server.schema_store import SchemaStore
+
+GRAPH_NAME = "graph_berkleydb"
+ATTRIBUTES = ["vertex_labels", "edge_labels", "composite_vertex_indices", "composite_edge_indices",
+              "mixed_vertex_indices", "mixed_edge_indices"]
+
+
+def snapshot(graph_name):
+    schema_snapshot = SchemaSnapshot(graph_name)
+    name = management_pb2.VertexProperty(name="name", dataType=management_pb2.String)
+    schema_snapshot.vertex_labels["person"] = management_pb2.VertexLabel(name="person", properties=[name])
+    schema_snapshot.vertex_labels["software"] = management_pb2.VertexLabel(name="software", readOnly=True)
+    schema_snapshot.edge_labels["knows"] = management_pb2.EdgeLabel(name="knows")
+    schema_snapshot.composite_vertex_indices["byName"] = management_pb2.CompositeVertexIndex(
+        name="byName", properties=[name], unique=True)
+    schema_snapshot.mixed_vertex_indices["person"] = {
+        "byNameMixed": management_pb2.MixedVertexIndex(name="byNameMixed", properties=[name], backend="search")}
+    schema_snapshot.mixed_edge_indices["knows"] = {}
+    return schema_snapshot
+
+
+class SnapshotTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "schema.snapshot")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSnapshotEqual(self, snapshot, other):
+        self.assertEqual(snapshot.graph_name, other.graph_name)
+        for attribute in ATTRIBUTES:
+            self.assertEqual(getattr(snapshot, attribute), getattr(other, attribute), attribute)
+
+
+class SnapshotFileTest(SnapshotTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.snapshots = [snapshot(GRAPH_NAME), snapshot("other")]
+        write_snapshots(self.path, self.snapshots)
+
+    def test_written_snapshots_are_read_back(self):
+        _, snapshots = read_snapshots(self.path)
+
+        self.assertEqual(list(snapshots), [GRAPH_NAME, "other"])
+        for expected in self.snapshots:
+            self.assertSnapshotEqual(snapshots[expected.graph_name], expected)
+
+    def test_loaded_store_warms_the_cache(self):
+        store = SnapshotStore(self.path, None)
+        self.assertTrue(store.load())
+        self.assertLess(store.get_age(), 60)
+        cache = SchemaCache(ttl=None, max_entries=None)
+        store.warm(cache)
+
+        self.assertEqual(cache.get(GRAPH_NAME, "VertexLabel", "software"),
+                         [management_pb2.VertexLabel(name="software", readOnly=True)])
+        self.assertEqual([label.name for label in cache.get("other", "VertexLabel", "ALL")], ["person", "software"])
+        self.assertEqual([label.name for label in cache.get(GRAPH_NAME, "EdgeLabel", "ALL")], ["knows"])
+
+    def test_truncated_or_foreign_file_is_not_loaded(self):
+        with open(self.path, "rb") as snapshot_file:
+            data = snapshot_file.read()
+
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(data[:-3])
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            read_snapshots(self.path)
+        self.assertFalse(SnapshotStore(self.path, None).load())
+
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(b"JGSC" + data[4:])
+        with self.assertRaisesRegex(ValueError, "not a schema snapshot"):
+            read_snapshots(self.path)
+
+    def test_missing_file_is_not_loaded(self):
+        store = SnapshotStore(os.path.join(self.directory.name, "missing.snapshot"), None)
+
+        self.assertFalse(store.load())
+        self.assertIsNone(store.get_age())
+        self.assertIsNone(store.get_snapshot(GRAPH_NAME))
+
+
+class SnapshotRefreshTest(SnapshotTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        store = SchemaStore()
+        store.populate(GRAPH_NAME, vertex_labels=20, edge_labels=5)
+        store.populate("other", vertex_labels=2)
+        cls.server = ReferenceServer(store)
+        cls.target = cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_refreshed_snapshot_is_read_back(self):
+        store = SnapshotStore(self.path, self.target)
+        store.refresh()
+
+        loaded = SnapshotStore(self.path, self.target)
+        self.assertTrue(loaded.load())
+        self.assertEqual(sorted(loaded.snapshots), ["graph_berkleydb", "other"])
+        for graph_name, snapshot in store.snapshots.items():
+            self.assertSnapshotEqual(loaded.get_snapshot(graph_name), snapshot)
+
+        snapshot = loaded.get_snapshot(GRAPH_NAME)
+        self.assertEqual((len(snapshot.vertex_labels), len(snapshot.edge_labels)), (20, 5))
+        self.assertEqual(len(snapshot.mixed_vertex_indices["vertex3"]), 1)
+
+    def test_snapshot_of_selected_contexts_without_mixed_indices(self):
+        store = SnapshotStore(self.path, self.target, ["other"], mixed_indices=False)
+        store.refresh()
+
+        _, snapshots = read_snapshots(self.path)
+        self.assertEqual(list(snapshots), ["other"])
+        self.assertEqual(snapshots["other"].mixed_vertex_indices, {})
+        self.assertEqual(len(snapshots["other"].composite_vertex_indices), 2)
+
+    def test_refresh_after_the_pool_closed_an_idle_channel(self):
+        channel_pool = get_channel_pool()
+        store = SnapshotStore(self.path, self.target, [GRAPH_NAME])
+        store.refresh()
+
+        idle_timeout = channel_pool.idle_timeout
+        channel_pool.idle_timeout = 0
+        try:
+            channel_pool.evict_idle()
+        finally:
+            channel_pool.idle_timeout = idle_timeout
+
+        store.refresh()
+        self.assertEqual(len(store.get_snapshot(GRAPH_NAME).vertex_labels), 20)
+
+    def test_streams_in_flight_do_not_change_the_snapshot(self):
+        channel = get_channel_pool().get_channel(self.target)
+        labels = [("VertexLabel", f"vertex{i}") for i in range(20)] + [("EdgeLabel", f"edge{i}") for i in range(5)]
+
+        self.assertSnapshotEqual(fetch_schema(channel, GRAPH_NAME, labels, max_in_flight=1),
+                                 fetch_schema(channel, GRAPH_NAME, labels))
+
+
+if __name__ == '__main__':
+    unittest.main()